@@ -0,0 +1,86 @@
+''' Measures acknowledgement latency and throughput of `WebhookReceiver`.
+
+    By default the receiver is called in-process (no server involved), so the
+    numbers cover the application only. Given a URL, webhooks are POSTed
+    concurrently to a receiver served by an ASGI server started separately, e.g.:
+
+        uvicorn benchmarks.asgi_receiver:app --no-access-log
+        python benchmarks/asgi_receiver.py 20000 http://127.0.0.1:8000/
+
+    Usage: python benchmarks/asgi_receiver.py [requests] [url] [concurrency]
+'''
+
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+from benchmarks.parse_webhook import sample_body
+from livechat.webhooks import v37
+from livechat.webhooks.asgi import WebhookReceiver
+
+WEBHOOK_BODY = json.dumps(
+    sample_body('incoming_event', v37.IncomingEvent)).encode()
+
+app = WebhookReceiver(['top_secret_value'], version='3.7', max_pending=100000)
+
+
+async def in_process(requests: int) -> list:
+    ''' Returns acknowledgement latencies of requests sent directly to `app`. '''
+    scope = {'type': 'http', 'method': 'POST', 'path': '/'}
+    message = {'type': 'http.request', 'body': WEBHOOK_BODY}
+    latencies = []
+
+    async def receive():
+        return message
+
+    async def send(_):
+        pass
+
+    for _ in range(requests):
+        started = time.perf_counter()
+        await app(scope, receive, send)
+        latencies.append(time.perf_counter() - started)
+    await app.stop()
+    return latencies
+
+
+async def over_http(requests: int, url: str, concurrency: int) -> list:
+    ''' Returns response latencies of requests POSTed to `url`. '''
+    import httpx  # pylint: disable=import-outside-toplevel
+    latencies = []
+    remaining = iter(range(requests))
+
+    async def worker(client):
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.post(url, content=WEBHOOK_BODY)
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+    async with httpx.AsyncClient() as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    return latencies
+
+
+def main(requests: int, url: str = None, concurrency: int = 32) -> None:
+    started = time.perf_counter()
+    latencies = asyncio.run(
+        over_http(requests, url, concurrency) if url else in_process(requests))
+    elapsed = time.perf_counter() - started
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f'requests/s: {requests / elapsed:,.0f}')
+    for name, value in (('p50', percentiles[49]), ('p99', percentiles[98]),
+                        ('max', max(latencies))):
+        print(f'{name}: {value * 1e6:,.1f} us')
+    if not url:
+        print(f'stats: {app.stats()}')
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+        sys.argv[2] if len(sys.argv) > 2 else None,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 32,
+    )
@@ -0,0 +1,75 @@
+''' Compares parsing with version detected by `detect_webhook_version` with
+    trying versions in turn until one of them parses the webhook, for webhooks
+    of every action of any version.
+
+    Trial parsing is as fast as auto-detection for webhooks of the first tried
+    version, but pays for a raised `ValueError` per every other version tried.
+
+    Usage: python benchmarks/detect_webhook_version.py [calls per action]
+'''
+
+import sys
+import time
+from dataclasses import fields
+
+from livechat.webhooks.parser import (compile_webhooks,
+                                      detect_webhook_version, parse_webhook)
+
+PLACEHOLDERS = {dict: {}, list: [], str: 'value', int: 1, bool: True}
+TRIED_VERSIONS = ('3.7', '3.6', '3.5', '3.4')
+
+
+def sample_bodies() -> dict:
+    ''' Returns body of the newest version for each action. '''
+    bodies = {}
+    for version in reversed(TRIED_VERSIONS):
+        for action, data_class in compile_webhooks(version)[1].items():
+            bodies[action] = {
+                'webhook_id': '166c029b-a2c6-4010-aa0c-5a984353a7dd',
+                'secret_key': 'top_secret_value',
+                'action': action,
+                'organization_id': 'f9c7cc55-b35a-4e76-b0d5-ae9fce362314',
+                'additional_data': {},
+                'payload': {
+                    data_field.name: PLACEHOLDERS.get(data_field.type)
+                    for data_field in fields(data_class)
+                }
+            }
+    return bodies
+
+
+def parse_by_trial(wh_body: dict):
+    ''' Parses webhook with subsequent versions until one succeeds. '''
+    for version in TRIED_VERSIONS:
+        try:
+            return parse_webhook(wh_body, version)
+        except ValueError:
+            continue
+    raise ValueError('Webhook does not match any version.')
+
+
+def parse_by_detection(wh_body: dict):
+    ''' Parses webhook with version detected from its body, preferring the same
+        versions in the same order as trial parsing. '''
+    return parse_webhook(wh_body, detect_webhook_version(wh_body, TRIED_VERSIONS))
+
+
+def throughput(parse, body: dict, calls: int) -> float:
+    ''' Returns number of webhooks parsed per second. '''
+    started = time.perf_counter()
+    for _ in range(calls):
+        parse(body)
+    return calls / (time.perf_counter() - started)
+
+
+def main(calls: int) -> None:
+    print(f'{"action":<40}{"version":>8}{"auto/s":>12}{"trial/s":>12}')
+    for action, body in sample_bodies().items():
+        version = parse_by_detection(body).__class__.__name__[-2:]
+        auto = throughput(parse_by_detection, body, calls)
+        trial = throughput(parse_by_trial, body, calls)
+        print(f'{action:<40}{version:>8}{auto:>12,.0f}{trial:>12,.0f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
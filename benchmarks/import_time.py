@@ -0,0 +1,44 @@
+''' Measures cold-start cost of SDK entry points, each in a fresh interpreter.
+
+    Usage: python benchmarks/import_time.py [repeats]
+
+    For a per-module breakdown of a statement run it with `python -X importtime -c ...`
+    (note that versioned modules loaded on demand via `importlib` are not listed there).
+'''
+
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    'import livechat.webhooks.parser',
+    'import livechat.agent',
+    'import livechat.customer',
+    'import livechat.configuration',
+    'import livechat.reports',
+    'from livechat.webhooks.parser import parse_webhook; parse_webhook(' \
+        "{'webhook_id': '', 'secret_key': '', 'action': 'chat_deactivated', 'organization_id': '', " \
+        "'additional_data': {}, 'payload': {'chat_id': '', 'thread_id': ''}})",
+    "from livechat.agent.web.base import AgentWeb; AgentWeb.get_client(access_token='test')",
+    'from livechat.agent.rtm.base import AgentRTM; AgentRTM.get_client()',
+]
+
+
+def cold_start_time(statement: str) -> float:
+    ''' Returns time (in seconds) of executing `statement` in a fresh interpreter,
+        excluding the interpreter startup itself. '''
+    result = subprocess.run([
+        sys.executable, '-c', 'import time; started = time.perf_counter(); '
+        f'{statement}; print(time.perf_counter() - started)'
+    ],
+                            capture_output=True,
+                            text=True,
+                            check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for statement in STATEMENTS:
+        timings = [cold_start_time(statement) for _ in range(repeats)]
+        print(f'{statistics.median(timings) * 1000:8.1f} ms  {statement}')
@@ -0,0 +1,105 @@
+''' Measures `parse_webhook` throughput for every action of webhooks v3.7.
+
+    Bodies contain all fields of the payload data class of each action.
+    The previous implementation (a version => class dict built on every call,
+    payload class looked up through a method of the webhook, data classes
+    without `__slots__`) is measured for comparison, as well as the lazy mode
+    (`lazy=True`, payload not accessed, like in consumers routing on `action`).
+
+    Usage: python benchmarks/parse_webhook.py [calls per action]
+'''
+
+import sys
+import time
+from dataclasses import MISSING, field, fields, make_dataclass
+
+from livechat.webhooks import v37
+from livechat.webhooks.parser import parse_webhook
+
+PLACEHOLDERS = {dict: {}, list: [], str: 'value', int: 1, bool: True}
+
+
+def sample_body(action: str, data_class: type) -> dict:
+    ''' Returns webhook body with all payload fields of `data_class` filled in. '''
+    return {
+        'webhook_id': '166c029b-a2c6-4010-aa0c-5a984353a7dd',
+        'secret_key': 'top_secret_value',
+        'action': action,
+        'organization_id': 'f9c7cc55-b35a-4e76-b0d5-ae9fce362314',
+        'additional_data': {},
+        'payload': {
+            data_field.name: PLACEHOLDERS.get(data_field.type)
+            for data_field in fields(data_class)
+        }
+    }
+
+
+def without_slots(data_class: type, **namespace) -> type:
+    ''' Returns equivalent of `data_class` declared with plain `@dataclass`. '''
+    return make_dataclass(data_class.__name__, [
+        (data_field.name, data_field.type) if data_field.default is MISSING else
+        (data_field.name, data_field.type, field(default=data_field.default))
+        for data_field in fields(data_class)
+    ], namespace=namespace)
+
+
+LEGACY_MAPPING = {
+    action: without_slots(data_class)
+    for action, data_class in v37.action_to_data_class_mapping_v_37.items()
+}
+LegacyWebhook = without_slots(
+    v37.WebhookV37,
+    payload_data_class=lambda self: LEGACY_MAPPING[self.action])
+
+
+def legacy_parse_webhook(wh_body: dict, version: str = '3.7'):
+    ''' Previous implementation of `parse_webhook`. '''
+    webhook_data_class = {
+        '3.4': None,
+        '3.5': None,
+        '3.6': None,
+        '3.7': LegacyWebhook,
+    }.get(version)
+    try:
+        parsed_wh = webhook_data_class(**wh_body)
+    except TypeError as error:
+        raise ValueError(
+            'Invalid webhook body. It should contain the following fields: '
+            f'{webhook_data_class.__annotations__}') from error
+    try:
+        parsed_wh.payload = parsed_wh.payload_data_class()(**parsed_wh.payload)
+    except KeyError as error:
+        raise ValueError(f'`{parsed_wh.action}` is invalid webhook action. '
+                         'Check the correctness of the webhook body provided.') from error
+    except TypeError as error:
+        raise ValueError(
+            'Invalid webhook payload. It should contain the following fields: '
+            f'{parsed_wh.payload_data_class().__annotations__}') from error
+    return parsed_wh
+
+
+def parse_webhook_lazily(wh_body: dict, version: str):
+    ''' Parses webhook without accessing its payload. '''
+    return parse_webhook(wh_body, version, lazy=True)
+
+
+def throughput(parse, body: dict, calls: int) -> float:
+    ''' Returns number of webhooks parsed per second. '''
+    started = time.perf_counter()
+    for _ in range(calls):
+        parse(body, '3.7')
+    return calls / (time.perf_counter() - started)
+
+
+def main(calls: int) -> None:
+    print(f'{"action":<40}{"current/s":>12}{"previous/s":>12}{"lazy/s":>12}')
+    for action, data_class in v37.action_to_data_class_mapping_v_37.items():
+        body = sample_body(action, data_class)
+        current = throughput(parse_webhook, body, calls)
+        previous = throughput(legacy_parse_webhook, body, calls)
+        lazy = throughput(parse_webhook_lazily, body, calls)
+        print(f'{action:<40}{current:>12,.0f}{previous:>12,.0f}{lazy:>12,.0f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,28 @@
+''' Replays recorded webhooks and reports throughput and latency percentiles.
+
+    Recordings are written by `livechat.webhooks.replay.WebhookRecorder`, e.g. by
+    `WebhookReceiver(..., recorder=recorder)`. Webhooks are POSTed to the URL
+    if one is given, otherwise they are parsed with `parse_webhook`.
+
+    Usage: python benchmarks/replay_webhooks.py <recording> [speed|max] [url] [version]
+'''
+
+import functools
+import sys
+
+from livechat.webhooks.parser import parse_webhook
+from livechat.webhooks.replay import WebhookReplayer
+
+
+def main(path: str,
+         speed: str = 'max',
+         url: str = None,
+         version: str = '3.7') -> None:
+    replayer = WebhookReplayer(path, None if speed == 'max' else float(speed))
+    print(
+        replayer.replay(
+            url or functools.partial(parse_webhook, version=version)))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
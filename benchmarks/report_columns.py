@@ -0,0 +1,61 @@
+''' Compares summing a metric of a multi-year hourly distribution looped over
+    the nested report dict with summing its column made by `to_columns`, and
+    memory occupied by both representations.
+
+    Usage: python benchmarks/report_columns.py [years] [backend]
+'''
+
+import sys
+import time
+import tracemalloc
+
+from livechat.reports.columnar import to_columns
+
+
+def hourly_report(years: int) -> dict:
+    ''' Returns `total_chats` report with hourly buckets of given number of years. '''
+    return {
+        'name': 'total_chats',
+        'records': {
+            f'{2000 + hour // 8760}-{hour % 8760:04d}': {
+                'total': hour % 7,
+                'groups': {
+                    '0': {
+                        'total': hour % 3
+                    }
+                }
+            }
+            for hour in range(years * 8760)
+        }
+    }
+
+
+def allocated(build) -> tuple:
+    ''' Returns result of `build` and number of bytes it allocated. '''
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main(years: int, backend: str = None) -> None:
+    report, report_size = allocated(lambda: hourly_report(years))
+    columns, columns_size = allocated(lambda: to_columns(report, backend=backend))
+    started = time.perf_counter()
+    looped = sum(record['groups']['0']['total']
+                 for record in report['records'].values())
+    loop_time = time.perf_counter() - started
+    started = time.perf_counter()
+    summed = columns.sum('groups.0.total')
+    columns_time = time.perf_counter() - started
+    assert looped == summed
+    print(f'{len(columns):,} buckets, {columns.backend} backend')
+    print(f'{"":<10}{"memory":>14}{"sum":>12}')
+    print(f'{"dict":<10}{report_size:>14,}{loop_time * 1000:>10.2f}ms')
+    print(f'{"columns":<10}{columns_size:>14,}{columns_time * 1000:>10.2f}ms')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5,
+         sys.argv[2] if len(sys.argv) > 2 else None)
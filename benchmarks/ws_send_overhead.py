@@ -0,0 +1,91 @@
+''' Measures per-call overhead of `WebsocketClient.send`.
+
+    The socket is replaced with an in-process stand-in answered by a single,
+    long-lived thread (like the `run_forever` loop), so the numbers show the
+    cost of the client itself, without network latency. The previous
+    implementation (a `ThreadPoolExecutor` per call polling the messages list
+    every 0.2s) is measured for comparison.
+
+    Usage: python benchmarks/ws_send_overhead.py [calls]
+'''
+
+import concurrent.futures
+import json
+import queue
+import sys
+import threading
+import time
+from time import sleep
+
+from loguru import logger
+
+from livechat.utils.structures import RtmResponse
+from livechat.utils.ws_client import WebsocketClient, on_message
+
+
+class StandInSocket:
+    ''' Connected socket stand-in answering requests from one responder thread. '''
+    connected = True
+
+    def __init__(self, ws: WebsocketClient):
+        self.ws = ws
+        self.requests = queue.Queue()
+        threading.Thread(target=self._respond, daemon=True).start()
+
+    def send(self, data: str, opcode: int) -> int:
+        self.requests.put(json.loads(data))
+        return len(data)
+
+    def _respond(self):
+        while True:
+            request = self.requests.get()
+            on_message(
+                self.ws,
+                json.dumps({
+                    'request_id': request['request_id'],
+                    'action': request['action'],
+                    'type': 'response',
+                    'success': True,
+                    'payload': {}
+                }))
+
+
+class LegacyWebsocketClient(WebsocketClient):
+    ''' Client with the previous executor-and-polling `send` implementation. '''
+    def send(self, request: dict, opcode=1) -> RtmResponse:
+        request_id = str(id(request))
+        request.update({'request_id': request_id})
+        self.sock.send(json.dumps(request, indent=4), opcode)
+
+        def await_message(stop_event: threading.Event) -> dict:
+            while not stop_event.is_set():
+                for item in self.messages:
+                    if item.get('request_id') == request_id and item.get(
+                            'type') == 'response':
+                        return item
+                sleep(0.2)
+
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            future = executor.submit(await_message, threading.Event())
+            return RtmResponse(future.result(timeout=self.response_timeout))
+
+
+def measure(client_class: type, calls: int) -> float:
+    ''' Returns mean time (in seconds) of a single `send` call. '''
+    ws = client_class(url='wss://localhost/ws')
+    ws.sock = StandInSocket(ws)
+    ws.response_timeout = 3
+    started = time.perf_counter()
+    for _ in range(calls):
+        ws.send({'action': 'get_chat', 'payload': {}})
+    return (time.perf_counter() - started) / calls
+
+
+if __name__ == '__main__':
+    logger.remove()
+    number_of_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    current = measure(WebsocketClient, number_of_calls)
+    legacy = measure(LegacyWebsocketClient, min(number_of_calls, 20))
+    print(f'current send: {current * 1e6:10.1f} us/call '
+          f'({threading.active_count()} threads alive)')
+    print(f'legacy send:  {legacy * 1e6:10.1f} us/call')
@@ -0,0 +1,25 @@
+''' Asyncio Agent RTM client example usage. '''
+
+import asyncio
+
+from livechat.agent.rtm.base import AsyncAgentRTM
+
+
+async def main():
+    agent_rtm = AsyncAgentRTM.get_client()
+    await agent_rtm.open_connection()
+    await agent_rtm.login(token='Bearer dal:A420qcNvdVS4cRMJP269GfgT1LA')
+    response = await agent_rtm.start_chat(continuous=True)
+    chat_id = response.payload.get('chat_id')
+    await agent_rtm.send_event(chat_id=chat_id,
+                               event={
+                                   'type': 'message',
+                                   'text': 'Hello from asyncio Agent RTM!',
+                                   'visibility': 'all'
+                               })
+    await agent_rtm.deactivate_chat(id=chat_id)
+    await agent_rtm.logout()
+    await agent_rtm.close_connection()
+
+
+asyncio.run(main())
@@ -0,0 +1,20 @@
+''' Asyncio Agent Web client example usage. '''
+
+import asyncio
+
+from livechat.agent.web.base import AgentWeb
+
+
+async def main():
+    async with AgentWeb.get_async_client(
+            access_token='Bearer dal:A420qcNvdVS4cRMJP269GfgT1LA') as agent_web:
+        chats = await agent_web.list_chats(limit=10)
+        chat_ids = [chat['id'] for chat in chats.json().get('chats_summary', [])]
+        # Fetch all chats concurrently instead of one after another.
+        responses = await asyncio.gather(
+            *(agent_web.get_chat(chat_id=chat_id) for chat_id in chat_ids))
+        for response in responses:
+            print(response.json())
+
+
+asyncio.run(main())
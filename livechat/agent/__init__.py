@@ -1,3 +1,3 @@
 # pylint: disable=C0114
-from livechat.agent.rtm.base import AgentRTM
+from livechat.agent.rtm.base import AgentRTM, AsyncAgentRTM
 from livechat.agent.web.base import AgentWeb
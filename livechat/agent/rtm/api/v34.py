@@ -2,6 +2,7 @@
 
 from typing import Any, Callable, Optional, Union
 
+from livechat.utils.async_ws_client import AsyncRtmClient
 from livechat.utils.helpers import prepare_payload
 from livechat.utils.structures import AccessToken, RtmResponse
 from livechat.utils.ws_client import WebsocketClient
@@ -11,13 +12,17 @@ from livechat.utils.ws_client import WebsocketClient
 
 class AgentRtmV34:
     ''' Agent RTM API Class containing methods in version 3.4. '''
+    websocket_class = WebsocketClient
+
     def __init__(
         self,
         url: str,
         header: Union[list, dict, Callable, None],
     ):
-        self.ws = WebsocketClient(url=f'wss://{url}/v3.4/agent/rtm/ws',
-                                  header=header)
+        self.ws = self.websocket_class(
+            url=f'wss://{url}/v3.4/agent/rtm/ws',
+            header=header,
+        )
 
     def open_connection(self,
                         origin: dict = None,
@@ -25,7 +30,9 @@ class AgentRtmV34:
                         ping_interval: Union[float, int] = 5,
                         ws_conn_timeout: Union[float, int] = 10,
                         keep_alive: bool = True,
-                        response_timeout: Union[float, int] = 3) -> None:
+                        response_timeout: Union[float, int] = 3,
+                        messages_max_length: Optional[int] = 1000,
+                        messages_max_age: Union[float, int, None] = None) -> None:
         ''' Opens WebSocket connection.
 
             Args:
@@ -39,9 +46,14 @@ class AgentRtmV34:
                 keep_alive(bool): Bool which states if connection should be kept, by default sets to `True`.
                 response_timeout (int or float): timeout (in seconds) to wait for the response,
                     by default sets to 3 seconds.
+                messages_max_length (int): maximum number of unmatched messages (pushes) kept in `ws.messages`,
+                    the oldest ones are dropped first. `None` disables the limit, by default sets to 1000.
+                messages_max_age (int or float): maximum age (in seconds) of messages kept in `ws.messages`,
+                    by default messages are not evicted by age.
         '''
         self.ws.open(origin, ping_timeout, ping_interval, ws_conn_timeout,
-                     keep_alive, response_timeout)
+                     keep_alive, response_timeout, messages_max_length,
+                     messages_max_age)
 
     def close_connection(self) -> None:
         ''' Closes WebSocket connection. '''
@@ -960,3 +972,8 @@ class AgentRtmV34:
             'action': 'list_agents_for_transfer',
             'payload': payload
         })
+
+
+class AsyncAgentRtmV34(AsyncRtmClient, AgentRtmV34):
+    ''' Asyncio Agent RTM API Class containing methods in version 3.4.
+        Methods return awaitables resolving to `RtmResponse`. '''
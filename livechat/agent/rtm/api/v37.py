@@ -2,7 +2,9 @@
 
 from typing import Any, Callable, Optional, Union
 
+from livechat.utils.async_ws_client import AsyncRtmClient
 from livechat.utils.helpers import prepare_payload
+from livechat.utils.pagination import PageIterator
 from livechat.utils.structures import AccessToken, RtmResponse
 from livechat.utils.ws_client import WebsocketClient
 
@@ -11,12 +13,14 @@ from livechat.utils.ws_client import WebsocketClient
 
 class AgentRtmV37:
     ''' Agent RTM API Class containing methods in version 3.7. '''
+    websocket_class = WebsocketClient
+
     def __init__(
         self,
         url: str,
         header: Union[list, dict, Callable, None],
     ):
-        self.ws = WebsocketClient(
+        self.ws = self.websocket_class(
             url=f'wss://{url}/v3.7/agent/rtm/ws',
             header=header,
         )
@@ -27,7 +31,9 @@ class AgentRtmV37:
                         ping_interval: Union[float, int] = 5,
                         ws_conn_timeout: Union[float, int] = 10,
                         keep_alive: bool = True,
-                        response_timeout: Union[float, int] = 3) -> None:
+                        response_timeout: Union[float, int] = 3,
+                        messages_max_length: Optional[int] = 1000,
+                        messages_max_age: Union[float, int, None] = None) -> None:
         ''' Opens WebSocket connection.
 
             Args:
@@ -41,9 +47,14 @@ class AgentRtmV37:
                 keep_alive(bool): Bool which states if connection should be kept, by default sets to `True`.
                 response_timeout (int or float): timeout (in seconds) to wait for the response,
                     by default sets to 3 seconds.
+                messages_max_length (int): maximum number of unmatched messages (pushes) kept in `ws.messages`,
+                    the oldest ones are dropped first. `None` disables the limit, by default sets to 1000.
+                messages_max_age (int or float): maximum age (in seconds) of messages kept in `ws.messages`,
+                    by default messages are not evicted by age.
         '''
         self.ws.open(origin, ping_timeout, ping_interval, ws_conn_timeout,
-                     keep_alive, response_timeout)
+                     keep_alive, response_timeout, messages_max_length,
+                     messages_max_age)
 
     def close_connection(self) -> None:
         ''' Closes WebSocket connection. '''
@@ -1005,3 +1016,100 @@ class AgentRtmV37:
             'action': 'list_agents_for_transfer',
             'payload': payload
         })
+
+# Pagination
+
+    def iter_chats(self,
+                   filters: dict = None,
+                   sort_order: str = None,
+                   limit: int = None,
+                   max_items: int = None,
+                   max_pages: int = None) -> PageIterator:
+        ''' Iterates over summaries of the chats an Agent has access to (see `list_chats`).
+
+            Args:
+                filters (dict): Possible request filters.
+                sort_order (str): Possible values: asc, desc (default).
+                limit (int): Limit of results per page. Default: 10, maximum: 100.
+                max_items (int): Maximum number of chat summaries to yield, by default unlimited.
+                max_pages (int): Maximum number of pages to fetch, by default unlimited.
+
+            Returns:
+                PageIterator: Iterator over chat summaries (asynchronous one for asyncio clients),
+                              fetching the next page while the current one is being consumed.
+        '''
+        return PageIterator(self.list_chats,
+                            'chats_summary',
+                            max_items,
+                            max_pages,
+                            filters=filters,
+                            sort_order=sort_order,
+                            limit=limit)
+
+    def iter_threads(self,
+                     chat_id: str = None,
+                     sort_order: str = None,
+                     limit: int = None,
+                     min_events_count: int = None,
+                     filters: dict = None,
+                     max_items: int = None,
+                     max_pages: int = None) -> PageIterator:
+        ''' Iterates over threads of a given chat the current Agent has access to (see `list_threads`).
+
+            Args:
+                chat_id (str): ID of the chat for which threads are to be listed.
+                sort_order (str): Possible values: asc, desc (default).
+                limit (int): Limit of results per page. Default: 3, maximum: 100.
+                min_events_count (int): Range: 1-100; Specifies the minimum number of events to be returned in the response.
+                filters (dict): Possible request filters.
+                max_items (int): Maximum number of threads to yield, by default unlimited.
+                max_pages (int): Maximum number of pages to fetch, by default unlimited.
+
+            Returns:
+                PageIterator: Iterator over threads (asynchronous one for asyncio clients),
+                              fetching the next page while the current one is being consumed.
+        '''
+        return PageIterator(self.list_threads,
+                            'threads',
+                            max_items,
+                            max_pages,
+                            chat_id=chat_id,
+                            sort_order=sort_order,
+                            limit=limit,
+                            min_events_count=min_events_count,
+                            filters=filters)
+
+    def iter_archives(self,
+                      filters: dict = None,
+                      sort_order: str = None,
+                      limit: int = None,
+                      highlights: dict = None,
+                      max_items: int = None,
+                      max_pages: int = None) -> PageIterator:
+        ''' Iterates over chats from the archive (see `list_archives`).
+
+            Args:
+                filters (dict): Possible request filters.
+                sort_order (str): Possible values: asc, desc (default).
+                limit (int): Limit of results per page. Default: 10, maximum: 100.
+                highlights (dict): Use it to highlight the match of `filters.query`.
+                max_items (int): Maximum number of chats to yield, by default unlimited.
+                max_pages (int): Maximum number of pages to fetch, by default unlimited.
+
+            Returns:
+                PageIterator: Iterator over chats (asynchronous one for asyncio clients),
+                              fetching the next page while the current one is being consumed.
+        '''
+        return PageIterator(self.list_archives,
+                            'chats',
+                            max_items,
+                            max_pages,
+                            filters=filters,
+                            sort_order=sort_order,
+                            limit=limit,
+                            highlights=highlights)
+
+
+class AsyncAgentRtmV37(AsyncRtmClient, AgentRtmV37):
+    ''' Asyncio Agent RTM API Class containing methods in version 3.7.
+        Methods return awaitables resolving to `RtmResponse`. '''
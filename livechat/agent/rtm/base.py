@@ -3,17 +3,23 @@
 # pylint: disable=W0613,W0622,C0103,R0913,R0903,W0107,W0221
 from __future__ import annotations
 
-from typing import Callable, Union
+from typing import TYPE_CHECKING, Callable, Union
 
-from livechat.agent.rtm.api.v34 import AgentRtmV34
-from livechat.agent.rtm.api.v35 import AgentRtmV35
-from livechat.agent.rtm.api.v36 import AgentRtmV36
-from livechat.agent.rtm.api.v37 import AgentRtmV37
 from livechat.config import CONFIG
+from livechat.utils.versions import VersionRegistry
+
+if TYPE_CHECKING:
+    from livechat.agent.rtm.api.v34 import AgentRtmV34, AsyncAgentRtmV34
+    from livechat.agent.rtm.api.v35 import AgentRtmV35, AsyncAgentRtmV35
+    from livechat.agent.rtm.api.v36 import AgentRtmV36, AsyncAgentRtmV36
+    from livechat.agent.rtm.api.v37 import AgentRtmV37, AsyncAgentRtmV37
 
 stable_version = CONFIG.get('stable')
 api_url = CONFIG.get('url')
 
+clients = VersionRegistry('livechat.agent.rtm.api', 'AgentRtm')
+async_clients = VersionRegistry('livechat.agent.rtm.api', 'AsyncAgentRtm')
+
 
 class AgentRTM:
     ''' Main class that gets specific client. '''
@@ -37,12 +43,32 @@ class AgentRTM:
             Raises:
                 ValueError: If the specified version does not exist.
         '''
-        client = {
-            '3.4': AgentRtmV34,
-            '3.5': AgentRtmV35,
-            '3.6': AgentRtmV36,
-            '3.7': AgentRtmV37,
-        }.get(version)
-        if not client:
-            raise ValueError('Provided version does not exist.')
+        client = clients.get(version)
+        return client(base_url, header)
+
+
+class AsyncAgentRTM:
+    ''' Main class that gets specific asyncio client. '''
+    @staticmethod
+    def get_client(
+        version: str = stable_version,
+        base_url: str = api_url,
+        header: Union[list, dict, Callable, None] = None,
+    ) -> Union[AsyncAgentRtmV34, AsyncAgentRtmV35, AsyncAgentRtmV36,
+               AsyncAgentRtmV37]:
+        ''' Returns asyncio client for specific Agent RTM version.
+
+            Args:
+                version (str): API's version. Defaults to the stable version of API.
+                base_url (str): API's base url. Defaults to API's production URL.
+                header (Union[list, dict, Callable, None]): Custom header for websocket handshake.
+                        If the parameter is a callable object, it is called just before the connection attempt.
+
+            Returns:
+                API client object for specified version.
+
+            Raises:
+                ValueError: If the specified version does not exist.
+        '''
+        client = async_clients.get(version)
         return client(base_url, header)
@@ -8,7 +8,7 @@ import typing
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 # pylint: disable=R0903
@@ -1017,3 +1017,8 @@ class AgentWebV34(HttpClient):
         return self.session.post(f'{self.api_url}/list_agents_for_transfer',
                                  json=payload,
                                  headers=headers)
+
+
+class AsyncAgentWebV34(AgentWebV34, AsyncHttpClient):
+    ''' Asyncio Agent Web API Class containing methods in version 3.4.
+        Methods return awaitables resolving to `httpx.Response`. '''
@@ -8,7 +8,7 @@ import typing
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 # pylint: disable=R0903
@@ -1038,3 +1038,8 @@ class AgentWebV35(HttpClient):
         return self.session.post(f'{self.api_url}/get_license_info',
                                  json=payload,
                                  headers=headers)
+
+
+class AsyncAgentWebV35(AgentWebV35, AsyncHttpClient):
+    ''' Asyncio Agent Web API Class containing methods in version 3.5.
+        Methods return awaitables resolving to `httpx.Response`. '''
@@ -8,7 +8,7 @@ import typing
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 # pylint: disable=R0903
@@ -1055,3 +1055,8 @@ class AgentWebV36(HttpClient):
         return self.session.post(f'{self.api_url}/logout',
                                  json=payload,
                                  headers=headers)
+
+
+class AsyncAgentWebV36(AgentWebV36, AsyncHttpClient):
+    ''' Asyncio Agent Web API Class containing methods in version 3.6.
+        Methods return awaitables resolving to `httpx.Response`. '''
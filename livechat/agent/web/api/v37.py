@@ -8,7 +8,8 @@ import typing
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.pagination import PageIterator
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 # pylint: disable=R0903
@@ -1055,3 +1056,115 @@ class AgentWebV37(HttpClient):
         return self.session.post(f'{self.api_url}/logout',
                                  json=payload,
                                  headers=headers)
+
+# Pagination
+
+    def iter_chats(self,
+                   filters: dict = None,
+                   sort_order: str = None,
+                   limit: int = None,
+                   max_items: int = None,
+                   max_pages: int = None,
+                   headers: dict = None) -> PageIterator:
+        ''' Iterates over summaries of the chats an Agent has access to (see `list_chats`).
+
+            Args:
+                filters (dict): Possible request filters.
+                sort_order (str): Possible values: asc, desc (default).
+                limit (int): Limit of results per page. Default: 10, maximum: 100.
+                max_items (int): Maximum number of chat summaries to yield, by default unlimited.
+                max_pages (int): Maximum number of pages to fetch, by default unlimited.
+                headers (dict): Custom headers to be used with session headers.
+                                They will be merged with session-level values that are set,
+                                however, these method-level parameters will not be persisted across requests.
+
+            Returns:
+                PageIterator: Iterator over chat summaries (asynchronous one for asyncio clients),
+                              fetching the next page while the current one is being consumed.
+        '''
+        return PageIterator(self.list_chats,
+                            'chats_summary',
+                            max_items,
+                            max_pages,
+                            filters=filters,
+                            sort_order=sort_order,
+                            limit=limit,
+                            headers=headers)
+
+    def iter_threads(self,
+                     chat_id: str = None,
+                     sort_order: str = None,
+                     limit: int = None,
+                     min_events_count: int = None,
+                     filters: dict = None,
+                     max_items: int = None,
+                     max_pages: int = None,
+                     headers: dict = None) -> PageIterator:
+        ''' Iterates over threads of a given chat the current Agent has access to (see `list_threads`).
+
+            Args:
+                chat_id (str): ID of the chat for which threads are to be listed.
+                sort_order (str): Possible values: asc, desc (default).
+                limit (int): Limit of results per page. Default: 3, maximum: 100.
+                min_events_count (int): Range: 1-100; Specifies the minimum number of events to be returned in the response.
+                filters (dict): Possible request filters.
+                max_items (int): Maximum number of threads to yield, by default unlimited.
+                max_pages (int): Maximum number of pages to fetch, by default unlimited.
+                headers (dict): Custom headers to be used with session headers.
+                                They will be merged with session-level values that are set,
+                                however, these method-level parameters will not be persisted across requests.
+
+            Returns:
+                PageIterator: Iterator over threads (asynchronous one for asyncio clients),
+                              fetching the next page while the current one is being consumed.
+        '''
+        return PageIterator(self.list_threads,
+                            'threads',
+                            max_items,
+                            max_pages,
+                            chat_id=chat_id,
+                            sort_order=sort_order,
+                            limit=limit,
+                            min_events_count=min_events_count,
+                            filters=filters,
+                            headers=headers)
+
+    def iter_archives(self,
+                      filters: dict = None,
+                      sort_order: str = None,
+                      limit: int = None,
+                      highlights: dict = None,
+                      max_items: int = None,
+                      max_pages: int = None,
+                      headers: dict = None) -> PageIterator:
+        ''' Iterates over chats from the archive (see `list_archives`).
+
+            Args:
+                filters (dict): Possible request filters.
+                sort_order (str): Possible values: asc, desc (default).
+                limit (int): Limit of results per page. Default: 10, maximum: 100.
+                highlights (dict): Use it to highlight the match of `filters.query`.
+                max_items (int): Maximum number of chats to yield, by default unlimited.
+                max_pages (int): Maximum number of pages to fetch, by default unlimited.
+                headers (dict): Custom headers to be used with session headers.
+                                They will be merged with session-level values that are set,
+                                however, these method-level parameters will not be persisted across requests.
+
+            Returns:
+                PageIterator: Iterator over chats (asynchronous one for asyncio clients),
+                              fetching the next page while the current one is being consumed.
+        '''
+        return PageIterator(self.list_archives,
+                            'chats',
+                            max_items,
+                            max_pages,
+                            filters=filters,
+                            sort_order=sort_order,
+                            limit=limit,
+                            highlights=highlights,
+                            headers=headers)
+
+
+class AsyncAgentWebV37(AgentWebV37, AsyncHttpClient):
+    ''' Asyncio Agent Web API Class containing methods in version 3.7.
+        Methods return awaitables resolving to `httpx.Response`. '''
@@ -3,20 +3,24 @@
 # pylint: disable=W0613,R0913,W0622,C0103,W0221
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-import httpx
-
-from livechat.agent.web.api.v34 import AgentWebV34
-from livechat.agent.web.api.v35 import AgentWebV35
-from livechat.agent.web.api.v36 import AgentWebV36
-from livechat.agent.web.api.v37 import AgentWebV37
 from livechat.config import CONFIG
 from livechat.utils.structures import AccessToken
+from livechat.utils.versions import VersionRegistry
+
+if TYPE_CHECKING:
+    from livechat.agent.web.api.v34 import AgentWebV34, AsyncAgentWebV34
+    from livechat.agent.web.api.v35 import AgentWebV35, AsyncAgentWebV35
+    from livechat.agent.web.api.v36 import AgentWebV36, AsyncAgentWebV36
+    from livechat.agent.web.api.v37 import AgentWebV37, AsyncAgentWebV37
 
 stable_version = CONFIG.get('stable')
 api_url = CONFIG.get('url')
 
+clients = VersionRegistry('livechat.agent.web.api', 'AgentWeb')
+async_clients = VersionRegistry('livechat.agent.web.api', 'AsyncAgentWeb')
+
 
 class AgentWeb:
     ''' Allows retrieval of client for specific Agent Web
@@ -30,7 +34,7 @@ class AgentWeb:
         proxies: dict = None,
         verify: bool = True,
         disable_logging: bool = False,
-        timeout: float = httpx.Timeout(15)
+        timeout: float = 15
     ) -> Union[AgentWebV34, AgentWebV35, AgentWebV36, AgentWebV37]:
         ''' Returns client for specific API version.
 
@@ -56,20 +60,46 @@ class AgentWeb:
             Raises:
                 ValueError: If the specified version does not exist.
         '''
-        client = {
-            '3.4':
-            AgentWebV34(access_token, base_url, http2, proxies, verify,
-                        disable_logging, timeout),
-            '3.5':
-            AgentWebV35(access_token, base_url, http2, proxies, verify,
-                        disable_logging, timeout),
-            '3.6':
-            AgentWebV36(access_token, base_url, http2, proxies, verify,
-                        disable_logging, timeout),
-            '3.7':
-            AgentWebV37(access_token, base_url, http2, proxies, verify,
-                        disable_logging, timeout),
-        }.get(version)
-        if not client:
-            raise ValueError('Provided version does not exist.')
-        return client
+        client = clients.get(version)
+        return client(access_token, base_url, http2, proxies, verify,
+                      disable_logging, timeout)
+
+    @staticmethod
+    def get_async_client(
+        access_token: Union[AccessToken, str],
+        version: str = stable_version,
+        base_url: str = api_url,
+        http2: bool = False,
+        proxies: dict = None,
+        verify: bool = True,
+        disable_logging: bool = False,
+        timeout: float = 15
+    ) -> Union[AsyncAgentWebV34, AsyncAgentWebV35, AsyncAgentWebV36,
+               AsyncAgentWebV37]:
+        ''' Returns asyncio client for specific API version.
+
+            Args:
+                token (str): Full token with type (Bearer/Basic) that will be
+                                used as `Authorization` header in requests to API.
+                version (str): API's version. Defaults to the stable version of API.
+                base_url (str): API's base url. Defaults to API's production URL.
+                http2 (bool): A boolean indicating if HTTP/2 support should be
+                              enabled. Defaults to `False`.
+                proxies (dict): A dictionary mapping proxy keys to proxy URLs.
+                verify (bool): SSL certificates (a.k.a CA bundle) used to
+                               verify the identity of requested hosts. Either `True` (default CA bundle),
+                               a path to an SSL certificate file, an `ssl.SSLContext`, or `False`
+                               (which will disable verification). Defaults to `True`.
+                disable_logging (bool): indicates if logging should be disabled.
+                timeout (float): The timeout configuration to use when sending requests.
+                                 Defaults to 15 seconds.
+
+            Returns:
+                API client object for specified version.
+
+            Raises:
+                ValueError: If the specified version does not exist.
+        '''
+        client = async_clients.get(version)
+        return client(access_token, base_url, http2, proxies, verify,
+                      disable_logging, timeout)
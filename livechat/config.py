@@ -4,4 +4,5 @@ CONFIG = {
     'url': 'api.livechatinc.com',
     'stable': '3.6',
     'dev': '3.7',
+    'versions': ('3.4', '3.5', '3.6', '3.7'),
 }
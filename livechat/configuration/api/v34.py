@@ -5,7 +5,7 @@ from typing import Union
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 
@@ -1208,3 +1208,8 @@ class ConfigurationApiV34(HttpClient):
         return self.session.get(f'{self.api_url}/get_organization_id',
                                 params=params,
                                 headers=headers)
+
+
+class AsyncConfigurationApiV34(ConfigurationApiV34, AsyncHttpClient):
+    ''' Asyncio Configuration API client class in version 3.4.
+        Methods return awaitables resolving to `httpx.Response`. '''
@@ -5,7 +5,7 @@ from typing import List, Union
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 
@@ -1724,3 +1724,8 @@ class ConfigurationApiV35(HttpClient):
         return self.session.post(f'{self.api_url}/batch_update_bots',
                                  json=payload,
                                  headers=headers)
+
+
+class AsyncConfigurationApiV35(ConfigurationApiV35, AsyncHttpClient):
+    ''' Asyncio Configuration API client class in version 3.5.
+        Methods return awaitables resolving to `httpx.Response`. '''
@@ -5,7 +5,7 @@ from typing import List, Union
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 # pylint: disable=unused-argument,too-many-arguments,redefined-builtin,invalid-name
@@ -2029,3 +2029,8 @@ class ConfigurationApiV36(HttpClient):
         return self.session.post(f'{self.api_url}/update_greeting',
                                  json=payload,
                                  headers=headers)
+
+
+class AsyncConfigurationApiV36(ConfigurationApiV36, AsyncHttpClient):
+    ''' Asyncio Configuration API client class in version 3.6.
+        Methods return awaitables resolving to `httpx.Response`. '''
@@ -5,7 +5,8 @@ from typing import List, Union
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
+from livechat.utils.pagination import PageIterator
 from livechat.utils.structures import AccessToken
 
 # pylint: disable=unused-argument,too-many-arguments,redefined-builtin,invalid-name
@@ -2150,3 +2151,71 @@ class ConfigurationApiV37(HttpClient):
         return self.session.post(f'{self.api_url}/delete_canned_response',
                                  json=payload,
                                  headers=headers)
+
+# Pagination
+
+    def iter_greetings(self,
+                       groups: list = None,
+                       limit: int = None,
+                       max_items: int = None,
+                       max_pages: int = None,
+                       headers: dict = None) -> PageIterator:
+        ''' Iterates over greetings, optionally filtered by groups (see `list_greetings`).
+
+            Args:
+                groups (list): Array of group IDs to filter greetings.
+                limit (int): Number of greetings per page. Must be between 1 and 100. Defaults to 100.
+                max_items (int): Maximum number of greetings to yield, by default unlimited.
+                max_pages (int): Maximum number of pages to fetch, by default unlimited.
+                headers (dict): Custom headers to be used with session headers.
+                                They will be merged with session-level values that are set,
+                                however, these method-level parameters will not be persisted across requests.
+
+            Returns:
+                PageIterator: Iterator over greetings (asynchronous one for asyncio clients),
+                              fetching the next page while the current one is being consumed.
+        '''
+        return PageIterator(self.list_greetings,
+                            'greetings',
+                            max_items,
+                            max_pages,
+                            groups=groups,
+                            limit=limit,
+                            headers=headers)
+
+    def iter_canned_responses(self,
+                              group_ids: List[int] = None,
+                              include_private: bool = None,
+                              limit: int = None,
+                              max_items: int = None,
+                              max_pages: int = None,
+                              headers: dict = None) -> PageIterator:
+        ''' Iterates over canned responses (see `list_canned_responses`).
+
+            Args:
+                group_ids (List[int]): Filter by specific group IDs (if not provided, uses user's accessible groups).
+                include_private (bool): Include private canned responses (default: `false`).
+                limit (int): Number of results per page (1-100, default: 100).
+                max_items (int): Maximum number of canned responses to yield, by default unlimited.
+                max_pages (int): Maximum number of pages to fetch, by default unlimited.
+                headers (dict): Custom headers to be used with session headers.
+                                They will be merged with session-level values that are set,
+                                however, these method-level parameters will not be persisted across requests.
+
+            Returns:
+                PageIterator: Iterator over canned responses (asynchronous one for asyncio clients),
+                              fetching the next page while the current one is being consumed.
+        '''
+        return PageIterator(self.list_canned_responses,
+                            'canned_responses',
+                            max_items,
+                            max_pages,
+                            group_ids=group_ids,
+                            include_private=include_private,
+                            limit=limit,
+                            headers=headers)
+
+
+class AsyncConfigurationApiV37(ConfigurationApiV37, AsyncHttpClient):
+    ''' Asyncio Configuration API client class in version 3.7.
+        Methods return awaitables resolving to `httpx.Response`. '''
@@ -0,0 +1,260 @@
+''' Batching of Configuration API mutations. '''
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+from livechat.utils.helpers import prepare_payload
+from livechat.utils.http_client import AsyncHttpClient
+
+# single method => its batch counterpart
+BATCH_METHODS: Dict[str, str] = {
+    'create_agent': 'batch_create_agents',
+    'update_agent': 'batch_update_agents',
+    'delete_agent': 'batch_delete_agents',
+    'approve_agent': 'batch_approve_agents',
+    'suspend_agent': 'batch_suspend_agents',
+    'unsuspend_agent': 'batch_unsuspend_agents',
+    'create_bot': 'batch_create_bots',
+    'update_bot': 'batch_update_bots',
+    'delete_bot': 'batch_delete_bots',
+}
+
+# maximum number of requests in a single batch accepted by the API
+MAX_BATCH_SIZE = 20
+
+
+class BatchItemError(Exception):
+    ''' Error returned by the API for a single request of a batch. '''
+    def __init__(self, method: str, request: dict, error: Any):
+        super().__init__(f'`{method}` failed: {error}')
+        self.method = method
+        self.request = request
+        self.error = error
+
+
+class ConfigurationBatcher:
+    ''' Collects single Configuration API mutations (methods listed in
+        `BATCH_METHODS`) and sends them as batch requests, split into chunks
+        of at most `max_batch_size` requests.
+
+        Each call returns a future (`concurrent.futures.Future`, or
+        `asyncio.Future` for asyncio clients) resolving to the item of batch
+        response corresponding to the call, or failing with `BatchItemError`
+        (error returned for the item) or with the exception of the whole batch
+        request (e.g. `httpx.HTTPStatusError`).
+
+        All collected calls are sent when the context block is left, when `flush`
+        is called, when `max_batch_size` calls of the same method are collected
+        or, if `window` is set, that many seconds after the first collected call.
+        Batches of different methods are sent one by one, in order of their
+        first calls, so calls depending on calls of other methods (e.g. updating
+        a bot created in the same block) should be separated with `flush`.
+
+        Example:
+            with ConfigurationBatcher(client) as batch:
+                futures = [batch.create_agent(id=email, name=name)
+                           for email, name in agents]
+            created = [future.result() for future in futures]
+
+            async with ConfigurationBatcher(async_client) as batch:
+                future = batch.create_bot(name='Bot')
+                ...
+            bot = await future
+    '''
+    def __init__(self,
+                 client: Any,
+                 max_batch_size: int = MAX_BATCH_SIZE,
+                 window: Optional[float] = None,
+                 headers: dict = None):
+        ''' Args:
+                client: Configuration API client (v3.7 or later), synchronous or asyncio.
+                max_batch_size (int): Maximum number of requests in a batch.
+                window (float): Time (in seconds) after which collected calls
+                                are sent automatically; by default they are
+                                collected until flushed.
+                headers (dict): Custom headers used with all batch requests.
+        '''
+        if max_batch_size < 1:
+            raise ValueError('`max_batch_size` has to be a positive number.')
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.headers = headers
+        self.is_async = isinstance(client, AsyncHttpClient)
+        self._pending: Dict[str, List[Tuple[dict, Future]]] = {}
+        self._lock = threading.Lock()
+        self._timer = None
+        self._send_lock = threading.Lock()
+        self._async_send_lock = None
+        self._tasks = set()
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in BATCH_METHODS:
+            raise AttributeError(
+                f'`{name}` cannot be batched. Batched methods: '
+                f'{", ".join(BATCH_METHODS)}.')
+
+        def collect(payload: dict = None, **params) -> Any:
+            return self.submit(name, payload, **params)
+
+        collect.__name__ = name
+        collect.__doc__ = getattr(self.client, name).__doc__
+        return collect
+
+    def submit(self, method: str, payload: dict = None, **params) -> Any:
+        ''' Collects a call of a single method.
+
+            Args:
+                method (str): Name of the method, e.g. `create_agent`.
+                payload (dict): Custom request's data; it overrides `params`.
+                params: Parameters of the method (except for `headers`).
+
+            Returns:
+                Future: Resolving to the item of batch response for this call
+                        (`asyncio.Future` for asyncio clients).
+
+            Raises:
+                ValueError: If the method has no batch counterpart.
+                TypeError: If the method does not accept given parameters.
+        '''
+        if method not in BATCH_METHODS:
+            raise ValueError(f'`{method}` cannot be batched.')
+        if 'headers' in params:
+            raise TypeError(
+                'Headers of batched calls have to be set for the batcher.')
+        inspect.signature(getattr(self.client, method)).bind(**params)
+        request = payload if payload is not None else prepare_payload(params)
+        future = asyncio.get_running_loop().create_future(
+        ) if self.is_async else Future()
+        with self._lock:
+            calls = self._pending.setdefault(method, [])
+            calls.append((request, future))
+            is_full = len(calls) >= self.max_batch_size
+            if not is_full and self.window is not None and self._timer is None:
+                self._start_timer()
+        if is_full:
+            # all collected calls, so that batches keep the order of first calls
+            if self.is_async:
+                self._track(self._send_pending())
+            else:
+                self.flush()
+        return future
+
+    def flush(self) -> Any:
+        ''' Sends all collected calls (returns awaitable for asyncio clients).
+            Exceptions of batch requests are set on futures of their calls. '''
+        if self.is_async:
+            return self._aflush()
+        with self._send_lock:
+            for method, calls in self._take_chunks():
+                self._send(method, calls)
+        return None
+
+    def __enter__(self) -> ConfigurationBatcher:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+    async def __aenter__(self) -> ConfigurationBatcher:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.flush()
+
+    async def _aflush(self) -> None:
+        await self._send_pending()
+        # batches sent when full or after `window`
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def _send_pending(self) -> None:
+        ''' Sends collected calls of asyncio client, after batches sent earlier. '''
+        if self._async_send_lock is None:
+            self._async_send_lock = asyncio.Lock()
+        async with self._async_send_lock:
+            for method, calls in self._take_chunks():
+                sent = self._send(method, calls)
+                if sent is not None:
+                    await sent
+
+    def _take_chunks(self) -> List[Tuple[str, list]]:
+        ''' Returns collected calls as (method, calls) chunks of at most
+            `max_batch_size` calls, in order of methods' first calls. '''
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._cancel_timer()
+        return [(method, calls[start:start + self.max_batch_size])
+                for method, calls in pending.items()
+                for start in range(0, len(calls), self.max_batch_size)]
+
+    def _send(self, method: str, calls: List[Tuple[dict, Future]]) -> Any:
+        ''' Sends batch of calls of a method and resolves their futures. '''
+        batch_method = getattr(self.client, BATCH_METHODS[method])
+        requests = [request for request, _ in calls]
+        try:
+            response = batch_method(requests=requests, headers=self.headers)
+        except Exception as error:  # pylint: disable=broad-except
+            return self._fail(calls, error)
+        if self.is_async:
+            return self._asend(method, calls, response)
+        return self._resolve(method, calls, response)
+
+    async def _asend(self, method: str, calls: List[Tuple[dict, Future]],
+                     response: Any) -> None:
+        try:
+            response = await response
+        except Exception as error:  # pylint: disable=broad-except
+            self._fail(calls, error)
+            return
+        self._resolve(method, calls, response)
+
+    def _resolve(self, method: str, calls: List[Tuple[dict, Future]],
+                 response: Any) -> None:
+        try:
+            items = response.raise_for_status().json().get('responses')
+            if not isinstance(items, list) or len(items) != len(calls):
+                raise ValueError(
+                    f'Unexpected response of `{BATCH_METHODS[method]}`.')
+        except Exception as error:  # pylint: disable=broad-except
+            self._fail(calls, error)
+            return
+        for (request, future), item in zip(calls, items):
+            if isinstance(item, dict) and 'error' in item:
+                if not future.done():
+                    future.set_exception(
+                        BatchItemError(method, request, item['error']))
+            elif not future.done():
+                future.set_result(item)
+
+    @staticmethod
+    def _fail(calls: List[Tuple[dict, Future]], error: Exception) -> None:
+        for _, future in calls:
+            if not future.done():
+                future.set_exception(error)
+
+    def _start_timer(self) -> None:
+        if self.is_async:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(
+                self.window, lambda: self._track(self._send_pending()))
+        else:
+            self._timer = threading.Timer(self.window, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _track(self, coroutine: Any) -> None:
+        ''' Runs coroutine as a task awaited by `flush`. '''
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
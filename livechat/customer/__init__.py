@@ -1,3 +1,3 @@
 #pylint: disable=C0114
-from livechat.customer.rtm.base import CustomerRTM
+from livechat.customer.rtm.base import AsyncCustomerRTM, CustomerRTM
 from livechat.customer.web.base import CustomerWeb
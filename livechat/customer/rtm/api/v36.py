@@ -4,6 +4,7 @@
 
 from typing import Callable, Optional, Union
 
+from livechat.utils.async_ws_client import AsyncRtmClient
 from livechat.utils.helpers import prepare_payload
 from livechat.utils.structures import AccessToken, RtmResponse
 from livechat.utils.ws_client import WebsocketClient
@@ -11,6 +12,8 @@ from livechat.utils.ws_client import WebsocketClient
 
 class CustomerRtmV36:
     ''' Customer RTM API client class in version 3.6. '''
+    websocket_class = WebsocketClient
+
     def __init__(
         self,
         organization_id: str,
@@ -18,7 +21,7 @@ class CustomerRtmV36:
         header: Union[list, dict, Callable, None],
     ):
         if isinstance(organization_id, str):
-            self.ws = WebsocketClient(
+            self.ws = self.websocket_class(
                 url=
                 f'wss://{base_url}/v3.6/customer/rtm/ws?organization_id={organization_id}',
                 header=header)
@@ -33,7 +36,9 @@ class CustomerRtmV36:
                         ping_interval: Union[float, int] = 5,
                         ws_conn_timeout: Union[float, int] = 10,
                         keep_alive: bool = True,
-                        response_timeout: Union[float, int] = 3) -> None:
+                        response_timeout: Union[float, int] = 3,
+                        messages_max_length: Optional[int] = 1000,
+                        messages_max_age: Union[float, int, None] = None) -> None:
         ''' Opens WebSocket connection.
 
             Args:
@@ -47,9 +52,14 @@ class CustomerRtmV36:
                 keep_alive(bool): Bool which states if connection should be kept, by default sets to `True`.
                 response_timeout (int or float): timeout (in seconds) to wait for the response,
                     by default sets to 3 seconds.
+                messages_max_length (int): maximum number of unmatched messages (pushes) kept in `ws.messages`,
+                    the oldest ones are dropped first. `None` disables the limit, by default sets to 1000.
+                messages_max_age (int or float): maximum age (in seconds) of messages kept in `ws.messages`,
+                    by default messages are not evicted by age.
         '''
         self.ws.open(origin, ping_timeout, ping_interval, ws_conn_timeout,
-                     keep_alive, response_timeout)
+                     keep_alive, response_timeout, messages_max_length,
+                     messages_max_age)
 
     def close_connection(self) -> None:
         ''' Closes WebSocket connection. '''
@@ -738,3 +748,8 @@ class CustomerRtmV36:
         if payload is None:
             payload = prepare_payload(locals())
         return self.ws.send({'action': 'cancel_greeting', 'payload': payload})
+
+
+class AsyncCustomerRtmV36(AsyncRtmClient, CustomerRtmV36):
+    ''' Asyncio Customer RTM API Class containing methods in version 3.6.
+        Methods return awaitables resolving to `RtmResponse`. '''
@@ -6,7 +6,7 @@ import typing
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 
@@ -964,3 +964,8 @@ class CustomerWebV34(HttpClient):
             f'{self.api_url}/request_email_verification{self.query_string}',
             json=payload,
             headers=headers)
+
+
+class AsyncCustomerWebV34(CustomerWebV34, AsyncHttpClient):
+    ''' Asyncio Customer Web API Class containing methods in version 3.4.
+        Methods return awaitables resolving to `httpx.Response`. '''
@@ -6,7 +6,7 @@ import typing
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 
@@ -1019,3 +1019,8 @@ class CustomerWebV36(HttpClient):
             f'{self.api_url}/request_email_verification{self.query_string}',
             json=payload,
             headers=headers)
+
+
+class AsyncCustomerWebV36(CustomerWebV36, AsyncHttpClient):
+    ''' Asyncio Customer Web API Class containing methods in version 3.6.
+        Methods return awaitables resolving to `httpx.Response`. '''
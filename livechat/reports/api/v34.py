@@ -5,7 +5,7 @@ from typing import Union
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 
@@ -384,3 +384,8 @@ class ReportsApiV34(HttpClient):
         return self.session.post(f'{self.api_url}/agents/performance',
                                  json=payload,
                                  headers=headers)
+
+
+class AsyncReportsApiV34(ReportsApiV34, AsyncHttpClient):
+    ''' Asyncio Reports API client class in version 3.4.
+        Methods return awaitables resolving to `httpx.Response`. '''
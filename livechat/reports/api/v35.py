@@ -5,7 +5,7 @@ from typing import Union
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 # pylint: disable=unused-argument,too-many-arguments
@@ -418,3 +418,8 @@ class ReportsApiV35(HttpClient):
         return self.session.post(f'{self.api_url}/tags/chat_usage',
                                  json=payload,
                                  headers=headers)
+
+
+class AsyncReportsApiV35(ReportsApiV35, AsyncHttpClient):
+    ''' Asyncio Reports API client class in version 3.5.
+        Methods return awaitables resolving to `httpx.Response`. '''
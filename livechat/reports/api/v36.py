@@ -5,7 +5,7 @@ from typing import Union
 import httpx
 
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 # pylint: disable=unused-argument,too-many-arguments
@@ -540,3 +540,8 @@ class ReportsApiV36(HttpClient):
         return self.session.post(f'{self.api_url}/customers/unique_visitors',
                                  json=payload,
                                  headers=headers)
+
+
+class AsyncReportsApiV36(ReportsApiV36, AsyncHttpClient):
+    ''' Asyncio Reports API client class in version 3.6.
+        Methods return awaitables resolving to `httpx.Response`. '''
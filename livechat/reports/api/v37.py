@@ -1,15 +1,26 @@
 ''' Reports API module with client class in version 3.7. '''
 
-from typing import Union
+import functools
+from typing import Awaitable, Iterable, Union
 
 import httpx
 
+from livechat.reports.sharding import merge_reports, split_range
+from livechat.utils.bulk import (BulkResult, acall_concurrently,
+                                 call_concurrently)
 from livechat.utils.helpers import prepare_payload
-from livechat.utils.http_client import HttpClient
+from livechat.utils.http_client import AsyncHttpClient, HttpClient
 from livechat.utils.structures import AccessToken
 
 # pylint: disable=unused-argument,too-many-arguments
 
+# names of report methods accepted by `fetch_reports`
+REPORTS = frozenset((
+    'duration', 'tags', 'total_chats', 'ratings', 'ranking', 'engagement',
+    'greetings_conversion', 'forms', 'response_time', 'first_response_time',
+    'groups', 'queued_visitors', 'queued_visitors_left', 'availability',
+    'performance', 'chat_usage', 'unique_visitors', 'campaigns_conversion'))
+
 
 class ReportsApiV37(HttpClient):
     ''' Reports API client class in version 3.7. '''
@@ -572,3 +583,134 @@ class ReportsApiV37(HttpClient):
         return self.session.post(f'{self.api_url}/campaigns/campaigns_conversion',
                                  json=payload,
                                  headers=headers)
+
+# Bulk
+
+    def fetch_reports(self,
+                      reports: Iterable[str],
+                      distribution: str = None,
+                      timezone: str = None,
+                      filters: dict = None,
+                      max_concurrency: int = 6,
+                      return_exceptions: bool = False,
+                      headers: dict = None
+                      ) -> Union[BulkResult, Awaitable[BulkResult]]:
+        ''' Requests many reports with the same parameters concurrently, using
+            the session's connection pool (a single connection with `http2` enabled).
+
+        Args:
+            reports (Iterable[str]): Names of report methods, e.g. `duration`, `total_chats`.
+            distribution (str): Allowed values: `hour`, `day`, `day-hours`, `month` or `year`.
+                                Passed to reports accepting it. Defaults to `day`.
+            timezone (str): IANA Time Zone (e.g. America/Phoenix).
+                            Defaults to the requester's timezone.
+            filters (dict): If none provided, reports will span the last seven days.
+            max_concurrency (int): Maximum number of requests sent at once (threads
+                                   of synchronous clients, tasks of asyncio clients).
+            return_exceptions (bool): If set, exceptions raised by requests (e.g. timeouts)
+                                      are returned as their results; by default the first
+                                      one is raised once all requests are finished.
+            headers (dict): Custom headers to be used with session headers.
+                            They will be merged with session-level values that are set,
+                            however, these method-level parameters will not be persisted across requests.
+
+        Returns:
+            BulkResult: Mapping of report names to `httpx.Response` objects with
+                        durations of requests (in seconds) in `timings` attribute
+                        (awaitable resolving to it for asyncio clients).
+
+        Raises:
+            ValueError: If any of report names is invalid.
+        '''
+        methods = {}
+        for report in reports:
+            if report not in REPORTS:
+                raise ValueError(f'`{report}` is invalid report name.')
+            methods[report] = getattr(self, report)
+        call = acall_concurrently if isinstance(
+            self, AsyncHttpClient) else call_concurrently
+        return call(methods,
+                    max_concurrency,
+                    return_exceptions,
+                    distribution=distribution,
+                    timezone=timezone,
+                    filters=filters,
+                    headers=headers)
+
+    def fetch_report_sharded(self,
+                             report: str,
+                             filters: dict,
+                             distribution: str = None,
+                             timezone: str = None,
+                             shard_days: int = 31,
+                             max_concurrency: int = 6,
+                             headers: dict = None
+                             ) -> Union[dict, Awaitable[dict]]:
+        ''' Requests report of a long date range in sub-ranges concurrently and merges
+            them into a single report (see `livechat.reports.sharding.merge_reports`).
+            With a client using `ReportsCache`, sub-ranges which already ended
+            are served from the cache on subsequent calls.
+
+        Args:
+            report (str): Name of report method, e.g. `duration`, `total_chats`.
+            filters (dict): Report filters; `from` and `to` are required.
+            distribution (str): Allowed values: `hour`, `day`, `day-hours`, `month` or `year`.
+                                Defaults to `day`.
+            timezone (str): IANA Time Zone (e.g. America/Phoenix).
+                            Defaults to the requester's timezone.
+            shard_days (int): Length of sub-ranges in days.
+            max_concurrency (int): Maximum number of requests sent at once.
+            headers (dict): Custom headers to be used with session headers.
+                            They will be merged with session-level values that are set,
+                            however, these method-level parameters will not be persisted across requests.
+
+        Returns:
+            dict: Merged report document (awaitable resolving to it for asyncio clients).
+
+        Raises:
+            ValueError: If report name or range is invalid.
+            httpx.HTTPStatusError: If any of sub-range requests failed.
+        '''
+        if report not in REPORTS:
+            raise ValueError(f'`{report}` is invalid report name.')
+        if not filters or 'from' not in filters or 'to' not in filters:
+            raise ValueError('`filters` have to contain `from` and `to`.')
+        method = getattr(self, report)
+        methods = {
+            since: functools.partial(method,
+                                     filters={
+                                         **filters, 'from': since,
+                                         'to': until
+                                     })
+            for since, until in split_range(filters['from'], filters['to'],
+                                            shard_days)
+        }
+        params = {
+            'distribution': distribution,
+            'timezone': timezone,
+            'headers': headers
+        }
+
+        def merge(result: BulkResult) -> dict:
+            documents = [
+                response.raise_for_status().json()
+                for response in result.values()
+            ]
+            merged = merge_reports(documents)
+            if isinstance(merged.get('request'), dict):
+                merged['request'] = {**merged['request'], 'filters': filters}
+            return merged
+
+        if isinstance(self, AsyncHttpClient):
+
+            async def fetch() -> dict:
+                return merge(await acall_concurrently(methods, max_concurrency,
+                                                      **params))
+
+            return fetch()
+        return merge(call_concurrently(methods, max_concurrency, **params))
+
+
+class AsyncReportsApiV37(ReportsApiV37, AsyncHttpClient):
+    ''' Asyncio Reports API client class in version 3.7.
+        Methods return awaitables resolving to `httpx.Response`. '''
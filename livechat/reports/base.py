@@ -5,20 +5,25 @@
 
 from __future__ import annotations
 
-from typing import Union
-
-import httpx
+from typing import TYPE_CHECKING, Union
 
 from livechat.config import CONFIG
-from livechat.reports.api.v34 import ReportsApiV34
-from livechat.reports.api.v35 import ReportsApiV35
-from livechat.reports.api.v36 import ReportsApiV36
-from livechat.reports.api.v37 import ReportsApiV37
 from livechat.utils.structures import AccessToken
+from livechat.utils.versions import VersionRegistry
+
+if TYPE_CHECKING:
+    from livechat.reports.api.v34 import AsyncReportsApiV34, ReportsApiV34
+    from livechat.reports.api.v35 import AsyncReportsApiV35, ReportsApiV35
+    from livechat.reports.api.v36 import AsyncReportsApiV36, ReportsApiV36
+    from livechat.reports.api.v37 import AsyncReportsApiV37, ReportsApiV37
+    from livechat.reports.cache import ReportsCache
 
 stable_version = CONFIG.get('stable')
 api_url = CONFIG.get('url')
 
+clients = VersionRegistry('livechat.reports.api', 'ReportsApi')
+async_clients = VersionRegistry('livechat.reports.api', 'AsyncReportsApi')
+
 
 class ReportsApi:
     ''' Base class that allows retrieval of client for specific Reports
@@ -32,7 +37,8 @@ class ReportsApi:
         proxies: dict = None,
         verify: bool = True,
         disable_logging: bool = False,
-        timeout: float = httpx.Timeout(15)
+        timeout: float = 15,
+        cache: ReportsCache = None
     ) -> Union[ReportsApiV34, ReportsApiV35, ReportsApiV36, ReportsApiV37]:
         ''' Returns client for specific Reports API version.
 
@@ -51,6 +57,55 @@ class ReportsApi:
                 disable_logging (bool): indicates if logging should be disabled.
                 timeout (float): The timeout configuration to use when sending requests.
                                  Defaults to 15 seconds.
+                cache (ReportsCache): If provided, reports of closed date ranges
+                                      are served from and stored in the cache.
+
+            Returns:
+                ReportsApi: API client object for specified version.
+
+            Raises:
+                ValueError: If the specified version does not exist.
+        '''
+        client = clients.get(version)(token, base_url, http2, proxies, verify,
+                                      disable_logging, timeout)
+        if cache is not None:
+            from livechat.reports.cache import \
+                CachingSession  # pylint: disable=import-outside-toplevel
+            client.session = CachingSession(client.session, cache)
+        return client
+
+    @staticmethod
+    def get_async_client(
+        token: Union[AccessToken, str],
+        version: str = stable_version,
+        base_url: str = api_url,
+        http2: bool = False,
+        proxies: dict = None,
+        verify: bool = True,
+        disable_logging: bool = False,
+        timeout: float = 15,
+        cache: ReportsCache = None
+    ) -> Union[AsyncReportsApiV34, AsyncReportsApiV35, AsyncReportsApiV36,
+               AsyncReportsApiV37]:
+        ''' Returns asyncio client for specific Reports API version.
+
+            Args:
+                token (str): Full token with type (Bearer/Basic) that will be
+                             used as `Authorization` header in requests to API.
+                version (str): API's version. Defaults to the stable version of API.
+                base_url (str): API's base url. Defaults to API's production URL.
+                http2 (bool): A boolean indicating if HTTP/2 support should be
+                              enabled. Defaults to `False`.
+                proxies (dict): A dictionary mapping proxy keys to proxy URLs.
+                verify (bool): SSL certificates (a.k.a CA bundle) used to
+                               verify the identity of requested hosts. Either `True` (default CA bundle),
+                               a path to an SSL certificate file, an `ssl.SSLContext`, or `False`
+                               (which will disable verification). Defaults to `True`.
+                disable_logging (bool): indicates if logging should be disabled.
+                timeout (float): The timeout configuration to use when sending requests.
+                                 Defaults to 15 seconds.
+                cache (ReportsCache): If provided, reports of closed date ranges
+                                      are served from and stored in the cache.
 
             Returns:
                 ReportsApi: API client object for specified version.
@@ -58,20 +113,10 @@ class ReportsApi:
             Raises:
                 ValueError: If the specified version does not exist.
         '''
-        client = {
-            '3.4':
-            ReportsApiV34(token, base_url, http2, proxies, verify,
-                          disable_logging, timeout),
-            '3.5':
-            ReportsApiV35(token, base_url, http2, proxies, verify,
-                          disable_logging, timeout),
-            '3.6':
-            ReportsApiV36(token, base_url, http2, proxies, verify,
-                          disable_logging, timeout),
-            '3.7':
-            ReportsApiV37(token, base_url, http2, proxies, verify,
-                          disable_logging, timeout),
-        }.get(version)
-        if not client:
-            raise ValueError('Provided version does not exist.')
+        client = async_clients.get(version)(token, base_url, http2, proxies,
+                                            verify, disable_logging, timeout)
+        if cache is not None:
+            from livechat.reports.cache import \
+                CachingSession  # pylint: disable=import-outside-toplevel
+            client.session = CachingSession(client.session, cache)
         return client
@@ -0,0 +1,258 @@
+''' Cache of Reports API responses for closed date ranges. '''
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta, timezone as dt_timezone
+from typing import Any, Optional, Union
+from zoneinfo import ZoneInfo
+
+import httpx
+
+from livechat.utils.helpers import parse_datetime
+
+
+class ReportsCache:
+    ''' Two-tier (in-memory LRU and optional on-disk) cache of Reports API
+        responses.
+
+        Reports of date ranges which already ended are immutable, so only
+        successful responses to requests with `filters.to` at least `min_age`
+        seconds in the past are cached; requests of open or rolling ranges
+        (without `filters.to`) always reach the API. Entries are keyed on
+        the endpoint URL (which contains API version), the canonical form of
+        the payload (including `distribution`, `timezone` and `filters`)
+        and a hash of the `Authorization` header.
+
+        Example:
+            cache = ReportsCache(directory='.reports-cache')
+            client = ReportsApi.get_client(token, version='3.7', cache=cache)
+    '''
+    def __init__(self,
+                 max_entries: int = 256,
+                 directory: Union[str, os.PathLike, None] = None,
+                 min_age: float = 3600):
+        ''' Args:
+                max_entries (int): Maximum number of responses kept in memory;
+                                   the least recently used ones are evicted first.
+                directory (str): Directory of the on-disk tier (created if needed),
+                                 by default responses are cached in memory only.
+                min_age (float): Time (in seconds) which has to pass since
+                                 the end of a range before its reports are cached,
+                                 so that late updates (e.g. of chats still
+                                 ongoing at the end of the range) are included.
+        '''
+        self.max_entries = max_entries
+        self.directory = directory
+        self.min_age = min_age
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, url: str, payload: Any,
+            authorization: Optional[str]) -> Optional[str]:
+        ''' Returns key of the request, `None` if its response must not be cached. '''
+        if not self.is_closed_range(payload):
+            with self._lock:
+                self.uncacheable += 1
+            return None
+        canonical = json.dumps(
+            {
+                'url': url,
+                'payload': payload,
+                'authorization': hashlib.sha256(
+                    (authorization or '').encode()).hexdigest(),
+            },
+            sort_keys=True,
+            separators=(',', ':'))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def is_closed_range(self, payload: Any) -> bool:
+        ''' Indicates if request payload covers a range which ended at least
+            `min_age` seconds ago. '''
+        if not isinstance(payload, dict):
+            return False
+        until = (payload.get('filters') or {}).get('to')
+        if not isinstance(until, str):
+            return False
+        try:
+            until = parse_datetime(until)
+            if until.tzinfo is None:
+                until = until.replace(tzinfo=ZoneInfo(payload['timezone'])
+                                      if payload.get('timezone') else
+                                      dt_timezone.utc)
+        except (ValueError, KeyError):
+            return False
+        return until.timestamp() + self.min_age <= time.time()
+
+    def get(self, key: str) -> Optional[dict]:
+        ''' Returns cached entry (`status_code`, `headers` and `content`). '''
+        entry = self._recall(key)
+        if entry is None:
+            entry = self._loaded(key, self._read(key))
+        return entry
+
+    async def aget(self, key: str) -> Optional[dict]:
+        ''' Returns cached entry like `get`, reading the on-disk tier in a worker
+            thread, so that file reads do not block the event loop. '''
+        entry = self._recall(key)
+        if entry is None:
+            entry = self._loaded(
+                key, await asyncio.to_thread(self._read, key)
+                if self.directory is not None else None)
+        return entry
+
+    def set(self, key: str, entry: dict) -> None:
+        ''' Caches entry (`status_code`, `headers` and `content`) in both tiers. '''
+        with self._lock:
+            self._remember(key, entry)
+        if self.directory is not None:
+            self._write(key, entry)
+
+    async def aset(self, key: str, entry: dict) -> None:
+        ''' Caches entry like `set`, writing the on-disk tier in a worker thread. '''
+        with self._lock:
+            self._remember(key, entry)
+        if self.directory is not None:
+            await asyncio.to_thread(self._write, key, entry)
+
+    def clear(self) -> None:
+        ''' Removes all entries from both tiers. '''
+        with self._lock:
+            self._entries.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def stats(self) -> dict:
+        ''' Returns numbers of hits per tier, misses and requests not cached
+            (open ranges), and hit ratio of cacheable requests. '''
+        hits = self.memory_hits + self.disk_hits
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'uncacheable': self.uncacheable,
+            'hit_ratio': hits / (hits + self.misses) if hits + self.misses else 0.0,
+        }
+
+    def _remember(self, key: str, entry: dict) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _recall(self, key: str) -> Optional[dict]:
+        ''' Returns entry of the in-memory tier. '''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+            return entry
+
+    def _loaded(self, key: str, entry: Optional[dict]) -> Optional[dict]:
+        ''' Counts result of the on-disk tier and keeps its entry in memory. '''
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def _read(self, key: str) -> Optional[dict]:
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, entry: dict) -> None:
+        with tempfile.NamedTemporaryFile('w',
+                                         dir=self.directory,
+                                         suffix='.tmp',
+                                         delete=False) as file:
+            json.dump(entry, file)
+        os.replace(file.name, self._path(key))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+
+class CachingSession:
+    ''' Session proxy serving POST requests of closed date ranges from
+        `ReportsCache` and caching successful responses to them. '''
+    def __init__(self, session: Union[httpx.Client, httpx.AsyncClient],
+                 cache: ReportsCache):
+        self._session = session
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    # pylint: disable=redefined-outer-name
+    def post(self, url: str, json: Any = None, **kwargs) -> httpx.Response:
+        ''' Sends a POST request unless its response is cached (returns an awaitable
+            resolving to the response for `httpx.AsyncClient` sessions). '''
+        key = self.cache.key(str(url), json,
+                             self._session.headers.get('Authorization'))
+        if isinstance(self._session, httpx.AsyncClient):
+            return self._apost(key, url, json, **kwargs)
+        entry = self.cache.get(key) if key is not None else None
+        if entry is not None:
+            return cached_response(url, entry)
+        response = self._session.post(url, json=json, **kwargs)
+        if key is not None and response.status_code == 200:
+            self.cache.set(key, response_entry(response))
+        return response
+
+    async def _apost(self, key: Optional[str], url: str, json: Any,
+                     **kwargs) -> httpx.Response:
+        entry = await self.cache.aget(key) if key is not None else None
+        if entry is not None:
+            return cached_response(url, entry)
+        response = await self._session.post(url, json=json, **kwargs)
+        if key is not None and response.status_code == 200:
+            await self.cache.aset(key, response_entry(response))
+        return response
+
+
+def response_entry(response: httpx.Response) -> dict:
+    ''' Returns cache entry of response. '''
+    return {
+        'status_code': response.status_code,
+        'headers': dict(response.headers),
+        'content': response.content.decode('utf-8'),
+    }
+
+
+def cached_response(url: str, entry: dict) -> httpx.Response:
+    ''' Returns response recreated from cache entry. '''
+    headers = {
+        name: value
+        for name, value in entry['headers'].items()
+        if name.lower() not in ('content-encoding', 'content-length',
+                                'transfer-encoding')
+    }
+    response = httpx.Response(entry['status_code'],
+                              headers=headers,
+                              content=entry['content'].encode('utf-8'),
+                              request=httpx.Request('POST', url))
+    response.elapsed = timedelta(0)
+    return response
@@ -0,0 +1,139 @@
+''' Columnar representation of Reports API distributions. '''
+
+from __future__ import annotations
+
+import importlib.util
+import math
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from livechat.reports.sharding import iter_metrics
+
+BACKENDS = ('numpy', 'array')
+
+
+class ReportColumns:
+    ''' Report distribution as a sorted index of buckets and a typed array per
+        metric, e.g. `columns['agents.john@example.com.chats']`.
+
+        Arrays are `numpy.ndarray` for `numpy` backend or `array.array` for
+        `array` backend. Metrics with integer values in all buckets are stored
+        as 64-bit integers, others as 64-bit floats with `nan` in buckets
+        lacking the metric.
+    '''
+    def __init__(self, name: Optional[str], index: List[str],
+                 metrics: Dict[str, Any], backend: str):
+        self.name = name
+        self.index = index
+        self.metrics = metrics
+        self.backend = backend
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, metric: str) -> bool:
+        return metric in self.metrics
+
+    def __getitem__(self, metric: str) -> Any:
+        return self.metrics[metric]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.metrics)
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(name={self.name!r}, '
+                f'buckets={len(self.index)}, metrics={len(self.metrics)}, '
+                f'backend={self.backend!r})')
+
+    @property
+    def nbytes(self) -> int:
+        ''' Number of bytes occupied by metric arrays' values. '''
+        if self.backend == 'numpy':
+            return sum(values.nbytes for values in self.metrics.values())
+        return sum(values.itemsize * len(values)
+                   for values in self.metrics.values())
+
+    def select(self, prefix: str) -> Dict[str, Any]:
+        ''' Returns metrics nested under `prefix` (e.g. `agents.`) keyed by
+            the rest of their names. '''
+        return {
+            metric[len(prefix):]: values
+            for metric, values in self.metrics.items()
+            if metric.startswith(prefix)
+        }
+
+    def sum(self, metric: str) -> Union[int, float]:
+        ''' Returns sum of metric over all buckets, skipping missing values. '''
+        values = self.metrics[metric]
+        if self.backend == 'numpy':
+            import numpy  # pylint: disable=import-outside-toplevel
+            return numpy.nansum(values).item()
+        if values.typecode == 'q':
+            return sum(values)
+        return math.fsum(value for value in values if not math.isnan(value))
+
+
+def to_columns(report: Any,
+               metrics: Iterable[str] = None,
+               backend: str = None) -> ReportColumns:
+    ''' Converts distribution report into columns.
+
+        Args:
+            report: Report document (dict) or response of a report method.
+            metrics (Iterable[str]): Names of metrics to be converted,
+                                     by default all numeric values of records
+                                     (nested ones named as by
+                                     `livechat.reports.sharding.iter_metrics`).
+            backend (str): `numpy` or `array`. Defaults to `numpy` if installed.
+
+        Returns:
+            ReportColumns: Buckets sorted by their keys and metric arrays.
+
+        Raises:
+            ValueError: If backend is invalid.
+            ImportError: If `numpy` backend was requested, but NumPy is not installed.
+    '''
+    if backend is None:
+        backend = 'numpy' if importlib.util.find_spec(
+            'numpy') is not None else 'array'
+    elif backend not in BACKENDS:
+        raise ValueError(
+            f'`{backend}` is invalid backend. Supported backends: {", ".join(BACKENDS)}.'
+        )
+    if not isinstance(report, dict):
+        report = report.json()
+    records = report.get('records') or {}
+    index = sorted(records)
+    selected = set(metrics) if metrics is not None else None
+    columns: Dict[str, list] = {}
+    for position, bucket in enumerate(index):
+        for metric, value in iter_metrics(records[bucket]):
+            if selected is not None and metric not in selected:
+                continue
+            values = columns.get(metric)
+            if values is None:
+                values = columns[metric] = [None] * len(index)
+            values[position] = value
+    if selected is not None:
+        for metric in selected - columns.keys():
+            columns[metric] = [None] * len(index)
+    return ReportColumns(
+        report.get('name'), index, {
+            metric: typed_array(values, backend)
+            for metric, values in sorted(columns.items())
+        }, backend)
+
+
+def typed_array(values: List[Any], backend: str) -> Any:
+    ''' Returns values as int64 array if all are integers, as float64 array
+        with `nan` in place of `None` otherwise. '''
+    if all(isinstance(value, int) for value in values):
+        typecode = 'q'
+    else:
+        typecode = 'd'
+        values = [math.nan if value is None else value for value in values]
+    if backend == 'numpy':
+        import numpy  # pylint: disable=import-outside-toplevel
+        return numpy.array(values,
+                           dtype=numpy.int64 if typecode == 'q' else numpy.float64)
+    return array(typecode, values)
@@ -0,0 +1,356 @@
+''' Reports computed incrementally from webhooks and RTM pushes. '''
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, Iterator, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from livechat.utils.helpers import parse_datetime
+
+HOUR = 3600
+# distribution => format of bucket keys
+DISTRIBUTION_FORMATS = {
+    'hour': '%Y-%m-%d %H:00:00',
+    'day': '%Y-%m-%d',
+    'month': '%Y-%m',
+    'year': '%Y',
+}
+# event types counted as messages of chat participants
+MESSAGE_EVENT_TYPES = frozenset(('message', 'file', 'rich_message'))
+
+
+class HourCounters:
+    ''' Counters of a single (hour, group, agent) bucket. '''
+    __slots__ = ('chats', 'durations', 'duration_sum', 'first_responses',
+                 'first_response_sum', 'responses', 'response_sum')
+
+    def __init__(self):
+        self.chats = 0
+        self.durations = 0
+        self.duration_sum = 0.0
+        self.first_responses = 0
+        self.first_response_sum = 0.0
+        self.responses = 0
+        self.response_sum = 0.0
+
+    def add(self, other: HourCounters) -> None:
+        ''' Adds values of `other` counters. '''
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+
+class ChatState:
+    ''' State of an ongoing chat required to compute its metrics. '''
+    __slots__ = ('started_at', 'group_id', 'agent_id', 'customer_id',
+                 'awaiting_since', 'responded')
+
+    def __init__(self, started_at: float, group_id: Optional[int],
+                 agent_id: Optional[str], customer_id: Optional[str]):
+        self.started_at = started_at
+        self.group_id = group_id
+        self.agent_id = agent_id
+        self.customer_id = customer_id
+        self.awaiting_since = None
+        self.responded = False
+
+
+class LiveReports:
+    ''' Maintains chat metrics per hour, group and agent from webhooks or RTM
+        pushes (`incoming_chat`, `incoming_event`, `chat_transferred`,
+        `chat_deactivated`), each one updating constant number of counters.
+
+        Snapshots are shaped like responses of the corresponding Reports API
+        methods (`total_chats`, `duration`, `first_response_time`,
+        `response_time`) and accept the same `distribution`, `timezone` and
+        `filters` (`from`, `to`, `groups` and `agents`) parameters.
+        Only buckets with data are listed.
+
+        Chats are counted and their duration is measured in the hour they
+        started; response times are counted in the hour of the response.
+        Metrics of chats started before the first `incoming_chat` was
+        consumed are not available. Counters are kept per UTC hour, so
+        `filters.from` and `filters.to` select whole hours they overlap
+        and timezones offset from UTC by fractions of an hour (e.g.
+        Asia/Kolkata) are not supported. Counters of hours older than
+        `retention_hours` before the latest counted hour are dropped.
+
+        Example:
+            live_reports = LiveReports()
+            dispatcher.register('incoming_chat', live_reports.update)
+            ...
+            live_reports.total_chats(distribution='hour',
+                                     filters={'groups': {'values': [0]}})
+    '''
+    def __init__(self,
+                 max_open_chats: int = 100000,
+                 retention_hours: Optional[int] = 24 * 31):
+        ''' Args:
+                max_open_chats (int): Maximum number of ongoing chats tracked;
+                                      the oldest ones are forgotten first.
+                retention_hours (int): Number of hours, up to the latest counted
+                                       one, whose counters are kept. `None`
+                                       keeps counters of all hours.
+        '''
+        self.max_open_chats = max_open_chats
+        self.retention_hours = retention_hours
+        self.counters: Dict[Tuple[int, Optional[int], Optional[str]],
+                            HourCounters] = {}
+        self._latest_hour = None
+        self.chats: OrderedDict[str, ChatState] = OrderedDict()
+        self._lock = threading.Lock()
+        self._handlers = {
+            'incoming_chat': self._on_incoming_chat,
+            'incoming_event': self._on_incoming_event,
+            'chat_transferred': self._on_chat_transferred,
+            'chat_deactivated': self._on_chat_deactivated,
+        }
+
+    def update(self, message: Any, timestamp: Optional[float] = None) -> bool:
+        ''' Updates metrics with a webhook or RTM push.
+
+            Args:
+                message: Parsed webhook, webhook body or RTM push message.
+                timestamp (float): Unix time of the message, used if it does not
+                                   carry creation time of chat or event.
+                                   Defaults to the current time.
+
+            Returns:
+                bool: `True` if the message affects metrics.
+        '''
+        if isinstance(message, dict):
+            action, payload = message.get('action'), message.get('payload')
+        else:
+            action, payload = message.action, message.payload
+        handler = self._handlers.get(action)
+        if handler is None:
+            return False
+        if is_dataclass(payload):
+            payload = {
+                field.name: getattr(payload, field.name)
+                for field in fields(payload)
+            }
+        with self._lock:
+            handler(payload, timestamp or time.time())
+        return True
+
+    def total_chats(self,
+                    distribution: str = 'day',
+                    timezone: str = None,
+                    filters: dict = None) -> dict:
+        ''' Returns number of chats started per bucket. '''
+        records = {
+            bucket: {
+                'total': counters.chats
+            }
+            for bucket, counters in self._aggregate(distribution, timezone,
+                                                    filters) if counters.chats
+        }
+        return self._report('total_chats', distribution, timezone, filters,
+                            records, {
+                                'total':
+                                sum(record['total']
+                                    for record in records.values())
+                            })
+
+    def duration(self,
+                 distribution: str = 'day',
+                 timezone: str = None,
+                 filters: dict = None) -> dict:
+        ''' Returns number and average duration (in seconds) of finished chats
+            per bucket. '''
+        return self._averages('duration', 'durations', 'duration_sum',
+                              distribution, timezone, filters, round)
+
+    def first_response_time(self,
+                            distribution: str = 'day',
+                            timezone: str = None,
+                            filters: dict = None) -> dict:
+        ''' Returns number and average time (in seconds) of the first agent
+            response in chats per bucket. '''
+        return self._averages('first_response_time', 'first_responses',
+                              'first_response_sum', distribution, timezone,
+                              filters)
+
+    def response_time(self,
+                      distribution: str = 'day',
+                      timezone: str = None,
+                      filters: dict = None) -> dict:
+        ''' Returns number and average time (in seconds) of agent responses
+            to customer messages per bucket. '''
+        return self._averages('response_time', 'responses', 'response_sum',
+                              distribution, timezone, filters)
+
+    def _on_incoming_chat(self, payload: dict, timestamp: float) -> None:
+        chat = payload['chat']
+        thread = chat.get('thread') or {}
+        started_at = parse_time(thread.get('created_at'), timestamp)
+        agent_id = customer_id = None
+        for user in chat.get('users') or ():
+            if user.get('type') == 'customer':
+                customer_id = customer_id or user.get('id')
+            elif user.get('type') == 'agent' and user.get('present', True):
+                agent_id = agent_id or user.get('id')
+        group_ids = (chat.get('access') or thread.get('access')
+                     or {}).get('group_ids') or [None]
+        state = ChatState(started_at, group_ids[0], agent_id, customer_id)
+        self.chats[chat['id']] = state
+        self.chats.move_to_end(chat['id'])
+        while len(self.chats) > self.max_open_chats:
+            self.chats.popitem(last=False)
+        self._counters(started_at, state.group_id, agent_id).chats += 1
+
+    def _on_incoming_event(self, payload: dict, timestamp: float) -> None:
+        state = self.chats.get(payload['chat_id'])
+        event = payload.get('event') or {}
+        if state is None or event.get('type') not in MESSAGE_EVENT_TYPES:
+            return
+        author_id = event.get('author_id')
+        created_at = parse_time(event.get('created_at'), timestamp)
+        if author_id == state.customer_id:
+            if state.awaiting_since is None:
+                state.awaiting_since = created_at
+            return
+        if author_id is None or state.awaiting_since is None:
+            return
+        response_time = max(0.0, created_at - state.awaiting_since)
+        counters = self._counters(created_at, state.group_id, author_id)
+        counters.responses += 1
+        counters.response_sum += response_time
+        if not state.responded:
+            state.responded = True
+            counters.first_responses += 1
+            counters.first_response_sum += response_time
+        state.awaiting_since = None
+
+    def _on_chat_transferred(self, payload: dict, _: float) -> None:
+        state = self.chats.get(payload['chat_id'])
+        if state is None:
+            return
+        transferred_to = payload.get('transferred_to') or {}
+        group_ids = transferred_to.get('group_ids')
+        agent_ids = transferred_to.get('agent_ids')
+        if group_ids:
+            state.group_id = group_ids[0]
+        state.agent_id = agent_ids[0] if agent_ids else None
+
+    def _on_chat_deactivated(self, payload: dict, timestamp: float) -> None:
+        state = self.chats.pop(payload['chat_id'], None)
+        if state is None:
+            return
+        counters = self._counters(state.started_at, state.group_id,
+                                  state.agent_id)
+        counters.durations += 1
+        counters.duration_sum += max(0.0, timestamp - state.started_at)
+
+    def _counters(self, at: float, group_id: Optional[int],
+                  agent_id: Optional[str]) -> HourCounters:
+        hour = int(at // HOUR)
+        key = (hour, group_id, agent_id)
+        counters = self.counters.get(key)
+        if counters is not None:
+            return counters
+        if self.retention_hours is not None:
+            if self._latest_hour is None or hour > self._latest_hour:
+                self._latest_hour = hour
+                self._evict_counters()
+            elif hour <= self._latest_hour - self.retention_hours:
+                # counted, but not kept
+                return HourCounters()
+        counters = self.counters[key] = HourCounters()
+        return counters
+
+    def _evict_counters(self) -> None:
+        ''' Drops counters of hours outside of `retention_hours`. '''
+        oldest_hour = self._latest_hour - self.retention_hours
+        for key in [key for key in self.counters if key[0] <= oldest_hour]:
+            del self.counters[key]
+
+    def _aggregate(self, distribution: str, timezone: Optional[str],
+                   filters: Optional[dict]) -> Iterator[Tuple[str, HourCounters]]:
+        ''' Yields (bucket, counters) pairs sorted by bucket. '''
+        try:
+            bucket_format = DISTRIBUTION_FORMATS[distribution]
+        except KeyError as error:
+            raise ValueError(
+                f'`{distribution}` distribution is not supported. Supported '
+                f'distributions: {", ".join(DISTRIBUTION_FORMATS)}.') from error
+        tzinfo = ZoneInfo(timezone) if timezone else dt_timezone.utc
+        filters = filters or {}
+        since = parse_time(filters.get('from'), float('-inf'))
+        until = parse_time(filters.get('to'), float('inf'))
+        groups = set((filters.get('groups') or {}).get('values') or ()) or None
+        agents = set((filters.get('agents') or {}).get('values') or ()) or None
+        buckets: Dict[str, HourCounters] = {}
+        hour_buckets: Dict[int, str] = {}
+        with self._lock:
+            for (hour, group_id, agent_id), counters in self.counters.items():
+                if not (since < (hour + 1) * HOUR and hour * HOUR <= until) or (
+                        groups is not None and group_id not in groups) or (
+                            agents is not None and agent_id not in agents):
+                    continue
+                bucket = hour_buckets.get(hour)
+                if bucket is None:
+                    start = datetime.fromtimestamp(hour * HOUR, tzinfo)
+                    if start.utcoffset() % timedelta(hours=1):
+                        raise ValueError(
+                            f'`{timezone}` timezone is not supported: counters '
+                            'are kept per UTC hour, so timezones have to be '
+                            'offset from UTC by whole hours.')
+                    bucket = hour_buckets[hour] = start.strftime(bucket_format)
+                buckets.setdefault(bucket, HourCounters()).add(counters)
+        return iter(sorted(buckets.items()))
+
+    def _averages(self,
+                  name: str,
+                  count_field: str,
+                  sum_field: str,
+                  distribution: str,
+                  timezone: Optional[str],
+                  filters: Optional[dict],
+                  rounding=float) -> dict:
+        records = {}
+        count = total_sum = 0
+        for bucket, counters in self._aggregate(distribution, timezone,
+                                                filters):
+            bucket_count = getattr(counters, count_field)
+            if bucket_count:
+                bucket_sum = getattr(counters, sum_field)
+                records[bucket] = {
+                    'count': bucket_count,
+                    name: rounding(bucket_sum / bucket_count),
+                }
+                count += bucket_count
+                total_sum += bucket_sum
+        return self._report(name, distribution, timezone, filters, records, {
+            'total': count,
+            name: rounding(total_sum / count) if count else 0
+        })
+
+    @staticmethod
+    def _report(name: str, distribution: str, timezone: Optional[str],
+                filters: Optional[dict], records: dict, summary: dict) -> dict:
+        return {
+            'name': name,
+            'request': {
+                'distribution': distribution,
+                'timezone': timezone,
+                'filters': filters or {},
+            },
+            'records': records,
+            **summary,
+        }
+
+
+def parse_time(value: Optional[str], default: float) -> float:
+    ''' Returns Unix time of RFC 3339 `value`, `default` if it is not provided. '''
+    if not value:
+        return default
+    parsed = parse_datetime(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_timezone.utc)
+    return parsed.timestamp()
@@ -0,0 +1,120 @@
+''' Splitting of long Reports API date ranges and merging of partial reports. '''
+
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from livechat.utils.helpers import parse_datetime
+
+# metric being an average => metrics weighting it (the first one present is used)
+AVERAGES: Dict[str, Tuple[str, ...]] = {
+    'duration': ('count', 'total'),
+    'first_response_time': ('count', 'total'),
+    'response_time': ('count', 'total'),
+}
+
+
+def split_range(since: str, until: str, shard_days: int) -> List[Tuple[str, str]]:
+    ''' Splits range into consecutive, non-overlapping sub-ranges.
+
+        Args:
+            since (str): Start of the range (`filters.from`) in RFC 3339 format.
+            until (str): End of the range (`filters.to`, inclusive) in RFC 3339 format.
+            shard_days (int): Length of sub-ranges in days; all sub-ranges but
+                              the last one end a second before the next one starts.
+
+        Returns:
+            list: (from, to) pairs in RFC 3339 format with offsets of given range.
+
+        Raises:
+            ValueError: If the range is invalid.
+    '''
+    if shard_days < 1:
+        raise ValueError('`shard_days` has to be a positive number.')
+    start, end = parse_datetime(since), parse_datetime(until)
+    if (start.tzinfo is None) != (end.tzinfo is None) or start > end:
+        raise ValueError(f'Invalid range: `{since}` - `{until}`.')
+    shards = []
+    while True:
+        next_start = start + timedelta(days=shard_days)
+        if next_start > end:
+            shards.append((start.isoformat(), until))
+            return shards
+        shards.append((start.isoformat(),
+                       (next_start - timedelta(seconds=1)).isoformat()))
+        start = next_start
+
+
+def merge_reports(reports: Iterable[dict],
+                  averages: Dict[str, Tuple[str, ...]] = None) -> dict:
+    ''' Merges reports of consecutive sub-ranges into a report of the whole range.
+
+        Buckets of `records` present in one report are copied, values of buckets
+        present in many reports (e.g. `month` distribution over sub-ranges of
+        a month) are combined: counts and sums are added up, averages listed
+        in `averages` are recomputed from sums weighted by their counts.
+        Summary fields outside of `records` are combined the same way;
+        other fields (e.g. `name`) are taken from the first report.
+
+        Args:
+            reports (Iterable[dict]): Report documents in order of their ranges.
+            averages (dict): Mapping of average metrics to names of metrics
+                             weighting them, by default `AVERAGES`.
+
+        Returns:
+            dict: Merged report document, with `records` sorted by bucket.
+    '''
+    averages = AVERAGES if averages is None else averages
+    merged, summary, records = {}, {}, {}
+    for report in reports:
+        for bucket, record in (report.get('records') or {}).items():
+            records[bucket] = merge_values(records[bucket], record,
+                                           averages) if bucket in records else record
+        summary = merge_values(
+            summary, {
+                name: value
+                for name, value in report.items() if is_number(value)
+            }, averages)
+        for name, value in report.items():
+            if name != 'records' and not is_number(value):
+                merged.setdefault(name, value)
+    merged.update(summary)
+    merged['records'] = dict(sorted(records.items()))
+    return merged
+
+
+def merge_values(first: dict, second: dict,
+                 averages: Dict[str, Tuple[str, ...]]) -> dict:
+    ''' Returns values of two buckets combined; nested dicts are merged recursively. '''
+    merged = dict(first)
+    for name, value in second.items():
+        previous = merged.get(name)
+        if name not in merged:
+            merged[name] = value
+        elif isinstance(previous, dict) and isinstance(value, dict):
+            merged[name] = merge_values(previous, value, averages)
+        elif is_number(previous) and is_number(value):
+            weight = next((weight for weight in averages.get(name, ())
+                           if is_number(first.get(weight))
+                           and is_number(second.get(weight))), None)
+            if weight is not None:
+                total_weight = first[weight] + second[weight]
+                merged[name] = (previous * first[weight] + value * second[weight]
+                                ) / total_weight if total_weight else 0
+            else:
+                merged[name] = previous + value
+    return merged
+
+
+def is_number(value) -> bool:
+    ''' Indicates if value is a number (but not a boolean). '''
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def iter_metrics(record: dict, prefix: str = '') -> Iterator[Tuple[str, Any]]:
+    ''' Yields (name, value) of numeric values of a bucket; values of nested dicts
+        are named by their paths joined with dots (e.g. `agents.john@example.com.chats`). '''
+    for name, value in record.items():
+        if isinstance(value, dict):
+            yield from iter_metrics(value, f'{prefix}{name}.')
+        elif is_number(value):
+            yield f'{prefix}{name}', value
@@ -0,0 +1,203 @@
+''' Incremental synchronization of Reports API data with persisted watermarks. '''
+
+from __future__ import annotations
+
+import inspect
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import (Any, AsyncIterator, Callable, Dict, Iterable, Iterator,
+                    List, NamedTuple, Optional, Tuple, Union)
+from zoneinfo import ZoneInfo
+
+from livechat.reports.sharding import iter_metrics
+from livechat.utils.helpers import parse_datetime
+
+
+class ReportRow(NamedTuple):
+    ''' Single value of a report, flattened for bulk loading. `group` and `agent`
+        are set for reports synchronized per group or agent. Nested metrics are
+        named as by `livechat.reports.sharding.iter_metrics`. '''
+    report: str
+    bucket: str
+    group: Optional[int]
+    agent: Optional[str]
+    metric: str
+    value: Union[int, float]
+
+
+class ReportsSync:
+    ''' Synchronizes reports incrementally, fetching only buckets which were
+        not final in the previous run.
+
+        For each report (and group or agent, if given) a watermark is kept:
+        the end of the last bucket which was final (ended at least
+        `settle_time` ago) when it was fetched. Each run fetches buckets from
+        the watermark until now, in two requests: the final ones (after which
+        the watermark is moved and persisted) and the recent ones, which are
+        emitted again in the following runs, so rows should be upserted by
+        (report, bucket, group, agent, metric).
+
+        Example:
+            sync = ReportsSync(ReportsApi.get_client(token, version='3.7'),
+                               ['total_chats', 'duration'], 'watermarks.json',
+                               groups=[0, 1])
+            for row in sync.run():
+                ...
+    '''
+    UNITS = ('hour', 'day', 'month')
+
+    def __init__(self,
+                 client: Any,
+                 reports: Iterable[str],
+                 state_path: Union[str, os.PathLike],
+                 distribution: str = 'hour',
+                 timezone: str = 'UTC',
+                 filters: dict = None,
+                 groups: Iterable[int] = None,
+                 agents: Iterable[str] = None,
+                 initial_days: int = 30,
+                 settle_time: float = 3600,
+                 shard_days: int = 31,
+                 now: Callable[[], datetime] = None):
+        ''' Args:
+                client: Reports API v3.7 client (synchronous or asyncio).
+                reports (Iterable[str]): Names of report methods, e.g. `total_chats`.
+                state_path (str): Path of JSON file with watermarks.
+                distribution (str): Bucket size: `hour`, `day` or `month`.
+                timezone (str): IANA Time Zone buckets are aligned to.
+                filters (dict): Additional report filters (without `from` and `to`).
+                groups (Iterable[int]): If provided, reports are synchronized
+                                        per group.
+                agents (Iterable[str]): If provided, reports are synchronized
+                                        per agent (and group, if given).
+                initial_days (int): Number of days fetched in the first run.
+                settle_time (float): Time (in seconds) after the end of a bucket
+                                     after which its values are considered final.
+                shard_days (int): Length (in days) of sub-ranges long ranges
+                                  are fetched in (see `fetch_report_sharded`).
+                now (Callable): Function returning current time, for testing.
+        '''
+        if distribution not in self.UNITS:
+            raise ValueError(
+                f'`{distribution}` distribution is not supported. Supported '
+                f'distributions: {", ".join(self.UNITS)}.')
+        self.client = client
+        self.reports = list(reports)
+        self.state_path = state_path
+        self.distribution = distribution
+        self.timezone = timezone
+        self.filters = filters or {}
+        self.groups = list(groups) if groups is not None else [None]
+        self.agents = list(agents) if agents is not None else [None]
+        self.initial_days = initial_days
+        self.settle_time = settle_time
+        self.shard_days = shard_days
+        self.now = now or (lambda: datetime.now(dt_timezone.utc))
+        self.watermarks: Dict[str, str] = self._load()
+
+    def run(self) -> Iterator[ReportRow]:
+        ''' Fetches new and not yet final buckets of synchronous client's reports.
+
+            Yields:
+                ReportRow: Flat records of fetched buckets.
+        '''
+        for key, report, group, agent, ranges in self._plan():
+            for final, filters in ranges:
+                document = self._fetch(report, filters)
+                if inspect.isawaitable(document):
+                    document.close()
+                    raise TypeError('Use `arun` with asyncio clients.')
+                yield from flatten(report, group, agent, document)
+                if final:
+                    self._advance(key, filters['to'])
+
+    async def arun(self) -> AsyncIterator[ReportRow]:
+        ''' Fetches new and not yet final buckets of asyncio client's reports.
+
+            Yields:
+                ReportRow: Flat records of fetched buckets.
+        '''
+        for key, report, group, agent, ranges in self._plan():
+            for final, filters in ranges:
+                for row in flatten(report, group, agent, await self._fetch(
+                        report, filters)):
+                    yield row
+                if final:
+                    self._advance(key, filters['to'])
+
+    def _plan(self) -> Iterator[Tuple[str, str, Any, Any, List[tuple]]]:
+        ''' Yields (watermark key, report, group, agent, [(final, filters)]). '''
+        tzinfo = ZoneInfo(self.timezone)
+        now = self.now().astimezone(tzinfo)
+        cutoff = self._floor(now - timedelta(seconds=self.settle_time))
+        initial = self._floor(now - timedelta(days=self.initial_days))
+        for report in self.reports:
+            for group in self.groups:
+                for agent in self.agents:
+                    key = f'{report}/group={group}/agent={agent}'
+                    since = parse_datetime(self.watermarks[key]).astimezone(
+                        tzinfo) if key in self.watermarks else initial
+                    filters = dict(self.filters)
+                    if group is not None:
+                        filters['groups'] = {'values': [group]}
+                    if agent is not None:
+                        filters['agents'] = {'values': [agent]}
+                    ranges = []
+                    if since < cutoff:
+                        ranges.append((True, {
+                            **filters, 'from': since.isoformat(),
+                            'to': cutoff.isoformat()
+                        }))
+                    ranges.append((False, {
+                        **filters, 'from': max(since, cutoff).isoformat(),
+                        'to': now.isoformat()
+                    }))
+                    yield key, report, group, agent, ranges
+
+    def _fetch(self, report: str, filters: dict) -> Any:
+        ''' Returns report document for `filters` (range with exclusive end). '''
+        until = parse_datetime(filters['to']) - timedelta(seconds=1)
+        return self.client.fetch_report_sharded(
+            report, {
+                **filters, 'to': max(until, parse_datetime(
+                    filters['from'])).isoformat()
+            },
+            distribution=self.distribution,
+            timezone=self.timezone,
+            shard_days=self.shard_days)
+
+    def _floor(self, moment: datetime) -> datetime:
+        ''' Returns start of the bucket `moment` belongs to. '''
+        moment = moment.replace(minute=0, second=0, microsecond=0)
+        if self.distribution in ('day', 'month'):
+            moment = moment.replace(hour=0)
+        if self.distribution == 'month':
+            moment = moment.replace(day=1)
+        return moment
+
+    def _advance(self, key: str, watermark: str) -> None:
+        self.watermarks[key] = watermark
+        directory = os.path.dirname(os.path.abspath(self.state_path))
+        with tempfile.NamedTemporaryFile('w',
+                                         dir=directory,
+                                         suffix='.tmp',
+                                         delete=False) as file:
+            json.dump(self.watermarks, file, indent=2, sort_keys=True)
+        os.replace(file.name, self.state_path)
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            with open(self.state_path, encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+
+def flatten(report: str, group: Optional[int], agent: Optional[str],
+            document: dict) -> Iterator[ReportRow]:
+    ''' Yields numeric values of report document's records as flat rows. '''
+    for bucket, record in (document.get('records') or {}).items():
+        for metric, value in iter_metrics(record):
+            yield ReportRow(report, bucket, group, agent, metric, value)
@@ -0,0 +1,67 @@
+''' Fixtures and helpers shared by tests. '''
+
+import json
+
+import httpx
+import pytest
+
+
+class StreamedBody(httpx.SyncByteStream, httpx.AsyncByteStream):
+    ''' Response body streamed the same way network transports do, in chunks
+        of `chunk_size` bytes (in a single chunk by default). `sent` is the
+        number of bytes streamed so far. '''
+    def __init__(self, content: bytes, chunk_size: int = None):
+        self.content = content
+        self.chunk_size = chunk_size or max(len(content), 1)
+        self.sent = 0
+
+    def __iter__(self):
+        while self.sent < len(self.content):
+            yield self.content[self.sent:self.sent + self.chunk_size]
+            self.sent += self.chunk_size
+
+    async def __aiter__(self):
+        for chunk in self:
+            yield chunk
+
+
+def json_body(document) -> StreamedBody:
+    ''' Returns response body with `document` encoded as JSON. '''
+    return StreamedBody(json.dumps(document).encode())
+
+
+@pytest.fixture
+def webhook_body() -> dict:
+    ''' Returns a test webhook body in a form of a dict. '''
+    return {
+        'webhook_id': '166c029b-a2c6-4010-aa0c-5a984353a7dd',
+        'secret_key': 'top_secret_value',
+        'action': 'chat_deactivated',
+        'organization_id': 'f9c7cc55-b35a-4e76-b0d5-ae9fce362314',
+        'payload': {
+            'chat_id': 'PJ0MRSHTDG',
+            'thread_id': 'K600PKZON8'
+        },
+        'additional_data': {}
+    }
+
+
+@pytest.fixture
+def incoming_event_body() -> dict:
+    ''' Returns a test `incoming_event` webhook body in a form of a dict. '''
+    return {
+        'webhook_id': '166c029b-a2c6-4010-aa0c-5a984353a7dd',
+        'secret_key': 'top_secret_value',
+        'action': 'incoming_event',
+        'organization_id': 'f9c7cc55-b35a-4e76-b0d5-ae9fce362314',
+        'payload': {
+            'chat_id': 'PJ0MRSHTDG',
+            'thread_id': 'K600PKZON8',
+            'event': {
+                'id': 'Q20N9CKRX2_1',
+                'type': 'message',
+                'text': 'Hello'
+            }
+        },
+        'additional_data': {}
+    }
@@ -2,6 +2,7 @@
 
 # pylint: disable=E1120,W0621
 
+import httpx
 import pytest
 
 from livechat.agent.web.base import AgentWeb
@@ -36,6 +37,20 @@ def test_get_client_without_access_token():
     ) == "AgentWeb.get_client() missing 1 required positional argument: 'access_token'"
 
 
+def test_get_client_creates_single_session(monkeypatch):
+    ''' Test if only the client for requested version is created. '''
+    created_sessions = []
+
+    class CountingClient(httpx.Client):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created_sessions.append(self)
+
+    monkeypatch.setattr(httpx, 'Client', CountingClient)
+    client = AgentWeb.get_client(access_token=ACCESS_TOKEN_INVALID)
+    assert created_sessions == [client.session]
+
+
 def test_get_client_with_non_existing_version():
     ''' Test if ValueError raised for non-existing version. '''
     with pytest.raises(ValueError) as exception:
@@ -0,0 +1,167 @@
+''' Tests for asyncio RTM clients run against a local stand-in server. '''
+
+# pylint: disable=E1120,W0621,C0103
+
+import asyncio
+import json
+
+import pytest
+import websocket
+from websockets.asyncio.server import serve
+
+from livechat.agent.rtm.base import AsyncAgentRTM
+from livechat.config import CONFIG
+from livechat.customer.rtm.base import AsyncCustomerRTM
+from livechat.utils.async_ws_client import AsyncWebsocketClient
+from livechat.utils.ws_client import WebsocketClient
+
+stable_version = CONFIG.get('stable')
+api_url = CONFIG.get('url')
+
+ORGANIZATION_ID = '30007dab-4c18-4169-978d-02f776e476a5'
+
+
+async def stand_in_handler(connection):
+    ''' Answers every request with a push followed by its response. '''
+    async for message in connection:
+        request = json.loads(message)
+        await connection.send(
+            json.dumps({
+                'action': 'incoming_event',
+                'type': 'push',
+                'payload': {}
+            }))
+        if request['action'] == 'malformed':
+            await connection.send('not a JSON document')
+        if request['action'] in ('no_response', 'malformed'):
+            continue
+        await connection.send(
+            json.dumps({
+                'request_id': request['request_id'],
+                'action': request['action'],
+                'type': 'response',
+                'success': True,
+                'payload': request['payload']
+            }))
+
+
+def run_against_stand_in(scenario) -> None:
+    ''' Runs `scenario(url)` coroutine with a stand-in server listening on `url`. '''
+    async def main():
+        async with serve(stand_in_handler, 'localhost', 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            await scenario(f'ws://localhost:{port}')
+
+    asyncio.run(main())
+
+
+def test_get_client_with_non_existing_version():
+    ''' Test if ValueError raised for non-existing version. '''
+    with pytest.raises(ValueError) as exception:
+        AsyncAgentRTM.get_client(version='2.9')
+    assert str(exception.value) == 'Provided version does not exist.'
+
+
+def test_get_customer_client_without_organization_id():
+    ''' Test if ValueError raised for missing `organization_id`. '''
+    with pytest.raises(ValueError) as exception:
+        AsyncCustomerRTM.get_client()
+    assert str(
+        exception.value
+    ) == 'Provided `organization_id` (`None`) seems invalid. Websocket connection may not open.'
+
+
+def test_get_client_url():
+    ''' Test if asyncio clients use the same urls as the synchronous ones. '''
+    agent_client = AsyncAgentRTM.get_client()
+    customer_client = AsyncCustomerRTM.get_client(
+        organization_id=ORGANIZATION_ID)
+    assert agent_client.ws.url == f'wss://{api_url}/v{stable_version}/agent/rtm/ws'
+    assert customer_client.ws.url == f'wss://{api_url}/v{stable_version}/customer/rtm/ws?organization_id={ORGANIZATION_ID}'
+
+
+def test_get_client_creates_asyncio_websocket_client_only(monkeypatch):
+    ''' Test if asyncio clients do not create threaded websocket clients. '''
+    def fail(*args, **kwargs):
+        raise AssertionError('WebsocketClient created')
+
+    monkeypatch.setattr(WebsocketClient, '__init__', fail)
+    for version in CONFIG.get('versions'):
+        agent_client = AsyncAgentRTM.get_client(version=version)
+        customer_client = AsyncCustomerRTM.get_client(
+            version=version, organization_id=ORGANIZATION_ID)
+        assert isinstance(agent_client.ws, AsyncWebsocketClient)
+        assert isinstance(customer_client.ws, AsyncWebsocketClient)
+
+
+def test_client_sends_requests_and_collects_pushes():
+    ''' Test if methods are awaitable and pushes are kept in `ws.messages`. '''
+    async def scenario(url):
+        client = AsyncAgentRTM.get_client()
+        client.ws.url = url
+        await client.open_connection()
+        response = await client.login(token='Bearer 10386012')
+        await client.close_connection()
+        assert response.action == 'login'
+        assert response.success is True
+        assert response.payload == {'token': 'Bearer 10386012'}
+        assert [message['action']
+                for message in client.ws.messages] == ['incoming_event']
+        assert client.ws.connected is False
+
+    run_against_stand_in(scenario)
+
+
+def test_many_clients_share_one_event_loop():
+    ''' Test if many connections can be served concurrently by one event loop. '''
+    async def scenario(url):
+        clients = [
+            AsyncCustomerRTM.get_client(organization_id=ORGANIZATION_ID)
+            for _ in range(50)
+        ]
+        for client in clients:
+            client.ws.url = url
+        await asyncio.gather(*(client.open_connection() for client in clients))
+        responses = await asyncio.gather(*(client.get_chat(chat_id=str(number))
+                                           for number, client in enumerate(clients)))
+        await asyncio.gather(*(client.close_connection() for client in clients))
+        assert [response.payload['chat_id']
+                for response in responses] == [str(number) for number in range(50)]
+
+    run_against_stand_in(scenario)
+
+
+def test_client_returns_none_on_response_timeout():
+    ''' Test if `None` is returned when response does not arrive in time. '''
+    async def scenario(url):
+        client = AsyncAgentRTM.get_client()
+        client.ws.url = url
+        await client.open_connection(response_timeout=0.2)
+        response = await client.ws.send({'action': 'no_response', 'payload': {}})
+        await client.close_connection()
+        assert response is None
+
+    run_against_stand_in(scenario)
+
+
+def test_client_survives_malformed_message():
+    ''' Test if a message which cannot be parsed does not stop receiving. '''
+    async def scenario(url):
+        client = AsyncAgentRTM.get_client()
+        client.ws.url = url
+        await client.open_connection(response_timeout=0.2)
+        assert await client.ws.send({'action': 'malformed', 'payload': {}}) is None
+        response = await client.login(token='Bearer 10386012')
+        assert client.ws.connected is True
+        await client.close_connection()
+        assert response.payload == {'token': 'Bearer 10386012'}
+
+    run_against_stand_in(scenario)
+
+
+def test_send_through_not_opened_connection():
+    ''' Test if message cannot be sent through not opened connection. '''
+    client = AsyncAgentRTM.get_client()
+    with pytest.raises(websocket.WebSocketConnectionClosedException) as exception:
+        asyncio.run(client.login(token='Bearer 10386012'))
+    assert str(exception.value) == 'Connection is already closed.'
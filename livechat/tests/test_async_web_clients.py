@@ -0,0 +1,95 @@
+''' Tests for asyncio Web API clients. '''
+
+# pylint: disable=E1120,W0621,W0212
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from livechat.agent.web.base import AgentWeb
+from livechat.config import CONFIG
+from livechat.configuration.base import ConfigurationApi
+from livechat.customer.web.base import CustomerWeb
+from livechat.reports.base import ReportsApi
+from livechat.tests.conftest import StreamedBody
+
+stable_version = CONFIG.get('stable')
+api_url = CONFIG.get('url')
+
+ORGANIZATION_ID = '30007dab-4c18-4169-978d-02f776e476a5'
+
+
+async def delayed_echo(request: httpx.Request) -> httpx.Response:
+    ''' Responds with the requested path after a short delay. '''
+    await asyncio.sleep(0.1)
+    return httpx.Response(200,
+                          headers={'content-type': 'application/json'},
+                          stream=StreamedBody(
+                              json.dumps({
+                                  'path': request.url.path
+                              }).encode()))
+
+
+def with_mock_transport(client):
+    ''' Routes requests of the asyncio client to `delayed_echo`. '''
+    client.session._transport = httpx.MockTransport(delayed_echo)
+    return client
+
+
+@pytest.mark.parametrize('factory,kwargs', [
+    (AgentWeb.get_async_client, {
+        'access_token': 'test'
+    }),
+    (CustomerWeb.get_async_client, {
+        'access_token': 'test',
+        'organization_id': ORGANIZATION_ID
+    }),
+    (ConfigurationApi.get_async_client, {
+        'token': 'test'
+    }),
+    (ReportsApi.get_async_client, {
+        'token': 'test'
+    }),
+])
+def test_get_async_client(factory, kwargs):
+    ''' Test if asyncio clients are created for existing versions only. '''
+    client = factory(**kwargs)
+    assert isinstance(client.session, httpx.AsyncClient)
+    assert client.session.headers.get('Authorization') == 'test'
+    with pytest.raises(ValueError) as exception:
+        factory(**kwargs, version='2.9')
+    assert str(exception.value) == 'Provided version does not exist.'
+
+
+def test_async_client_sends_requests_concurrently():
+    ''' Test if requests issued by asyncio client are not serialized. '''
+    async def main():
+        async with with_mock_transport(
+                AgentWeb.get_async_client(access_token='test')) as client:
+            started = time.perf_counter()
+            responses = await asyncio.gather(
+                *(client.get_chat(chat_id=str(number)) for number in range(20)))
+            return responses, time.perf_counter() - started
+
+    responses, duration = asyncio.run(main())
+    assert duration < 1
+    assert all(response.json() == {
+        'path': f'/v{stable_version}/agent/action/get_chat'
+    } for response in responses)
+
+
+def test_async_client_keeps_request_specifics():
+    ''' Test if asyncio Customer Web client sends `organization_id` and custom headers. '''
+    async def main():
+        async with with_mock_transport(
+                CustomerWeb.get_async_client(
+                    access_token='test',
+                    organization_id=ORGANIZATION_ID)) as client:
+            return await client.list_chats(headers={'x-test': 'enabled'})
+
+    response = asyncio.run(main())
+    assert response.request.url.params['organization_id'] == ORGANIZATION_ID
+    assert response.request.headers['x-test'] == 'enabled'
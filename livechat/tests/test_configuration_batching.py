@@ -0,0 +1,150 @@
+''' Tests for batching of Configuration API mutations. '''
+
+# pylint: disable=W0212
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from livechat.configuration.base import ConfigurationApi
+from livechat.configuration.batching import (BatchItemError,
+                                             ConfigurationBatcher)
+from livechat.tests.conftest import json_body
+
+
+def batch_handler(batches: list):
+    ''' Returns handler responding to batch requests with an item per request,
+        an error for requests of agents with `invalid` in ID. '''
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests = json.loads(request.content)['requests']
+        batches.append((request.url.path.rsplit('/', 1)[-1], requests))
+        return httpx.Response(200,
+                              headers={'content-type': 'application/json'},
+                              stream=json_body({
+                                  'responses': [{
+                                      'error': {
+                                          'type': 'validation'
+                                      }
+                                  } if 'invalid' in item.get('id', '') else {
+                                      'id': item.get('id', 'bot')
+                                  } for item in requests]
+                              }))
+
+    return handle
+
+
+def test_calls_batched_and_results_mapped_back():
+    ''' Test if calls are sent in chunks, in order of methods' first calls,
+        and results and errors of items resolve futures of their calls. '''
+    batches = []
+    client = ConfigurationApi.get_client(token='test', version='3.7')
+    client.session._transport = httpx.MockTransport(batch_handler(batches))
+    with ConfigurationBatcher(client, max_batch_size=2) as batch:
+        created = [
+            batch.create_agent(id=f'{name}@example.com', name=name)
+            for name in ('a', 'b', 'invalid', 'c', 'd')
+        ]
+        bot = batch.create_bot(name='Bot')
+        deleted = batch.delete_agent(payload={'id': 'x@example.com'})
+        assert len(batches) == 2
+        assert not bot.done()
+    assert [name for name, _ in batches] == [
+        'batch_create_agents', 'batch_create_agents', 'batch_create_agents',
+        'batch_create_bots', 'batch_delete_agents'
+    ]
+    assert batches[0][1] == [{
+        'id': 'a@example.com',
+        'name': 'a'
+    }, {
+        'id': 'b@example.com',
+        'name': 'b'
+    }]
+    assert created[0].result() == {'id': 'a@example.com'}
+    batches.clear()
+    with ConfigurationBatcher(client, max_batch_size=2) as batch:
+        batch.create_bot(name='Bot')
+        batch.create_agent(id='a@example.com')
+        batch.create_agent(id='b@example.com')
+        assert [name for name, _ in batches] == [
+            'batch_create_bots', 'batch_create_agents'
+        ]
+    with pytest.raises(BatchItemError) as error:
+        created[2].result()
+    assert error.value.error == {'type': 'validation'}
+    assert error.value.request['id'] == 'invalid@example.com'
+    assert created[4].result() == {'id': 'd@example.com'}
+    assert bot.result() == {'id': 'bot'}
+    assert deleted.result() == {'id': 'x@example.com'}
+
+
+def test_invalid_calls_and_failed_batches():
+    ''' Test if invalid calls are rejected and failed batch requests fail
+        futures of all their calls. '''
+    client = ConfigurationApi.get_client(token='test', version='3.7')
+    client.session._transport = httpx.MockTransport(
+        lambda request: httpx.Response(500, stream=json_body({})))
+    batch = ConfigurationBatcher(client)
+    with pytest.raises(AttributeError):
+        batch.list_agents()
+    with pytest.raises(TypeError):
+        batch.update_bot(nickname='Bot')
+    with pytest.raises(TypeError):
+        batch.update_bot(id='bot', headers={})
+    futures = [batch.suspend_agent(id='a'), batch.suspend_agent(id='b')]
+    batch.flush()
+    for future in futures:
+        with pytest.raises(httpx.HTTPStatusError):
+            future.result()
+
+
+def test_calls_sent_after_window():
+    ''' Test if collected calls are sent automatically after the window. '''
+    batches = []
+    client = ConfigurationApi.get_client(token='test', version='3.7')
+    client.session._transport = httpx.MockTransport(batch_handler(batches))
+    batch = ConfigurationBatcher(client, window=0.05)
+    future = batch.approve_agent(id='a@example.com')
+    time.sleep(0.01)
+    assert not batches
+    assert future.result(timeout=5) == {'id': 'a@example.com'}
+    assert batches == [('batch_approve_agents', [{'id': 'a@example.com'}])]
+
+
+def test_async_client_batched():
+    ''' Test if asyncio clients send batches when full, after window and
+        when the context block is left. '''
+    batches = []
+    handle = batch_handler(batches)
+
+    async def ahandle(request: httpx.Request) -> httpx.Response:
+        return handle(request)
+
+    async def main():
+        async with ConfigurationApi.get_async_client(token='test',
+                                                     version='3.7') as client:
+            client.session._transport = httpx.MockTransport(ahandle)
+            async with ConfigurationBatcher(client, max_batch_size=2,
+                                            window=0.01) as batch:
+                futures = [
+                    batch.update_agent(id=f'{number}@example.com')
+                    for number in range(3)
+                ]
+                await asyncio.sleep(0.1)
+                assert len(batches) == 2
+                futures.append(batch.unsuspend_agent(id='u@example.com'))
+                assert isinstance(futures[-1], asyncio.Future)
+            return [await future for future in futures]
+
+    assert asyncio.run(main()) == [{
+        'id': '0@example.com'
+    }, {
+        'id': '1@example.com'
+    }, {
+        'id': '2@example.com'
+    }, {
+        'id': 'u@example.com'
+    }]
+    assert len(batches) == 3
@@ -1,5 +1,7 @@
 ''' Tests for helper methods from livechat.utils. '''
 
+from datetime import datetime, timezone
+
 import pytest
 
 from livechat.utils import helpers
@@ -57,3 +59,17 @@ def test_prepare_payload(parameters, payload):
     ''' Test if `prepare_payload` method returns proper payload basing on
         provided parameters. '''
     assert helpers.prepare_payload(parameters) == payload
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('2024-05-01T10:15:00.000000Z',
+     datetime(2024, 5, 1, 10, 15, tzinfo=timezone.utc)),
+    ('2024-05-01T12:15:00+02:00',
+     datetime(2024, 5, 1, 10, 15, tzinfo=timezone.utc)),
+    ('2024-05-01T10:15:00', datetime(2024, 5, 1, 10, 15)),
+])
+def test_parse_datetime(value, expected):
+    ''' Test if `parse_datetime` accepts `Z` as UTC offset and keeps other offsets. '''
+    assert helpers.parse_datetime(value) == expected
+    assert (helpers.parse_datetime(value).tzinfo is None) == (expected.tzinfo
+                                                              is None)
@@ -0,0 +1,83 @@
+''' Tests for httpx logger. '''
+
+# pylint: disable=W0212,W0621
+
+import json
+import sys
+
+import httpx
+import pytest
+from loguru import logger
+
+from livechat.tests.conftest import StreamedBody
+from livechat.utils.http_client import HttpClient
+from livechat.utils.httpx_logger import HttpxLogger
+
+
+def respond_with(content: bytes):
+    ''' Returns transport responding to every request with `content`. '''
+    return httpx.MockTransport(lambda request: httpx.Response(
+        200, headers={'content-type': 'application/json'}, stream=StreamedBody(content)))
+
+
+@pytest.fixture
+def log_messages():
+    ''' Collects messages logged at INFO or higher level only. '''
+    messages = []
+    logger.remove()
+    handler_id = logger.add(messages.append, level='INFO', format='{message}')
+    yield messages
+    logger.remove(handler_id)
+    logger.add(sys.stderr)
+
+
+def test_details_not_formatted_without_debug_sink(log_messages, monkeypatch):
+    ''' Test if bodies are neither read nor formatted if DEBUG is not accepted. '''
+    formatted = []
+    monkeypatch.setattr(HttpxLogger, '_format_content',
+                        lambda self, content: formatted.append(content))
+    client = HttpClient('test', 'localhost', False)
+    client.session._transport = respond_with(b'{"chats": []}')
+    with client.session.stream('POST', 'https://localhost/list_chats', json={}) as response:
+        assert not hasattr(response, '_content')
+    assert not formatted
+    assert [message.strip() for message in log_messages] == [
+        'POST request to: https://localhost/list_chats',
+        'Response status code: 200'
+    ]
+
+
+def test_details_logged_with_debug_sink():
+    ''' Test if request and response details are logged if DEBUG is accepted. '''
+    messages = []
+    handler_id = logger.add(messages.append, level='DEBUG', format='{message}')
+    try:
+        client = HttpClient('test', 'localhost', False)
+        client.session._transport = respond_with(b'{"chats": []}')
+        client.session.post('https://localhost/list_chats', json={'limit': 1})
+    finally:
+        logger.remove(handler_id)
+    debug = ''.join(messages)
+    assert json.dumps({'limit': 1}, indent=4) in debug
+    assert json.dumps({'chats': []}, indent=4) in debug
+
+
+def test_large_content_truncated_before_formatting(monkeypatch):
+    ''' Test if large payloads are truncated without decoding them as JSON. '''
+    decoded = []
+    monkeypatch.setattr(json, 'loads', lambda content: decoded.append(content))
+    content = json.dumps({'chats': [{'id': str(number)} for number in range(10000)]}).encode()
+    formatted = HttpxLogger()._format_content(content)
+    assert not decoded
+    assert formatted == f'{content[:1000].decode()}... (Truncated)'
+
+
+@pytest.mark.parametrize('content,expected', [
+    (b'{"a": 1}', '{\n    "a": 1\n}'),
+    (b'not json', 'not json'),
+    (b'\xff\xfe', "b'\\xff\\xfe'"),
+    ('ą'.encode() * 600, 'ą' * 500 + '... (Truncated)'),
+])
+def test_format_content(content, expected):
+    ''' Test if content is formatted for logging properly. '''
+    assert HttpxLogger()._format_content(content) == expected
@@ -0,0 +1,71 @@
+''' Tests for import time footprint of the SDK. '''
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_DEPENDENCIES = {'httpx', 'httpcore', 'h2', 'websocket', 'websockets', 'loguru'}
+
+
+def imported_modules(statement: str) -> dict:
+    ''' Runs `statement` with `-X importtime` in a fresh interpreter and returns
+        imported modules mapped to their cumulative import time (in us). '''
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True,
+                            text=True,
+                            check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@pytest.mark.parametrize('module', [
+    'livechat.agent',
+    'livechat.customer',
+    'livechat.configuration',
+    'livechat.reports',
+    'livechat.webhooks.parser',
+])
+def test_import_does_not_load_versions_nor_heavy_dependencies(module):
+    ''' Test if importing entry modules loads neither versioned modules nor
+        heavy third-party dependencies. '''
+    modules = imported_modules(f'import {module}')
+    assert module in modules
+    assert not {name.split('.')[0] for name in modules} & HEAVY_DEPENDENCIES
+    assert not [name for name in modules if name.rsplit('.', 1)[-1].startswith('v3')]
+
+
+def loaded_versions(statement: str) -> list:
+    ''' Runs `statement` in a fresh interpreter and returns names of loaded
+        versioned modules. '''
+    result = subprocess.run([
+        sys.executable, '-c', f'{statement}; import sys; '
+        "print(sorted(name for name in sys.modules if name.rsplit('.', 1)[-1].startswith('v3')))"
+    ],
+                            capture_output=True,
+                            text=True,
+                            check=True)
+    return result.stdout.strip()
+
+
+def test_get_client_loads_requested_version_only():
+    ''' Test if only the requested version module is imported by `get_client`. '''
+    assert loaded_versions(
+        'from livechat.reports.base import ReportsApi; '
+        "ReportsApi.get_client(token='test', version='3.7')"
+    ) == "['livechat.reports.api.v37']"
+
+
+def test_parse_webhook_loads_requested_version_only():
+    ''' Test if only the requested version module is imported by `parse_webhook`. '''
+    assert loaded_versions(
+        'from livechat.webhooks.parser import parse_webhook; '
+        "parse_webhook({'webhook_id': '', 'secret_key': '', 'action': 'chat_deactivated', "
+        "'organization_id': '', 'additional_data': {}, 'payload': {'chat_id': '', 'thread_id': ''}}, "
+        "version='3.6')") == "['livechat.webhooks.v36']"
@@ -0,0 +1,214 @@
+''' Live reports tests. '''
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from livechat.reports.live import LiveReports
+from livechat.webhooks.parser import parse_webhook
+
+STARTED_AT = 1714558500  # 2024-05-01T10:15:00Z
+
+
+def webhook(action: str, payload: dict) -> dict:
+    ''' Returns webhook body of given action. '''
+    return {
+        'webhook_id': '166c029b-a2c6-4010-aa0c-5a984353a7dd',
+        'secret_key': 'top_secret_value',
+        'action': action,
+        'organization_id': 'f9c7cc55-b35a-4e76-b0d5-ae9fce362314',
+        'payload': payload,
+        'additional_data': {}
+    }
+
+
+def incoming_chat(chat_id: str, group_id: int, agent_id: str) -> dict:
+    ''' Returns `incoming_chat` webhook body of a chat started at `STARTED_AT`. '''
+    return webhook(
+        'incoming_chat', {
+            'chat': {
+                'id': chat_id,
+                'users': [{
+                    'id': f'{chat_id}-customer',
+                    'type': 'customer'
+                }, {
+                    'id': agent_id,
+                    'type': 'agent'
+                }],
+                'access': {
+                    'group_ids': [group_id]
+                },
+                'thread': {
+                    'id': 'K600PKZON8',
+                    'created_at': '2024-05-01T10:15:00.000000Z'
+                }
+            }
+        })
+
+
+def message(chat_id: str, author_id: str, created_at: str) -> dict:
+    ''' Returns `incoming_event` webhook body with a message. '''
+    return webhook(
+        'incoming_event', {
+            'chat_id': chat_id,
+            'thread_id': 'K600PKZON8',
+            'event': {
+                'id': created_at,
+                'type': 'message',
+                'text': 'Hello',
+                'author_id': author_id,
+                'created_at': created_at
+            }
+        })
+
+
+@pytest.fixture
+def live_reports() -> LiveReports:
+    ''' Returns live reports fed with two chats, one of them transferred. '''
+    live_reports = LiveReports()
+    updates = [
+        incoming_chat('C1', 0, 'agent@example.com'),
+        incoming_chat('C2', 1, 'other@example.com'),
+        message('C1', 'C1-customer', '2024-05-01T10:15:10Z'),
+        message('C1', 'agent@example.com', '2024-05-01T10:15:40Z'),
+        message('C1', 'C1-customer', '2024-05-01T11:00:00Z'),
+        message('C1', 'C1-customer', '2024-05-01T11:00:05Z'),
+        message('C1', 'agent@example.com', '2024-05-01T11:00:10Z'),
+        webhook(
+            'chat_transferred', {
+                'chat_id': 'C2',
+                'reason': 'manual',
+                'transferred_to': {
+                    'group_ids': [2],
+                    'agent_ids': ['agent@example.com']
+                }
+            }),
+        webhook('chat_access_updated', {
+            'id': 'C1',
+            'access': {}
+        }),
+    ]
+    for body in updates:
+        live_reports.update(parse_webhook(body, '3.7'))
+    live_reports.update(
+        {
+            'action': 'chat_deactivated',
+            'type': 'push',
+            'payload': {
+                'chat_id': 'C1',
+                'thread_id': 'K600PKZON8'
+            }
+        },
+        timestamp=STARTED_AT + 600)
+    live_reports.update(parse_webhook(
+        webhook('chat_deactivated', {
+            'chat_id': 'C2',
+            'thread_id': 'K600PKZON8'
+        }), '3.7',
+        lazy=True),
+                        timestamp=STARTED_AT + 1200)
+    return live_reports
+
+
+def test_reports_shape(live_reports: LiveReports):
+    ''' Test if snapshots are shaped like Reports API responses. '''
+    assert live_reports.total_chats(timezone='Europe/Warsaw') == {
+        'name': 'total_chats',
+        'request': {
+            'distribution': 'day',
+            'timezone': 'Europe/Warsaw',
+            'filters': {}
+        },
+        'records': {
+            '2024-05-01': {
+                'total': 2
+            }
+        },
+        'total': 2
+    }
+    duration = live_reports.duration(distribution='month')
+    assert duration['records'] == {'2024-05': {'count': 2, 'duration': 900}}
+    assert (duration['total'], duration['duration']) == (2, 900)
+
+
+def test_response_times_per_hour(live_reports: LiveReports):
+    ''' Test if response times are measured from the first awaiting customer
+        message and counted in the hour of the response. '''
+    first_response_time = live_reports.first_response_time(distribution='hour')
+    assert first_response_time['records'] == {
+        '2024-05-01 10:00:00': {
+            'count': 1,
+            'first_response_time': 30.0
+        }
+    }
+    response_time = live_reports.response_time(distribution='hour')
+    assert response_time['records'] == {
+        '2024-05-01 10:00:00': {
+            'count': 1,
+            'response_time': 30.0
+        },
+        '2024-05-01 11:00:00': {
+            'count': 1,
+            'response_time': 10.0
+        }
+    }
+    assert response_time['response_time'] == 20.0
+
+
+def test_filters(live_reports: LiveReports):
+    ''' Test if metrics are filtered by time range, groups and agents, with
+        transferred chats finished by the agent they were transferred to. '''
+    by_agent = {'agents': {'values': ['agent@example.com']}}
+    assert live_reports.total_chats(filters=by_agent)['total'] == 1
+    assert live_reports.duration(filters=by_agent)['records'] == {
+        '2024-05-01': {
+            'count': 2,
+            'duration': 900
+        }
+    }
+    assert live_reports.duration(filters={'groups': {
+        'values': [2]
+    }})['duration'] == 1200
+    assert live_reports.response_time(filters={
+        'from': '2024-05-01T10:30:00Z',
+        'to': '2024-05-01T12:00:00Z'
+    })['total'] == 2
+    assert live_reports.response_time(
+        filters={'from': '2024-05-01T11:00:00+00:00'})['total'] == 1
+    assert live_reports.total_chats(filters={
+        'from': '2024-04-01T00:00:00Z',
+        'to': '2024-04-02T00:00:00Z'
+    })['total'] == 0
+    assert live_reports.response_time(filters={
+        'from': '2024-05-01T00:00:00Z',
+        'to': '2024-05-01T10:59:59Z'
+    })['total'] == 1
+    with pytest.raises(ValueError) as exception:
+        live_reports.total_chats(distribution='day', timezone='Asia/Kolkata')
+    assert '`Asia/Kolkata` timezone is not supported' in str(exception.value)
+    with pytest.raises(ValueError) as exception:
+        live_reports.total_chats(distribution='day-hours')
+    assert '`day-hours` distribution is not supported' in str(exception.value)
+
+
+def test_old_hours_are_dropped():
+    ''' Test if counters of hours beyond `retention_hours` are dropped. '''
+    live_reports = LiveReports(retention_hours=2)
+    for number, created_at in enumerate([
+            '2024-05-01T10:15:00Z', '2024-05-01T11:15:00Z',
+            '2024-05-01T12:15:00Z', '2024-05-01T10:45:00Z'
+    ]):
+        body = incoming_chat(f'C{number}', 0, 'agent@example.com')
+        body['payload']['chat']['thread']['created_at'] = created_at
+        live_reports.update(body)
+    assert live_reports.total_chats(distribution='hour')['records'] == {
+        '2024-05-01 11:00:00': {
+            'total': 1
+        },
+        '2024-05-01 12:00:00': {
+            'total': 1
+        }
+    }
+    assert sorted(hour for hour, _, _ in live_reports.counters) == [
+        STARTED_AT // 3600 + 1, STARTED_AT // 3600 + 2
+    ]
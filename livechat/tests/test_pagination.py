@@ -0,0 +1,146 @@
+''' Tests for iterators over paginated list responses. '''
+
+# pylint: disable=E1120,W0212
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from livechat.agent.rtm.base import AgentRTM
+from livechat.agent.web.base import AgentWeb
+from livechat.configuration.base import ConfigurationApi
+from livechat.tests.conftest import json_body
+from livechat.utils.structures import RtmResponse
+
+PAGES = {
+    None: {'chats': [{'id': 'A'}, {'id': 'B'}], 'next_page_id': 'page_2'},
+    'page_2': {'chats': [{'id': 'C'}, {'id': 'D'}], 'next_page_id': 'page_3'},
+    'page_3': {'chats': [{'id': 'E'}], 'next_page_id': None},
+}
+
+
+def json_response(status_code: int, document) -> httpx.Response:
+    ''' Returns response with `document` as its body. '''
+    return httpx.Response(status_code,
+                          headers={'content-type': 'application/json'},
+                          stream=json_body(document))
+
+
+def paginated_archives(requested: list, delay: float = 0):
+    ''' Returns handler serving `PAGES` and recording requested payloads. '''
+    def handle(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        requested.append(payload)
+        time.sleep(delay)
+        return json_response(200, PAGES[payload.get('page_id')])
+
+    return handle
+
+
+def web_client(requested: list, delay: float = 0):
+    ''' Returns Agent Web client served by `paginated_archives`. '''
+    client = AgentWeb.get_client(access_token='test', version='3.7')
+    client.session._transport = httpx.MockTransport(
+        paginated_archives(requested, delay))
+    return client
+
+
+def test_iter_archives():
+    ''' Test if items of all pages are yielded with the same filters for each page. '''
+    requested = []
+    chats = web_client(requested).iter_archives(filters={'query': 'test'},
+                                                limit=2)
+    assert [chat['id'] for chat in chats] == ['A', 'B', 'C', 'D', 'E']
+    assert requested == [
+        {'filters': {'query': 'test'}, 'limit': 2},
+        {'filters': {'query': 'test'}, 'limit': 2, 'page_id': 'page_2'},
+        {'filters': {'query': 'test'}, 'limit': 2, 'page_id': 'page_3'},
+    ]
+
+
+@pytest.mark.parametrize('budget,ids,pages', [
+    ({'max_items': 3}, ['A', 'B', 'C'], 2),
+    ({'max_items': 2}, ['A', 'B'], 1),
+    ({'max_pages': 2}, ['A', 'B', 'C', 'D'], 2),
+    ({'max_items': 10, 'max_pages': 10}, ['A', 'B', 'C', 'D', 'E'], 3),
+])
+def test_iter_archives_within_budget(budget, ids, pages):
+    ''' Test if iteration and fetching stop once the budget is used up. '''
+    requested = []
+    chats = list(web_client(requested).iter_archives(**budget))
+    assert [chat['id'] for chat in chats] == ids
+    assert len(requested) == pages
+
+
+def test_next_page_is_fetched_while_current_is_consumed():
+    ''' Test if fetching the next page overlaps processing of the current one. '''
+    requested = []
+    started = time.perf_counter()
+    for _ in web_client(requested, delay=0.2).iter_archives():
+        time.sleep(0.1)
+    assert time.perf_counter() - started < 0.9  # 1.1 second if not overlapped
+    assert len(requested) == 3
+
+
+def test_async_iter_archives():
+    ''' Test if asyncio client pages are iterated with `async for`. '''
+    requested = []
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        return paginated_archives(requested)(request)
+
+    async def main():
+        async with AgentWeb.get_async_client(access_token='test',
+                                             version='3.7') as client:
+            client.session._transport = httpx.MockTransport(handle)
+            return [chat['id'] async for chat in client.iter_archives(max_items=4)]
+
+    assert asyncio.run(main()) == ['A', 'B', 'C', 'D']
+    assert len(requested) == 2
+
+
+def test_rtm_iter_archives():
+    ''' Test if RTM responses are paginated the same way. '''
+    client = AgentRTM.get_client(version='3.7')
+    sending_threads = set()
+
+    def send(request):
+        sending_threads.add(threading.get_ident())
+        return RtmResponse({
+            'action': request['action'],
+            'success': True,
+            'payload': PAGES[request['payload'].get('page_id')]
+        })
+
+    client.ws.send = send
+    assert [chat['id'] for chat in client.iter_archives()] == ['A', 'B', 'C', 'D', 'E']
+    assert threading.get_ident() not in sending_threads
+
+
+def test_failed_page_request():
+    ''' Test if errors are raised instead of ending iteration silently. '''
+    client = ConfigurationApi.get_client(token='test', version='3.7')
+    client.session._transport = httpx.MockTransport(
+        lambda request: json_response(401, {'error': {'type': 'authentication'}}))
+    with pytest.raises(httpx.HTTPStatusError):
+        list(client.iter_greetings())
+
+    rtm_client = AgentRTM.get_client(version='3.7')
+    rtm_client.ws.send = lambda request: RtmResponse({
+        'action': 'list_chats', 'success': False, 'payload': {'error': {'type': 'validation'}}
+    })
+    with pytest.raises(RuntimeError) as exception:
+        list(rtm_client.iter_chats())
+    assert str(exception.value) == "`list_chats` request failed: {'error': {'type': 'validation'}}"
+
+
+def test_wrong_loop_type():
+    ''' Test if iterating asyncio client pages with `for` loop is reported. '''
+    client = AgentWeb.get_async_client(access_token='test', version='3.7')
+    with pytest.raises(TypeError) as exception:
+        list(client.iter_chats())
+    assert str(exception.value) == 'Use `async for` loop with asyncio clients.'
@@ -0,0 +1,113 @@
+''' Tests for concurrent fetching of many reports. '''
+
+# pylint: disable=W0212
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from livechat.reports.base import ReportsApi
+from livechat.tests.conftest import json_body
+
+REPORTS = ['duration', 'total_chats', 'ratings', 'forms', 'tags', 'groups']
+FILTERS = {'from': '2024-05-01T00:00:00Z', 'to': '2024-05-07T23:59:59Z'}
+
+
+class InFlight:
+    ''' Records requested payloads and the maximum number of requests in flight. '''
+    def __init__(self):
+        self.requested = {}
+        self.current = 0
+        self.max = 0
+        self.lock = threading.Lock()
+
+    def enter(self, request: httpx.Request) -> str:
+        report = request.url.path.rsplit('/', 1)[-1]
+        with self.lock:
+            self.requested[report] = json.loads(request.content)
+            self.current += 1
+            self.max = max(self.max, self.current)
+        return report
+
+    def leave(self, report: str) -> httpx.Response:
+        with self.lock:
+            self.current -= 1
+        if report == 'groups':
+            raise httpx.ConnectError('Connection refused')
+        return httpx.Response(200,
+                              headers={'content-type': 'application/json'},
+                              stream=json_body({'name': report}))
+
+
+def test_reports_fetched_concurrently():
+    ''' Test if reports are requested by threads within concurrency cap, with shared
+        parameters passed to reports accepting them. '''
+    in_flight = InFlight()
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        report = in_flight.enter(request)
+        time.sleep(0.1)
+        return in_flight.leave(report)
+
+    client = ReportsApi.get_client(token='test', version='3.7')
+    client.session._transport = httpx.MockTransport(handle)
+    started = time.perf_counter()
+    result = client.fetch_reports(REPORTS,
+                                  distribution='hour',
+                                  filters=FILTERS,
+                                  max_concurrency=3,
+                                  return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    assert list(result) == REPORTS
+    assert result['duration'].json() == {'name': 'duration'}
+    assert isinstance(result['groups'], httpx.ConnectError)
+    assert in_flight.max == 3
+    assert 0.2 <= elapsed < 0.3
+    assert set(result.timings) == set(REPORTS)
+    assert all(timing >= 0.1 for timing in result.timings.values())
+    assert in_flight.requested['total_chats'] == {
+        'distribution': 'hour',
+        'filters': FILTERS
+    }
+    assert in_flight.requested['forms'] == {'filters': FILTERS}
+    with pytest.raises(httpx.ConnectError):
+        client.fetch_reports(['groups', 'tags'])
+
+
+def test_reports_fetched_concurrently_with_async_client():
+    ''' Test if reports are requested by asyncio tasks within concurrency cap. '''
+    in_flight = InFlight()
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        report = in_flight.enter(request)
+        await asyncio.sleep(0.1)
+        return in_flight.leave(report)
+
+    async def main():
+        async with ReportsApi.get_async_client(token='test',
+                                               version='3.7') as client:
+            client.session._transport = httpx.MockTransport(handle)
+            result = await client.fetch_reports(REPORTS[:4],
+                                                timezone='Europe/Warsaw',
+                                                max_concurrency=2)
+            with pytest.raises(httpx.ConnectError):
+                await client.fetch_reports(['groups'])
+            return result
+
+    result = asyncio.run(main())
+    assert [response.json()['name'] for response in result.values()] == REPORTS[:4]
+    assert in_flight.max == 2
+    assert all(timing >= 0.1 for timing in result.timings.values())
+    assert in_flight.requested['ratings'] == {'timezone': 'Europe/Warsaw'}
+
+
+def test_invalid_report_name():
+    ''' Test if invalid report names are rejected before sending requests. '''
+    client = ReportsApi.get_client(token='test', version='3.7')
+    with pytest.raises(ValueError) as exception:
+        client.fetch_reports(['duration', 'modify_header'])
+    assert str(exception.value) == '`modify_header` is invalid report name.'
@@ -0,0 +1,174 @@
+''' Tests for cache of Reports API responses. '''
+
+# pylint: disable=W0212
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from livechat.reports.base import ReportsApi
+from livechat.reports.cache import ReportsCache
+from livechat.tests.conftest import json_body
+
+CLOSED = {'from': '2024-05-01T00:00:00Z', 'to': '2024-05-07T23:59:59Z'}
+
+
+def reports_handler(requested: list, status_code: int = 200):
+    ''' Returns handler responding with requested report's name and payload. '''
+    def handle(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        requested.append(payload)
+        return httpx.Response(status_code,
+                              headers={'content-type': 'application/json'},
+                              stream=json_body({
+                                  'name': request.url.path.rsplit('/', 1)[-1],
+                                  'request': payload
+                              }))
+
+    return handle
+
+
+def client(cache: ReportsCache, requested: list, token: str = 'test'):
+    ''' Returns Reports API client with given cache served by `reports_handler`
+        (session of such client is a proxy of the original one in `_session`). '''
+    reports_api = ReportsApi.get_client(token=token, version='3.7', cache=cache)
+    reports_api.session._session._transport = httpx.MockTransport(
+        reports_handler(requested))
+    return reports_api
+
+
+def test_closed_ranges_cached_in_memory():
+    ''' Test if only reports of closed ranges are cached, keyed on endpoint,
+        parameters and token. '''
+    cache = ReportsCache()
+    requested = []
+    reports_api = client(cache, requested)
+    first = reports_api.duration(distribution='day', filters=CLOSED)
+    cached = reports_api.duration(filters=CLOSED, distribution='day')
+    assert cached.json() == first.json()
+    assert cached.elapsed == timedelta(0)
+    reports_api.duration(distribution='hour', filters=CLOSED)
+    reports_api.total_chats(distribution='day', filters=CLOSED)
+    client(cache, requested, 'other').duration(distribution='day',
+                                               filters=CLOSED)
+    reports_api.duration()
+    reports_api.duration()
+    ongoing = {
+        'to': (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
+    }
+    reports_api.duration(filters=ongoing)
+    reports_api.duration(filters=ongoing)
+    assert len(requested) == 8
+    assert cache.stats() == {
+        'memory_hits': 1,
+        'disk_hits': 0,
+        'misses': 4,
+        'uncacheable': 4,
+        'hit_ratio': 0.2
+    }
+
+
+def test_failed_responses_not_cached():
+    ''' Test if unsuccessful responses are not cached. '''
+    cache = ReportsCache()
+    requested = []
+    reports_api = ReportsApi.get_client(token='test', version='3.7', cache=cache)
+    reports_api.session._session._transport = httpx.MockTransport(
+        reports_handler(requested, 429))
+    for _ in range(2):
+        assert reports_api.ratings(filters=CLOSED).status_code == 429
+    assert len(requested) == 2
+
+
+def test_memory_tier_bounded_and_disk_tier_shared(tmp_path):
+    ''' Test if the least recently used responses are evicted from memory
+        and served from disk, also by other cache instances. '''
+    cache = ReportsCache(max_entries=1, directory=tmp_path)
+    requested = []
+    reports_api = client(cache, requested)
+    reports_api.duration(filters=CLOSED)
+    reports_api.ratings(filters=CLOSED)
+    assert reports_api.duration(filters=CLOSED).json()['name'] == 'duration'
+    assert len(requested) == 2
+    assert cache.stats()['disk_hits'] == 1
+    other_cache = ReportsCache(directory=tmp_path)
+    client(other_cache, requested).ratings(filters=CLOSED)
+    assert len(requested) == 2
+    other_cache.clear()
+    assert not list(tmp_path.iterdir())
+
+
+def test_async_client_cached():
+    ''' Test if asyncio clients are served from cache, also in bulk requests. '''
+    cache = ReportsCache()
+    requested = []
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        return reports_handler(requested)(request)
+
+    async def main():
+        async with ReportsApi.get_async_client(token='test',
+                                               version='3.7',
+                                               cache=cache) as reports_api:
+            reports_api.session._session._transport = httpx.MockTransport(handle)
+            await reports_api.tags(filters=CLOSED)
+            return await reports_api.fetch_reports(['tags', 'ratings'],
+                                                   filters=CLOSED)
+
+    result = asyncio.run(main())
+    assert result['tags'].json()['name'] == 'tags'
+    assert len(requested) == 2
+    assert cache.stats()['memory_hits'] == 1
+
+
+def test_async_client_disk_tier_off_event_loop(tmp_path, monkeypatch):
+    ''' Test if asyncio clients read and write the on-disk tier in worker threads. '''
+    cache = ReportsCache(max_entries=1, directory=tmp_path)
+    requested = []
+    disk_threads = []
+    for name in ('_read', '_write'):
+        method = getattr(cache, name)
+
+        def in_thread(*args, method=method):
+            disk_threads.append(threading.get_ident())
+            return method(*args)
+
+        monkeypatch.setattr(cache, name, in_thread)
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        return reports_handler(requested)(request)
+
+    async def main():
+        async with ReportsApi.get_async_client(token='test',
+                                               version='3.7',
+                                               cache=cache) as reports_api:
+            reports_api.session._session._transport = httpx.MockTransport(handle)
+            await reports_api.tags(filters=CLOSED)
+            await reports_api.ratings(filters=CLOSED)
+            return await reports_api.tags(filters=CLOSED)
+
+    assert asyncio.run(main()).json()['name'] == 'tags'
+    assert len(requested) == 2
+    assert cache.stats()['disk_hits'] == 1
+    assert len(disk_threads) == 5
+    assert threading.get_ident() not in disk_threads
+
+
+def test_naive_range_end_in_requested_timezone():
+    ''' Test if range end without offset is interpreted in requested timezone
+        and `Z` is accepted as UTC offset. '''
+    cache = ReportsCache(min_age=0)
+    ended = (datetime.now(timezone.utc) -
+             timedelta(minutes=30)).replace(tzinfo=None).isoformat()
+    assert cache.is_closed_range({'filters': {'to': ended}})
+    assert not cache.is_closed_range({
+        'filters': {
+            'to': ended
+        },
+        'timezone': 'America/Los_Angeles'
+    })
+    assert not cache.is_closed_range({'filters': {'to': 'yesterday'}})
+    assert cache.is_closed_range({'filters': {'to': '2024-05-07T23:59:59Z'}})
@@ -0,0 +1,72 @@
+''' Tests for columnar representation of Reports API distributions. '''
+
+import math
+from array import array
+
+import pytest
+
+from livechat.reports.columnar import to_columns
+
+REPORT = {
+    'name': 'duration',
+    'records': {
+        '2024-05-02': {
+            'count': 3,
+            'duration': 20.5,
+            'agents': {
+                'a@example.com': {
+                    'count': 2
+                }
+            }
+        },
+        '2024-05-01': {
+            'count': 1,
+            'duration': 10,
+            'agents': {
+                'b@example.com': {
+                    'count': 1
+                }
+            }
+        },
+        '2024-05-03': {
+            'count': 0
+        }
+    },
+    'total': 4
+}
+
+
+def test_to_columns_with_array_backend():
+    ''' Test if buckets are sorted and metrics converted to typed arrays. '''
+    columns = to_columns(REPORT, backend='array')
+    assert columns.name == 'duration'
+    assert columns.index == ['2024-05-01', '2024-05-02', '2024-05-03']
+    assert list(columns) == [
+        'agents.a@example.com.count', 'agents.b@example.com.count', 'count',
+        'duration'
+    ]
+    assert columns['count'] == array('q', [1, 3, 0])
+    assert columns['duration'].typecode == 'd'
+    assert columns['duration'][:2] == array('d', [10, 20.5])
+    assert math.isnan(columns['duration'][2])
+    assert columns.sum('duration') == 30.5
+    assert columns.sum('count') == 4
+    assert list(columns.select('agents.')) == [
+        'a@example.com.count', 'b@example.com.count'
+    ]
+    assert columns.nbytes == 4 * 3 * 8
+    assert list(
+        to_columns(REPORT, metrics=['count', 'missing'],
+                   backend='array')) == ['count', 'missing']
+    with pytest.raises(ValueError):
+        to_columns(REPORT, backend='pandas')
+
+
+def test_to_columns_with_numpy_backend():
+    ''' Test if NumPy arrays are used when NumPy is installed. '''
+    numpy = pytest.importorskip('numpy')
+    columns = to_columns(REPORT)
+    assert columns.backend == 'numpy'
+    assert columns['count'].dtype == numpy.int64
+    assert columns['duration'].dtype == numpy.float64
+    assert columns.sum('duration') == 30.5
@@ -0,0 +1,183 @@
+''' Tests for sharding of Reports API date ranges. '''
+
+# pylint: disable=W0212
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from livechat.reports.base import ReportsApi
+from livechat.reports.sharding import merge_reports, split_range
+from livechat.tests.conftest import json_body
+
+FILTERS = {
+    'from': '2024-01-01T00:00:00+01:00',
+    'to': '2024-03-31T23:59:59+01:00',
+    'groups': {
+        'values': [0]
+    }
+}
+
+
+def duration_report(request: httpx.Request) -> httpx.Response:
+    ''' Returns `duration` report with 2 chats per day of the requested range,
+        lasting as many seconds as the day of month. '''
+    payload = json.loads(request.content)
+    day = datetime.fromisoformat(payload['filters']['from'])
+    until = datetime.fromisoformat(payload['filters']['to'])
+    records = {}
+    while day <= until:
+        records[day.strftime('%Y-%m-%d')] = {'count': 2, 'duration': day.day}
+        day += timedelta(days=1)
+    count = 2 * len(records)
+    return httpx.Response(
+        200,
+        headers={'content-type': 'application/json'},
+        stream=json_body({
+            'name': 'duration',
+            'request': payload,
+            'records': records,
+            'total': count,
+            'duration': sum(record['duration']
+                            for record in records.values()) * 2 / count
+        }))
+
+
+def test_split_range():
+    ''' Test if ranges are split into consecutive sub-ranges keeping offsets. '''
+    assert split_range('2024-01-01T00:00:00+01:00', '2024-01-05T12:00:00+01:00',
+                       2) == [
+                           ('2024-01-01T00:00:00+01:00',
+                            '2024-01-02T23:59:59+01:00'),
+                           ('2024-01-03T00:00:00+01:00',
+                            '2024-01-04T23:59:59+01:00'),
+                           ('2024-01-05T00:00:00+01:00',
+                            '2024-01-05T12:00:00+01:00'),
+                       ]
+    assert split_range('2024-01-01T00:00:00Z', '2024-01-01T10:00:00Z',
+                       31) == [('2024-01-01T00:00:00+00:00',
+                                '2024-01-01T10:00:00Z')]
+    with pytest.raises(ValueError):
+        split_range('2024-01-02T00:00:00Z', '2024-01-01T00:00:00Z', 1)
+    with pytest.raises(ValueError):
+        split_range('2024-01-01T00:00:00Z', '2024-01-02T00:00:00Z', 0)
+
+
+def test_merge_reports():
+    ''' Test if counts are summed and averages recomputed for buckets present
+        in many reports, also in nested records. '''
+    merged = merge_reports([{
+        'name': 'duration',
+        'records': {
+            '2024-01': {
+                'count': 1,
+                'duration': 10,
+                'agents': {
+                    'a': {
+                        'count': 1,
+                        'duration': 10
+                    }
+                }
+            }
+        },
+        'total': 1,
+        'duration': 10
+    }, {
+        'name': 'duration',
+        'records': {
+            '2024-01': {
+                'count': 3,
+                'duration': 30,
+                'agents': {
+                    'a': {
+                        'count': 3,
+                        'duration': 30
+                    }
+                }
+            },
+            '2024-02': {
+                'count': 0,
+                'duration': 0
+            }
+        },
+        'total': 3,
+        'duration': 30
+    }])
+    assert merged == {
+        'name': 'duration',
+        'records': {
+            '2024-01': {
+                'count': 4,
+                'duration': 25,
+                'agents': {
+                    'a': {
+                        'count': 4,
+                        'duration': 25
+                    }
+                }
+            },
+            '2024-02': {
+                'count': 0,
+                'duration': 0
+            }
+        },
+        'total': 4,
+        'duration': 25
+    }
+    assert merge_reports([]) == {'records': {}}
+
+
+def test_fetch_report_sharded():
+    ''' Test if sub-ranges are requested and merged into the report of the whole range. '''
+    requested = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requested.append(json.loads(request.content))
+        return duration_report(request)
+
+    reports_api = ReportsApi.get_client(token='test', version='3.7')
+    reports_api.session._transport = httpx.MockTransport(handle)
+    report = reports_api.fetch_report_sharded('duration',
+                                              FILTERS,
+                                              distribution='day',
+                                              shard_days=30)
+    whole_range = duration_report(
+        httpx.Request('POST',
+                      'https://example.com',
+                      json={
+                          'distribution': 'day',
+                          'filters': FILTERS
+                      })).read()
+    assert report == json.loads(whole_range)
+    assert len(report['records']) == 91
+    assert len(requested) == 4
+    assert all(payload['filters']['groups'] == {'values': [0]}
+               for payload in requested)
+
+
+def test_fetch_report_sharded_with_async_client():
+    ''' Test if asyncio clients fetch sub-ranges and report failed ones. '''
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content)['filters']['from'].startswith('2024-03'):
+            return httpx.Response(504, stream=json_body({}))
+        return duration_report(request)
+
+    async def main():
+        async with ReportsApi.get_async_client(token='test',
+                                               version='3.7') as reports_api:
+            reports_api.session._transport = httpx.MockTransport(handle)
+            report = await reports_api.fetch_report_sharded(
+                'duration', {
+                    **FILTERS, 'to': '2024-02-29T23:59:59+01:00'
+                },
+                max_concurrency=2)
+            with pytest.raises(httpx.HTTPStatusError):
+                await reports_api.fetch_report_sharded('duration', FILTERS)
+            return report
+
+    report = asyncio.run(main())
+    assert report['total'] == 120
+    assert report['request']['filters']['to'] == '2024-02-29T23:59:59+01:00'
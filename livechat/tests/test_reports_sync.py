@@ -0,0 +1,170 @@
+''' Tests for incremental synchronization of Reports API data. '''
+
+# pylint: disable=W0212
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from livechat.reports.base import ReportsApi
+from livechat.reports.sync import ReportRow, ReportsSync, flatten
+from livechat.tests.conftest import json_body
+
+
+def total_chats(requested: list):
+    ''' Returns handler responding with `total_chats` report with a chat
+        per hour of the requested range. '''
+    def handle(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        requested.append(payload['filters'])
+        hour = datetime.fromisoformat(payload['filters']['from'])
+        until = datetime.fromisoformat(payload['filters']['to'])
+        records = {}
+        while hour <= until:
+            records[hour.strftime('%Y-%m-%d %H:00')] = {'total': 1}
+            hour += timedelta(hours=1)
+        return httpx.Response(200,
+                              headers={'content-type': 'application/json'},
+                              stream=json_body({
+                                  'name': 'total_chats',
+                                  'request': payload,
+                                  'records': records,
+                                  'total': len(records)
+                              }))
+
+    return handle
+
+
+def test_flatten():
+    ''' Test if numeric values of records, also nested ones, become rows. '''
+    assert list(
+        flatten('chatting_time', 1, None, {
+            'records': {
+                '2024-05-01': {
+                    'seconds': 30,
+                    'agents': {
+                        'a@example.com': {
+                            'seconds': 20.5
+                        }
+                    },
+                    'comment': 'skipped'
+                }
+            }
+        })) == [
+            ReportRow('chatting_time', '2024-05-01', 1, None, 'seconds', 30),
+            ReportRow('chatting_time', '2024-05-01', 1, None,
+                      'agents.a@example.com.seconds', 20.5),
+        ]
+
+
+def test_sync_fetches_only_new_and_not_final_buckets(tmp_path):
+    ''' Test if watermarks are persisted and subsequent runs fetch only
+        buckets which were not final. '''
+    requested = []
+    now = datetime(2024, 5, 2, 12, 30, tzinfo=timezone.utc)
+    reports_api = ReportsApi.get_client(token='test', version='3.7')
+    reports_api.session._transport = httpx.MockTransport(
+        total_chats(requested))
+
+    def sync():
+        return ReportsSync(reports_api, ['total_chats'],
+                           tmp_path / 'watermarks.json',
+                           groups=[0, 1],
+                           initial_days=1,
+                           now=lambda: now)
+
+    rows = list(sync().run())
+    assert len(requested) == 4
+    assert requested[0] == {
+        'groups': {
+            'values': [0]
+        },
+        'from': '2024-05-01T12:00:00+00:00',
+        'to': '2024-05-02T10:59:59+00:00'
+    }
+    assert requested[1]['from'] == '2024-05-02T11:00:00+00:00'
+    assert len(rows) == 2 * 25
+    assert rows[0] == ReportRow('total_chats', '2024-05-01 12:00', 0, None,
+                                'total', 1)
+    assert json.loads((tmp_path / 'watermarks.json').read_text()) == {
+        'total_chats/group=0/agent=None': '2024-05-02T11:00:00+00:00',
+        'total_chats/group=1/agent=None': '2024-05-02T11:00:00+00:00',
+    }
+
+    requested.clear()
+    now += timedelta(hours=2)
+    rows = list(sync().run())
+    assert [filters['from'] for filters in requested] == [
+        '2024-05-02T11:00:00+00:00', '2024-05-02T13:00:00+00:00'
+    ] * 2
+    assert sorted({row.bucket for row in rows}) == [
+        '2024-05-02 11:00', '2024-05-02 12:00', '2024-05-02 13:00',
+        '2024-05-02 14:00'
+    ]
+
+
+def test_sync_from_stored_watermark(tmp_path):
+    ''' Test if stored watermarks, also with `Z` offset, are resumed from. '''
+    requested = []
+    (tmp_path / 'watermarks.json').write_text(
+        json.dumps({'total_chats/group=None/agent=None': '2024-05-02T09:00:00Z'}))
+    reports_api = ReportsApi.get_client(token='test', version='3.7')
+    reports_api.session._transport = httpx.MockTransport(
+        total_chats(requested))
+    rows = list(
+        ReportsSync(
+            reports_api, ['total_chats'],
+            tmp_path / 'watermarks.json',
+            now=lambda: datetime(2024, 5, 2, 12, 30, tzinfo=timezone.utc)).run())
+    assert requested[0]['from'] == '2024-05-02T09:00:00+00:00'
+    assert len(rows) == 4
+
+
+def test_watermark_not_moved_on_failure(tmp_path):
+    ''' Test if watermark is kept when the final range failed to be fetched. '''
+    reports_api = ReportsApi.get_client(token='test', version='3.7')
+    reports_api.session._transport = httpx.MockTransport(
+        lambda request: httpx.Response(500, stream=json_body({})))
+    sync = ReportsSync(reports_api, ['total_chats'],
+                       tmp_path / 'watermarks.json')
+    with pytest.raises(httpx.HTTPStatusError):
+        list(sync.run())
+    assert not (tmp_path / 'watermarks.json').exists()
+    with pytest.raises(ValueError):
+        ReportsSync(reports_api, ['total_chats'],
+                    tmp_path / 'watermarks.json',
+                    distribution='day-hours')
+
+
+def test_sync_with_async_client(tmp_path):
+    ''' Test if asyncio clients are synchronized with `arun`. '''
+    requested = []
+    handle = total_chats(requested)
+
+    async def ahandle(request: httpx.Request) -> httpx.Response:
+        return handle(request)
+
+    async def main():
+        async with ReportsApi.get_async_client(token='test',
+                                               version='3.7') as reports_api:
+            reports_api.session._transport = httpx.MockTransport(ahandle)
+            sync = ReportsSync(
+                reports_api, ['total_chats'],
+                tmp_path / 'watermarks.json',
+                distribution='day',
+                timezone='Europe/Warsaw',
+                agents=['a@example.com'],
+                now=lambda: datetime(2024, 5, 2, 12, 30, tzinfo=timezone.utc))
+            with pytest.raises(TypeError):
+                list(sync.run())
+            return [row async for row in sync.arun()]
+
+    rows = asyncio.run(main())
+    assert requested[0]['agents'] == {'values': ['a@example.com']}
+    assert requested[0]['from'] == '2024-04-02T00:00:00+02:00'
+    assert requested[0]['to'] == '2024-05-01T23:59:59+02:00'
+    assert requested[1]['from'] == '2024-05-02T00:00:00+02:00'
+    assert {row.agent for row in rows} == {'a@example.com'}
@@ -0,0 +1,123 @@
+''' Tests for streaming mode of Web API clients. '''
+
+# pylint: disable=E1120,W0212
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from loguru import logger
+
+from livechat.agent.web.base import AgentWeb
+from livechat.reports.base import ReportsApi
+from livechat.tests.conftest import StreamedBody
+from livechat.utils.streaming import (JsonItemsParser, aiter_json_items,
+                                      iter_json_items)
+
+CHATS = [{'id': f'chat_{number}', 'thread': {'events': []}} for number in range(2000)]
+ARCHIVES = json.dumps({
+    'found_chats': len(CHATS),
+    'chats': CHATS,
+    'next_page_id': 'MTUxNzM5ODEzMTQ5Ng=='
+}).encode()
+REPORT = json.dumps({
+    'name': 'duration',
+    'records': {
+        '2020-05-01': {'agents_chatting_duration': 120},
+        '2020-05-02': {'agents_chatting_duration': 30}
+    },
+    'total': 150
+}).encode()
+
+
+def transport_for(body: StreamedBody) -> httpx.MockTransport:
+    ''' Returns transport responding to every request with `body`. '''
+    return httpx.MockTransport(lambda request: httpx.Response(
+        200, headers={'content-type': 'application/json'}, stream=body))
+
+
+def test_streamed_response_is_not_buffered():
+    ''' Test if items are parsed while the body is being received. '''
+    body = StreamedBody(ARCHIVES, 512)
+    client = AgentWeb.get_client(access_token='test')
+    client.session._transport = transport_for(body)
+    response = client.streaming().list_archives()
+    assert body.sent == 0
+    chats = iter_json_items(response, 'chats')
+    assert next(chats) == CHATS[0]
+    assert body.sent < len(ARCHIVES)
+    assert list(chats) == CHATS[1:]
+    assert response.is_closed
+    assert not hasattr(response, '_content')
+
+
+def test_client_keeps_buffering_outside_of_streaming_mode():
+    ''' Test if streaming view does not change the client it was created from. '''
+    client = AgentWeb.get_client(access_token='test')
+    client.session._transport = transport_for(StreamedBody(ARCHIVES, 512))
+    client.streaming()
+    assert client.list_archives().json()['chats'] == CHATS
+
+
+def test_only_beginning_of_streamed_content_is_logged():
+    ''' Test if logging sees a capped prefix of the streamed body. '''
+    messages = []
+    handler_id = logger.add(messages.append, level='DEBUG', format='{message}')
+    try:
+        client = AgentWeb.get_client(access_token='test')
+        client.session._transport = transport_for(StreamedBody(ARCHIVES, 512))
+        response = client.streaming().list_archives()
+        assert sum(1 for _ in iter_json_items(response, 'chats')) == len(CHATS)
+    finally:
+        logger.remove(handler_id)
+    content_log = next(message for message in messages
+                       if message.startswith('Response content:'))
+    assert content_log.strip() == f'Response content:\n{ARCHIVES[:1000].decode()}... (Truncated)'
+
+
+def test_async_streamed_report_records():
+    ''' Test if report records are iterated from streamed response of asyncio client. '''
+    async def main():
+        async with ReportsApi.get_async_client(token='test') as client:
+            client.session._transport = transport_for(StreamedBody(REPORT, 16))
+            response = await client.streaming().duration()
+            return [record async for record in aiter_json_items(response, 'records')]
+
+    assert asyncio.run(main()) == list(json.loads(REPORT)['records'].items())
+
+
+@pytest.mark.parametrize('document,key', [
+    ([1, 22.5, -333, 'a"],', None, [], {}, True], None),
+    ({'first': {'a': [1]}, 'second': 2}, None),
+    ({'chats': [{'id': 1}, {'id': 2}], 'next_page_id': None}, 'chats'),
+    ({'found_chats': 0, 'chats': [], 'previous_page_id': 'x'}, 'chats'),
+])
+@pytest.mark.parametrize('chunk_size', [1, 3, 1000])
+def test_json_items_parser(document, key, chunk_size):
+    ''' Test if items are parsed regardless of how the document is split. '''
+    text = json.dumps(document, indent=2)
+    parser = JsonItemsParser(key)
+    items = []
+    for start in range(0, len(text), chunk_size):
+        items.extend(parser.feed(text[start:start + chunk_size]))
+    items.extend(parser.close())
+    container = document if key is None else document[key]
+    expected = list(container.items()) if isinstance(container, dict) else container
+    assert items == expected
+
+
+@pytest.mark.parametrize('text,key,message', [
+    ('{"error": {"type": "authentication"}}', 'chats',
+     'Key `chats` not found in the document.'),
+    ('{"chats": [{"id": 1}', 'chats', 'Incomplete JSON document.'),
+    ('{"chats": 5}', 'chats', 'Expected one of `[{`, got `5`.'),
+    ('[1, 2] [3]', None, 'Extra data after JSON document.'),
+])
+def test_json_items_parser_errors(text, key, message):
+    ''' Test if malformed documents are reported. '''
+    parser = JsonItemsParser(key)
+    with pytest.raises(ValueError) as exception:
+        parser.feed(text)
+        parser.close()
+    assert str(exception.value) == message
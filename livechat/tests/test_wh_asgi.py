@@ -0,0 +1,129 @@
+''' Webhooks ASGI receiver tests. '''
+
+import asyncio
+import json
+
+from livechat.webhooks.asgi import WebhookReceiver
+
+
+async def post(app: WebhookReceiver, body: bytes, method: str = 'POST') -> int:
+    ''' Sends request to `app` (with body split in two chunks) and returns
+        response status. '''
+    chunks = [{
+        'type': 'http.request',
+        'body': body[:10],
+        'more_body': True
+    }, {
+        'type': 'http.request',
+        'body': body[10:]
+    }]
+    sent = []
+
+    async def receive():
+        return chunks.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app({'type': 'http', 'method': method, 'path': '/'}, receive, send)
+    return sent[0]['status']
+
+
+def test_webhooks_acknowledged_and_handled(incoming_event_body: dict):
+    ''' Test if valid webhooks are acknowledged before they are handled. '''
+    received = []
+
+    async def handler(webhook):
+        received.append(webhook)
+
+    async def main():
+        app = WebhookReceiver(['previous_secret', 'top_secret_value'],
+                              handler,
+                              version='3.7')
+        status = await post(app, json.dumps(incoming_event_body).encode())
+        handled_before_ack = len(received)
+        await app.stop()
+        return status, handled_before_ack, app.stats()
+
+    status, handled_before_ack, stats = asyncio.run(main())
+    assert status == 200
+    assert handled_before_ack == 0
+    assert received[0].payload.event['id'] == 'Q20N9CKRX2_1'
+    assert stats == {
+        'received': 1,
+        'rejected': 0,
+        'overflowed': 0,
+        'handled': 1,
+        'errors': 0,
+        'pending': 0
+    }
+
+
+def test_invalid_requests_rejected(incoming_event_body: dict):
+    ''' Test if requests with invalid secret, body or method are rejected. '''
+    queue = asyncio.Queue()
+    app = WebhookReceiver(['top_secret_value'],
+                          queue,
+                          version='3.7',
+                          max_body_size=2000)
+    forged = dict(incoming_event_body, secret_key='top_secret_valuE')
+
+    async def main():
+        return [
+            await post(app, json.dumps(forged).encode()),
+            await post(app, json.dumps(dict(incoming_event_body, secret_key=1)).encode()),
+            await post(app, b'{"secret_key": "top_secret_value"'),
+            await post(app, json.dumps(incoming_event_body).encode(), 'GET'),
+            await post(app, b' ' * 2001),
+        ]
+
+    assert asyncio.run(main()) == [401, 401, 400, 405, 413]
+    assert app.stats()['rejected'] == 3
+    assert queue.empty()
+
+
+def test_invalid_webhook_counted_after_ack(incoming_event_body: dict):
+    ''' Test if webhooks failing parsing are acknowledged and counted as errors,
+        and if requests are answered with 503 while the queue is full. '''
+    queue = asyncio.Queue()
+    invalid = dict(incoming_event_body, action='unknown_action')
+
+    async def main():
+        app = WebhookReceiver(['top_secret_value'],
+                              queue,
+                              version='3.7',
+                              max_pending=1)
+        statuses = [
+            await post(app, json.dumps(invalid).encode()),
+            await post(app, json.dumps(incoming_event_body).encode()),
+        ]
+        await app.stop()
+        return statuses, app.stats()
+
+    statuses, stats = asyncio.run(main())
+    assert statuses == [200, 503]
+    assert stats['errors'] == 1
+    assert stats['overflowed'] == 1
+    assert stats['received'] == 1
+    assert queue.empty()
+
+
+def test_lifespan(incoming_event_body: dict):
+    ''' Test if background task is started and drained by lifespan events. '''
+    received = []
+    messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+    sent = []
+
+    async def receive():
+        message = messages.pop(0)
+        if message['type'] == 'lifespan.shutdown':
+            await post(app, json.dumps(incoming_event_body).encode())
+        return message
+
+    async def send(message):
+        sent.append(message['type'])
+
+    app = WebhookReceiver(['top_secret_value'], received.append, version='3.7')
+    asyncio.run(app({'type': 'lifespan'}, receive, send))
+    assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+    assert len(received) == 1
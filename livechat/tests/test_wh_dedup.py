@@ -0,0 +1,97 @@
+''' Webhooks deduplication tests. '''
+
+import copy
+import time
+
+from livechat.webhooks.dedup import (MemoryDedupBackend, SetNxDedupBackend,
+                                     WebhookDeduplicator)
+from livechat.webhooks.dispatcher import WebhookDispatcher
+from livechat.webhooks.parser import parse_webhook
+
+
+class StandInSharedStore:
+    ''' Minimal stand-in of a Redis-compatible client shared by many processes. '''
+    def __init__(self):
+        self.keys = {}
+
+    def set(self, name, value, ex=None, nx=False):
+        if nx and name in self.keys:
+            return None
+        self.keys[name] = (value, ex)
+        return True
+
+
+def test_repeated_delivery_detected(incoming_event_body: dict):
+    ''' Test if repeated deliveries are detected for bodies and parsed webhooks. '''
+    deduplicator = WebhookDeduplicator()
+    other_event = copy.deepcopy(incoming_event_body)
+    other_event['payload']['event']['id'] = 'Q20N9CKRX2_2'
+    assert deduplicator.is_duplicate(incoming_event_body) is False
+    assert deduplicator.is_duplicate(copy.deepcopy(incoming_event_body)) is True
+    assert deduplicator.is_duplicate(parse_webhook(incoming_event_body, '3.7')) is True
+    assert deduplicator.is_duplicate(other_event) is False
+    assert deduplicator.stats() == {
+        'hits': 2,
+        'misses': 2,
+        'unidentified': 0,
+        'hit_ratio': 0.5
+    }
+
+
+def test_actions_without_identity_not_deduplicated(incoming_event_body: dict):
+    ''' Test if repeated state changes of actions without payload identity are
+        not taken for repeated deliveries, unless a key function is provided. '''
+    deduplicator = WebhookDeduplicator()
+    statuses = [{
+        **incoming_event_body, 'action': 'routing_status_set',
+        'payload': {
+            'agent_id': 'agent@example.com',
+            'status': status
+        }
+    } for status in ('accepting_chats', 'not_accepting_chats', 'accepting_chats')]
+    assert [deduplicator.is_duplicate(body) for body in statuses] == [False] * 3
+    assert deduplicator.key(statuses[0]) is None
+    assert deduplicator.stats()['unidentified'] == 3
+    by_delivery = WebhookDeduplicator(
+        key_function=lambda body: body['additional_data'].get('delivery_id'))
+    delivery = {**statuses[0], 'additional_data': {'delivery_id': 'd1'}}
+    assert by_delivery.is_duplicate(delivery) is False
+    assert by_delivery.is_duplicate(copy.deepcopy(delivery)) is True
+    assert by_delivery.is_duplicate(statuses[0]) is False
+
+
+def test_memory_backend_bounded_by_size_and_age():
+    ''' Test if least recently seen and expired keys are evicted. '''
+    backend = MemoryDedupBackend(max_size=2)
+    assert backend.add('a', 10) and backend.add('b', 10)
+    assert not backend.add('a', 10)  # `a` becomes the most recently seen
+    assert backend.add('c', 10)
+    assert len(backend) == 2
+    assert backend.add('b', 10)  # `b` was evicted
+    assert not backend.add('c', 10)
+    assert backend.add('d', 0.05) and not backend.add('d', 0.05)
+    time.sleep(0.1)
+    assert backend.add('d', 0.05)
+
+
+def test_shared_backend(incoming_event_body: dict):
+    ''' Test if deduplicators of many processes can share a store. '''
+    store = StandInSharedStore()
+    first, second = (WebhookDeduplicator(ttl=0.5, backend=SetNxDedupBackend(store))
+                     for _ in range(2))
+    assert first.is_duplicate(incoming_event_body) is False
+    assert second.is_duplicate(incoming_event_body) is True
+    assert [ttl for _, ttl in store.keys.values()] == [1]
+    assert all(key.startswith('livechat:webhook:') for key in store.keys)
+
+
+def test_dispatcher_skips_repeated_deliveries(incoming_event_body: dict):
+    ''' Test if dispatcher does not run handlers for repeated deliveries. '''
+    handled = []
+    dispatcher = WebhookDispatcher(version='3.7', deduplicator=WebhookDeduplicator())
+    dispatcher.register('incoming_event', handled.append)
+    with dispatcher:
+        assert dispatcher.dispatch(incoming_event_body) is True
+        assert dispatcher.dispatch(incoming_event_body) is False
+    assert len(handled) == 1
+    assert dispatcher.metrics()['duplicates'] == 1
@@ -0,0 +1,95 @@
+''' Webhooks dispatcher tests. '''
+
+import asyncio
+import queue
+import threading
+import time
+
+import pytest
+
+from livechat.webhooks.dispatcher import (AsyncWebhookDispatcher,
+                                          WebhookDispatcher)
+from livechat.webhooks.v37 import ChatDeactivated
+
+
+def test_register_invalid_action():
+    ''' Test if handlers can be registered for existing actions only. '''
+    dispatcher = WebhookDispatcher(version='3.7')
+    with pytest.raises(ValueError) as exception:
+        dispatcher.register('chat_closed', print)
+    assert str(exception.value) == '`chat_closed` is invalid webhook action for version 3.7.'
+
+
+def test_webhooks_dispatched_to_handlers(webhook_body: dict):
+    ''' Test if webhooks are handled by handlers of their action in worker threads. '''
+    handled = []
+    dispatcher = WebhookDispatcher(version='3.7', workers=2)
+
+    @dispatcher.register('chat_deactivated')
+    def on_chat_deactivated(webhook):
+        handled.append((webhook.payload, threading.current_thread().name))
+
+    dispatcher.register('incoming_chat', lambda webhook: 1 / 0)
+    with dispatcher:
+        assert dispatcher.dispatch(webhook_body) is True
+        assert dispatcher.dispatch({**webhook_body, 'action': 'incoming_chat',
+                                    'payload': {'chat': {}}}) is True
+        assert dispatcher.dispatch({**webhook_body, 'action': 'agent_deleted',
+                                    'payload': {'id': 'agent'}}) is False
+    assert [(payload, name.startswith('webhook-dispatcher-'))
+            for payload, name in handled] == [
+                (ChatDeactivated('PJ0MRSHTDG', 'K600PKZON8'), True)
+            ]
+    metrics = dispatcher.metrics()
+    assert metrics['unhandled'] == 1
+    assert metrics['queue_depth'] == 0
+    assert metrics['actions']['chat_deactivated']['count'] == 1
+    assert metrics['actions']['chat_deactivated']['errors'] == 0
+    assert metrics['actions']['incoming_chat']['errors'] == 1
+
+
+def test_dispatching_blocks_while_queue_is_full(webhook_body: dict):
+    ''' Test if the bounded queue applies back-pressure and webhooks are not
+        queued before workers are started. '''
+    release = threading.Event()
+    dispatcher = WebhookDispatcher(version='3.7', workers=1, max_queue_size=2)
+    dispatcher.register('chat_deactivated', lambda webhook: release.wait())
+    with pytest.raises(RuntimeError):
+        dispatcher.dispatch(webhook_body)
+    with dispatcher:
+        for _ in range(3):  # first one is taken by the worker
+            dispatcher.dispatch(webhook_body)
+        time.sleep(0.1)
+        with pytest.raises(queue.Full):
+            dispatcher.dispatch(webhook_body, timeout=0.1)
+        assert dispatcher.metrics()['max_queue_depth'] == 2
+        release.set()
+    metrics = dispatcher.metrics()['actions']['chat_deactivated']
+    assert metrics['count'] == 3
+    assert metrics['max_latency'] >= metrics['max_duration'] > 0
+
+
+def test_async_dispatcher(webhook_body: dict):
+    ''' Test if coroutine and regular handlers are run by asyncio dispatcher. '''
+    handled = []
+
+    async def on_chat_deactivated(webhook):
+        await asyncio.sleep(0.1)
+        handled.append(webhook.payload.chat_id)
+
+    async def main():
+        dispatcher = AsyncWebhookDispatcher(version='3.7', workers=10, lazy=True)
+        dispatcher.register('chat_deactivated', on_chat_deactivated)
+        dispatcher.register('chat_deactivated', lambda webhook: handled.append('sync'))
+        with pytest.raises(RuntimeError):
+            await dispatcher.dispatch(webhook_body)
+        started = time.perf_counter()
+        async with dispatcher:
+            for _ in range(10):
+                await dispatcher.dispatch(webhook_body)
+        return time.perf_counter() - started, dispatcher.metrics()
+
+    duration, metrics = asyncio.run(main())
+    assert duration < 0.5
+    assert handled.count('PJ0MRSHTDG') == handled.count('sync') == 10
+    assert metrics['actions']['chat_deactivated']['count'] == 10
@@ -1,11 +1,17 @@
 ''' Webhooks parser tests. '''
 
+import copy
 import inspect
+import io
+import json
+import pickle
 
 import pytest
 
 from livechat.config import CONFIG
-from livechat.webhooks.parser import parse_webhook
+from livechat.webhooks.parser import (compile_webhooks,
+                                      detect_webhook_version, parse_webhook,
+                                      parse_webhooks)
 from livechat.webhooks.v34 import WebhookV34, action_to_data_class_mapping_v_34
 from livechat.webhooks.v35 import WebhookV35, action_to_data_class_mapping_v_35
 from livechat.webhooks.v36 import WebhookV36, action_to_data_class_mapping_v_36
@@ -15,22 +21,6 @@ from livechat.webhooks.v36 import WebhookV36, action_to_data_class_mapping_v_36
 stable_version = CONFIG.get('stable')
 
 
-@pytest.fixture(scope='function')
-def webhook_body() -> dict:
-    ''' Returns a test webhook body in a form of a dict. '''
-    return {
-        'webhook_id': '166c029b-a2c6-4010-aa0c-5a984353a7dd',
-        'secret_key': 'top_secret_value',
-        'action': 'chat_deactivated',
-        'organization_id': 'f9c7cc55-b35a-4e76-b0d5-ae9fce362314',
-        'payload': {
-            'chat_id': 'PJ0MRSHTDG',
-            'thread_id': 'K600PKZON8'
-        },
-        'additional_data': {}
-    }
-
-
 @pytest.fixture(scope='session')
 def webhook_data_class_and_mapping() -> tuple:
     ''' Returns a tuple with webhook data class and actions to payload's
@@ -124,3 +114,179 @@ def test_webhook_with_additional_fields_in_payload_not_parsed(
         webhook_body['payload']['foo'] = 'bar'
         parse_webhook(webhook_body)
     assert 'Invalid webhook payload' in str(exception.value)
+
+
+def test_webhook_with_not_dict_payload_not_parsed(webhook_body: dict):
+    ''' Test if webhook with payload not being an object is not parsed and proper
+        exception raised. '''
+    with pytest.raises(ValueError) as exception:
+        webhook_body['payload'] = None
+        parse_webhook(webhook_body)
+    assert 'Invalid webhook payload' in str(exception.value)
+
+
+def test_webhook_with_non_existing_version_not_parsed(webhook_body: dict):
+    ''' Test if webhook is not parsed for non-existing version. '''
+    with pytest.raises(ValueError) as exception:
+        parse_webhook(webhook_body, version='2.9')
+    assert str(exception.value) == 'Provided version does not exist.'
+
+
+@pytest.mark.parametrize('version', ['3.4', '3.5', '3.6', '3.7'])
+def test_compiled_webhooks_cover_all_actions(version: str):
+    ''' Test if compiled table of each version contains all actions and slotted
+        data classes. '''
+    webhook_data_class, payload_data_classes = compile_webhooks(version)
+    mapping = getattr(inspect.getmodule(webhook_data_class),
+                      f'action_to_data_class_mapping_v_{version.replace(".", "")}')
+    assert payload_data_classes == mapping
+    assert compile_webhooks(version)[1] is payload_data_classes
+    assert all(
+        hasattr(data_class, '__slots__')
+        for data_class in [webhook_data_class, *payload_data_classes.values()])
+
+
+@pytest.fixture
+def ndjson_records(webhook_body: dict) -> list:
+    ''' Returns webhook bodies serialized as NDJSON lines, with 3 invalid ones
+        (lines 2, 6 and 7) and a blank one (line 4). '''
+    records = []
+    for number in range(8):
+        body = copy.deepcopy(webhook_body)
+        body['payload']['chat_id'] = f'chat_{number}'
+        records.append(json.dumps(body))
+    records[2] = '{"webhook_id": '
+    records[5] = json.dumps({**json.loads(records[5]), 'action': 'test'})
+    records[6] = json.dumps({**json.loads(records[6]), 'foo': 'bar'})
+    return [f'{record}\n' for record in records[:4]] + ['\n'] + [f'{record}\n' for record in records[4:]]
+
+
+@pytest.mark.parametrize('processes', [None, 2])
+def test_webhooks_from_ndjson_file_parsed(ndjson_records: list, tmp_path,
+                                          processes: int):
+    ''' Test if webhooks are parsed lazily from NDJSON file, in order, with invalid
+        records collected. '''
+    path = tmp_path / 'webhooks.ndjson'
+    path.write_text(''.join(ndjson_records))
+    errors = []
+    parsed = parse_webhooks(path, processes=processes, chunk_size=2, errors=errors)
+    assert inspect.isgenerator(parsed)
+    assert [webhook.payload.chat_id for webhook in parsed] == [
+        'chat_0', 'chat_1', 'chat_3', 'chat_4', 'chat_7'
+    ]
+    assert [(index, type(error)) for index, error in errors] == [
+        (2, json.JSONDecodeError), (6, ValueError), (7, ValueError)
+    ]
+    assert '`test` is invalid webhook action' in str(errors[1][1])
+
+
+def test_webhooks_from_iterable_parsed(webhook_body: dict):
+    ''' Test if webhooks are parsed from an iterable of dicts, documents and file
+        objects. '''
+    documents = [webhook_body, json.dumps(webhook_body), json.dumps(webhook_body).encode()]
+    assert len(list(parse_webhooks(documents))) == 3
+    assert len(list(parse_webhooks(io.StringIO(json.dumps(webhook_body))))) == 1
+    errors = []
+    assert len(list(parse_webhooks([None, 1, webhook_body], errors=errors))) == 1
+    assert [index for index, _ in errors] == [0, 1]
+    assert 'Invalid webhook record' in str(errors[0][1])
+    with pytest.raises(ValueError):
+        list(parse_webhooks([['not', 'a', 'body']]))
+
+
+@pytest.mark.parametrize('processes', [None, 2])
+def test_webhooks_parsing_stops_at_invalid_record(ndjson_records: list,
+                                                  processes: int):
+    ''' Test if webhooks preceding invalid record are yielded before an exception
+        is raised if errors are not collected. '''
+    parsed = parse_webhooks(ndjson_records, processes=processes, chunk_size=3)
+    assert next(parsed).payload.chat_id == 'chat_0'
+    assert next(parsed).payload.chat_id == 'chat_1'
+    with pytest.raises(ValueError):
+        next(parsed)
+
+
+def test_webhook_parsed_lazily(webhook_body: dict):
+    ''' Test if payload's data class is created on first access in lazy mode. '''
+    parsed_wh = parse_webhook(webhook_body, lazy=True)
+    payload_data_class = type(parse_webhook(webhook_body).payload)
+    assert isinstance(parsed_wh, type(parse_webhook(webhook_body)))
+    assert not hasattr(parsed_wh, '__dict__')
+    assert parsed_wh.action == webhook_body['action']
+    assert isinstance(parsed_wh.payload, payload_data_class)
+    assert parsed_wh.payload is parsed_wh.payload
+    assert parsed_wh.payload.chat_id == webhook_body['payload']['chat_id']
+
+
+def test_lazily_parsed_webhook_validation(webhook_body: dict):
+    ''' Test if invalid action is reported immediately and invalid payload fields
+        on first access to payload in lazy mode. '''
+    webhook_body['payload']['foo'] = 'bar'
+    parsed_wh = parse_webhook(webhook_body, lazy=True)
+    with pytest.raises(ValueError) as exception:
+        parsed_wh.payload  # pylint: disable=pointless-statement
+    assert 'Invalid webhook payload' in str(exception.value)
+    webhook_body['action'] = 'test'
+    with pytest.raises(ValueError) as exception:
+        parse_webhook(webhook_body, lazy=True)
+    assert '`test` is invalid webhook action' in str(exception.value)
+    del webhook_body['organization_id']
+    with pytest.raises(ValueError) as exception:
+        parse_webhook(webhook_body, lazy=True)
+    assert "'organization_id': <class 'str'>" in str(exception.value)
+
+
+def test_lazily_parsed_webhook_repr_and_pickle(webhook_body: dict):
+    ''' Test if lazily parsed webhooks are shown and pickled without validating
+        their payload. '''
+    webhook_body['payload']['foo'] = 'bar'
+    parsed_wh = parse_webhook(webhook_body, lazy=True)
+    assert repr(parsed_wh).startswith(f'{type(parsed_wh).__base__.__name__}(')
+    assert "'foo': 'bar'" in repr(parsed_wh)
+    restored = pickle.loads(pickle.dumps(parsed_wh))
+    assert type(restored) is type(parsed_wh)
+    assert restored.action == parsed_wh.action
+    with pytest.raises(ValueError):
+        restored.payload  # pylint: disable=pointless-statement
+    del webhook_body['payload']['foo']
+    restored = pickle.loads(pickle.dumps(parse_webhook(webhook_body, lazy=True)))
+    assert restored.payload == parse_webhook(webhook_body).payload
+
+
+def test_webhook_version_detected(webhook_body: dict):
+    ''' Test if version is detected from action and payload fields, with webhooks
+        of identical structure attributed to the first preferred version. '''
+    incoming_customer = dict(webhook_body,
+                             action='incoming_customer',
+                             payload={'customer': {}})
+    tag_updated = dict(webhook_body,
+                       action='tag_updated',
+                       payload={
+                           'name': 'support',
+                           'group_ids': [0]
+                       })
+    assert detect_webhook_version(webhook_body) == stable_version
+    assert detect_webhook_version(webhook_body, ['3.7', '3.5']) == '3.7'
+    assert detect_webhook_version(incoming_customer, ['3.7', '3.5']) == '3.5'
+    assert detect_webhook_version(tag_updated, ['3.4', '3.6']) == '3.6'
+    assert isinstance(parse_webhook(incoming_customer, 'auto'), WebhookV35)
+    assert isinstance(parse_webhook(webhook_body, 'auto', lazy=True),
+                      type(parse_webhook(webhook_body)))
+    assert [type(parsed_wh) for parsed_wh in parse_webhooks(
+        [webhook_body, incoming_customer], 'auto')] == [
+            type(parse_webhook(webhook_body)), WebhookV35
+        ]
+
+
+def test_webhook_version_detection_errors(webhook_body: dict):
+    ''' Test if webhooks matching none of versions are reported. '''
+    with pytest.raises(ValueError) as exception:
+        detect_webhook_version(dict(webhook_body, action='tag_deleted'), ['3.4'])
+    assert '`tag_deleted` is invalid webhook action' in str(exception.value)
+    webhook_body['payload']['foo'] = 'bar'
+    with pytest.raises(ValueError) as exception:
+        parse_webhook(webhook_body, 'auto')
+    assert 'Invalid webhook payload' in str(exception.value)
+    with pytest.raises(ValueError) as exception:
+        detect_webhook_version({'action': 'chat_deactivated'})
+    assert 'Invalid webhook body' in str(exception.value)
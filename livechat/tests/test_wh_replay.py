@@ -0,0 +1,98 @@
+''' Webhooks recording and replaying tests. '''
+
+import asyncio
+import functools
+import json
+
+from livechat.webhooks.asgi import WebhookReceiver
+from livechat.webhooks.parser import parse_webhook
+from livechat.webhooks.replay import (WebhookRecorder, WebhookReplayer,
+                                      percentile, read_recording)
+
+
+def test_recording_appended_and_read(tmp_path, incoming_event_body: dict):
+    ''' Test if bodies recorded in many sessions are read back in order. '''
+    path = tmp_path / 'webhooks.ndjson.gz'
+    incoming_event_body['payload']['event']['text'] = 'Hello\nworld'
+    with WebhookRecorder(path) as recorder:
+        recorder.record(incoming_event_body, 100.0)
+        recorder.record(json.dumps(incoming_event_body, indent=2).encode(), 100.5)
+    with WebhookRecorder(path) as recorder:
+        parsed_wh = recorder.parse_webhook(incoming_event_body, '3.7')
+    assert parsed_wh.payload.event['text'] == 'Hello\nworld'
+    records = list(read_recording(path))
+    assert [received_at for received_at, _ in records[:2]] == [100.0, 100.5]
+    assert [body for _, body in records] == [incoming_event_body] * 3
+
+
+def test_replay_timing(tmp_path, incoming_event_body: dict):
+    ''' Test if original timing is scaled by `speed` and ignored without it. '''
+    path = tmp_path / 'webhooks.ndjson.gz'
+    with WebhookRecorder(path) as recorder:
+        for received_at in (100.0, 100.2, 100.4):
+            recorder.record(incoming_event_body, received_at)
+    target = functools.partial(parse_webhook, version='3.7')
+    scaled = WebhookReplayer(path, speed=2).replay(target)
+    fastest = WebhookReplayer(path, speed=None).replay(target)
+    assert 0.2 <= scaled.elapsed < 0.3
+    assert fastest.elapsed < 0.1
+    assert scaled.as_dict()['count'] == fastest.count == 3
+
+
+def test_replay_to_async_target_counts_errors(tmp_path, incoming_event_body: dict):
+    ''' Test if coroutine targets are awaited and their failures counted. '''
+    path = tmp_path / 'webhooks.ndjson.gz'
+    with WebhookRecorder(path) as recorder:
+        recorder.record(incoming_event_body)
+        recorder.record(dict(incoming_event_body, action='unknown_action'))
+    delivered = []
+
+    async def target(wh_body):
+        await asyncio.sleep(0.01)
+        delivered.append(parse_webhook(wh_body, '3.7'))
+
+    report = WebhookReplayer(path, speed=None).replay(target)
+    assert len(delivered) == 1
+    assert (report.count, report.errors) == (2, 1)
+    assert report.percentiles['p50'] >= 0.01
+    assert '2 webhooks (1 failed)' in str(report)
+
+
+def test_receiver_records_acknowledged_webhooks(tmp_path, incoming_event_body: dict):
+    ''' Test if the ASGI receiver records raw bodies of acknowledged webhooks. '''
+    path = tmp_path / 'webhooks.ndjson.gz'
+    bodies = [
+        json.dumps(incoming_event_body, indent=2).encode(),
+        json.dumps(dict(incoming_event_body, secret_key='invalid')).encode(),
+    ]
+
+    async def main(app):
+        for body in bodies:
+            message = {'type': 'http.request', 'body': body}
+
+            async def receive(message=message):
+                return message
+
+            async def send(_):
+                pass
+
+            await app({'type': 'http', 'method': 'POST'}, receive, send)
+        await app.stop()
+
+    with WebhookRecorder(path) as recorder:
+        asyncio.run(
+            main(
+                WebhookReceiver(['top_secret_value'],
+                                version='3.7',
+                                recorder=recorder)))
+    assert [body for _, body in read_recording(path)] == [incoming_event_body]
+
+
+def test_percentile():
+    ''' Test nearest-rank percentiles. '''
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([3.0], 50) == 3.0
+    assert percentile([], 50) == 0.0
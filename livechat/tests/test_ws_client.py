@@ -2,13 +2,17 @@
 
 # pylint: disable=E1120,W0621,C0103,R1702
 
+import json
+import threading
+import time
+
 import pytest
 import websocket
 from _pytest.logging import LogCaptureFixture
 from loguru import logger
 
 from livechat.config import CONFIG
-from livechat.utils.ws_client import WebsocketClient
+from livechat.utils.ws_client import WebsocketClient, on_message
 
 stable_version = CONFIG.get('stable')
 api_url = CONFIG.get('url')
@@ -84,3 +88,126 @@ def test_websocket_logs_on_error(caplog):
     messages = [record.message for record in caplog.records]
     assert any('websocket error occurred' in msg.lower() for msg in
                messages), "Expected 'error' log not found in caplog output."
+
+
+class FakeSocket:
+    ''' Stand-in for a connected socket which answers every request
+        from a separate thread, as the `run_forever` loop would. '''
+    connected = True
+
+    def __init__(self, ws: WebsocketClient, pushes: int = 0):
+        self.ws = ws
+        self.pushes = pushes
+
+    def send(self, data: str, opcode: int) -> int:
+        request = json.loads(data)
+
+        def respond():
+            for _ in range(self.pushes):
+                on_message(self.ws, json.dumps({'type': 'push', 'action': 'incoming_event'}))
+            on_message(
+                self.ws,
+                json.dumps({
+                    'request_id': request['request_id'],
+                    'action': request['action'],
+                    'type': 'response',
+                    'success': True,
+                    'payload': {}
+                }))
+
+        threading.Thread(target=respond, daemon=True).start()
+        return len(data)
+
+
+def test_websocket_send_returns_as_soon_as_response_arrives():
+    ''' Test if response is handed over to `send` without polling the messages. '''
+    ws = WebsocketClient(url='wss://localhost/ws')
+    ws.sock = FakeSocket(ws, pushes=100)
+    ws.response_timeout = 3
+    started = time.perf_counter()
+    response = ws.send({'action': 'get_chat', 'payload': {}})
+    assert time.perf_counter() - started < 0.15
+    assert response.action == 'get_chat'
+    assert response.success is True
+    assert not ws._pending_requests
+
+
+def test_websocket_send_ignores_responses_for_other_requests():
+    ''' Test if `send` times out when only unrelated responses arrive. '''
+    ws = WebsocketClient(url='wss://localhost/ws')
+    ws.sock = FakeSocket(ws)
+    ws.sock.send = lambda data, opcode: on_message(ws, json.dumps({
+        'request_id': 'other',
+        'type': 'response'
+    })) or len(data)
+    ws.response_timeout = 0.2
+    assert ws.send({'action': 'get_chat', 'payload': {}}) is None
+    assert not ws._pending_requests
+
+
+def test_websocket_send_does_not_start_threads(monkeypatch):
+    ''' Test if waiting for the response does not spawn any thread. '''
+    started_threads = []
+    original_start = threading.Thread.start
+
+    def counting_start(thread):
+        started_threads.append(thread)
+        original_start(thread)
+
+    ws = WebsocketClient(url='wss://localhost/ws')
+    ws.sock = FakeSocket(ws)
+    ws.sock.send = lambda data, opcode: on_message(ws, json.dumps({
+        'request_id': json.loads(data)['request_id'],
+        'type': 'response'
+    })) or len(data)
+    ws.response_timeout = 3
+    monkeypatch.setattr(threading.Thread, 'start', counting_start)
+    for _ in range(10):
+        assert ws.send({'action': 'get_chat', 'payload': {}}) is not None
+    assert not started_threads
+
+
+def test_websocket_matched_responses_are_not_kept():
+    ''' Test if only unmatched messages (pushes) are kept in `messages`. '''
+    ws = WebsocketClient(url='wss://localhost/ws')
+    ws.sock = FakeSocket(ws, pushes=3)
+    ws.response_timeout = 3
+    ws.send({'action': 'get_chat', 'payload': {}})
+    assert len(ws.messages) == 3
+    assert all(message['type'] == 'push' for message in ws.messages)
+
+
+def test_websocket_messages_limited_by_length():
+    ''' Test if the oldest messages are dropped after exceeding the limit. '''
+    ws = WebsocketClient(url='wss://localhost/ws')
+    ws.set_messages_retention(max_length=5)
+    for number in range(20):
+        on_message(ws, json.dumps({'type': 'push', 'number': number}))
+    assert len(ws.messages) == 5
+    assert ws.messages[0]['number'] == 19
+    assert [message['number'] for message in ws.messages] == list(range(19, 14, -1))
+    assert [message['number'] for message in ws.messages[:2]] == [19, 18]
+    assert [message['number'] for message in ws.get_messages(2)] == [19, 18]
+    assert ws.get_messages() == ws.messages
+
+
+def test_websocket_messages_limited_by_age():
+    ''' Test if messages older than `messages_max_age` are evicted. '''
+    ws = WebsocketClient(url='wss://localhost/ws')
+    ws.set_messages_retention(max_age=0.1)
+    on_message(ws, json.dumps({'type': 'push', 'number': 1}))
+    time.sleep(0.15)
+    on_message(ws, json.dumps({'type': 'push', 'number': 2}))
+    assert ws.messages == [{'type': 'push', 'number': 2}]
+
+
+def test_websocket_messages_expire_without_new_messages():
+    ''' Test if expired messages are evicted when read, without new pushes. '''
+    ws = WebsocketClient(url='wss://localhost/ws')
+    ws.set_messages_retention(max_age=0.1)
+    for number in range(3):
+        on_message(ws, json.dumps({'type': 'push', 'number': number}))
+    assert len(ws.get_messages()) == 3
+    time.sleep(0.15)
+    assert ws.messages == []
+    assert ws.get_messages() == []
@@ -0,0 +1,218 @@
+'''
+Asyncio client for WebSocket connections.
+'''
+
+import asyncio
+import json
+import random
+from typing import Callable, Dict, Optional, Union
+
+from loguru import logger
+from websocket import WebSocketConnectionClosedException
+
+from livechat.utils.structures import RtmResponse
+from livechat.utils.ws_client import RtmMessagesBuffer
+
+
+class AsyncWebsocketClient(RtmMessagesBuffer):
+    ''' Asyncio websocket client for livechat python SDK. Many clients
+        can share a single event loop. Requires the `websockets` package. '''
+    def __init__(self,
+                 url: str,
+                 header: Union[list, dict, Callable, None] = None):
+        super().__init__()
+        self.url = url
+        self.header = header
+        self.response_timeout = None
+        self._connection = None
+        self._receiver = None
+        self._pending_requests: Dict[str, asyncio.Future] = {}
+
+    @property
+    def connected(self) -> bool:
+        ''' Indicates if websocket connection is open. '''
+        return self._receiver is not None and not self._receiver.done()
+
+    async def open(self,
+                   origin: Optional[str] = None,
+                   ping_timeout: Union[float, int] = 3,
+                   ping_interval: Union[float, int] = 5,
+                   ws_conn_timeout: Union[float, int] = 10,
+                   response_timeout: Union[float, int] = 3,
+                   messages_max_length: Optional[int] = 1000,
+                   messages_max_age: Union[float, int, None] = None) -> None:
+        ''' Opens websocket connection and starts receiving messages in a background task.
+            Args:
+                origin (str): Specifies origin while creating websocket connection.
+                ping_timeout (int or float): timeout (in seconds) if the pong message is not received,
+                    by default sets to 3 seconds.
+                ping_interval (int or float): automatically sends "ping" command every specified period (in seconds).
+                    If set to 0, no ping is sent periodically, by default sets to 5 seconds.
+                ws_conn_timeout (int or float): timeout (in seconds) to wait for WebSocket connection,
+                    by default sets to 10 seconds.
+                response_timeout (int or float): timeout (in seconds) to wait for the response,
+                    by default sets to 3 seconds.
+                messages_max_length (int): maximum number of unmatched messages (pushes) kept in `self.messages`,
+                    the oldest ones are dropped first. `None` disables the limit, by default sets to 1000.
+                messages_max_age (int or float): maximum age (in seconds) of messages kept in `self.messages`,
+                    by default messages are not evicted by age. '''
+        # pylint: disable=import-outside-toplevel
+        from websockets.asyncio.client import connect
+        if self.connected:
+            logger.warning(
+                'Cannot open new websocket connection, already connected.')
+            return
+        self.response_timeout = response_timeout
+        self.set_messages_retention(messages_max_length, messages_max_age)
+        try:
+            self._connection = await asyncio.wait_for(
+                connect(self.url,
+                        additional_headers=self._handshake_headers(),
+                        origin=origin,
+                        ping_interval=ping_interval or None,
+                        ping_timeout=ping_timeout),
+                timeout=ws_conn_timeout)
+        except asyncio.TimeoutError as error:
+            raise TimeoutError(
+                'Timed out waiting for WebSocket to open.') from error
+        except Exception as error:
+            logger.error(f'websocket error occurred: {str(error)}')
+            raise
+        self._receiver = asyncio.create_task(self._receive())
+
+    async def close(self) -> None:
+        ''' Closes websocket connection. '''
+        if self._connection is not None:
+            await self._connection.close()
+        if self._receiver is not None:
+            await self._receiver
+
+    async def send(self, request: dict) -> RtmResponse:
+        '''
+        Sends message, assigning a random request ID, awaiting and returning the response.
+            Args:
+                request (dict): message to send.
+
+            Returns:
+                RtmResponse: RTM response structure (`request_id`, `action`,
+                             `type`, `success` and `payload` properties)
+        '''
+        request_id = str(random.randint(1, 9999999999))
+        request.update({'request_id': request_id})
+        request_json = json.dumps(request, indent=4)
+        logger.info(f'\nREQUEST:\n{request_json}')
+
+        if not self.connected:
+            raise WebSocketConnectionClosedException(
+                'Connection is already closed.')
+
+        pending_request = asyncio.get_running_loop().create_future()
+        self._pending_requests[request_id] = pending_request
+        try:
+            await self._connection.send(request_json)
+            response = await asyncio.wait_for(pending_request,
+                                              timeout=self.response_timeout)
+            logger.info(f'\nRESPONSE:\n{json.dumps(response, indent=4)}')
+        except asyncio.TimeoutError:
+            logger.error(
+                f'timed out waiting for message with request_id {request_id}')
+            logger.debug('all websocket messages received before timeout:')
+            logger.debug(self.messages)
+            return None
+        finally:
+            self._pending_requests.pop(request_id, None)
+
+        return RtmResponse(response)
+
+    def _on_message(self, message: Union[str, bytes]) -> None:
+        ''' Hands responses over to the `send` call awaiting them (matched by `request_id`)
+            and inserts all other messages in front of `self.messages`. '''
+        message = json.loads(message)
+        pending_request = None
+        if message.get('type') == 'response':
+            pending_request = self._pending_requests.pop(
+                message.get('request_id'), None)
+        if pending_request is None or pending_request.done():
+            with self._messages_lock:
+                self._store_message(message)
+            return
+        pending_request.set_result(message)
+
+    async def _receive(self) -> None:
+        ''' Receives messages until the connection gets closed. Errors of single
+            messages are logged, so that they do not stop receiving. '''
+        try:
+            async for message in self._connection:
+                try:
+                    self._on_message(message)
+                except Exception as error:  # pylint: disable=broad-except
+                    logger.error(f'websocket error occurred: {str(error)}')
+        except Exception as error:  # pylint: disable=broad-except
+            logger.error(f'websocket error occurred: {str(error)}')
+        finally:
+            await self._connection.close()
+            logger.info('websocket closed:')
+            close_status_code = self._connection.close_code
+            close_msg = self._connection.close_reason
+            if close_status_code or close_msg:
+                logger.info('close status code: ' + str(close_status_code))
+                logger.info('close message: ' + str(close_msg))
+            for pending_request in self._pending_requests.values():
+                if not pending_request.done():
+                    pending_request.set_exception(
+                        WebSocketConnectionClosedException(
+                            'Connection is already closed.'))
+
+    def _handshake_headers(self) -> list:
+        ''' Returns custom handshake headers as a list of (name, value) pairs. '''
+        header = self.header() if callable(self.header) else self.header
+        if not header:
+            return []
+        if isinstance(header, dict):
+            return list(header.items())
+        return [
+            tuple(item.strip() for item in line.split(':', 1))
+            for line in header
+        ]
+
+
+class AsyncRtmClient:
+    ''' Mixin of asyncio RTM API classes, put in front of the synchronous API
+        class: its `ws` is `AsyncWebsocketClient`, so that methods return
+        awaitables resolving to `RtmResponse`. '''
+    websocket_class = AsyncWebsocketClient
+    ws: AsyncWebsocketClient
+
+    async def open_connection(
+            self,
+            origin: Optional[str] = None,
+            ping_timeout: Union[float, int] = 3,
+            ping_interval: Union[float, int] = 5,
+            ws_conn_timeout: Union[float, int] = 10,
+            response_timeout: Union[float, int] = 3,
+            messages_max_length: Optional[int] = 1000,
+            messages_max_age: Union[float, int, None] = None) -> None:
+        ''' Opens WebSocket connection.
+
+            Args:
+                origin (str): Specifies origin while creating websocket connection.
+                ping_timeout (int or float): timeout (in seconds) if the pong message is not received,
+                    by default sets to 3 seconds.
+                ping_interval (int or float): automatically sends "ping" command every specified period (in seconds).
+                    If set to 0, no ping is sent periodically, by default sets to 5 seconds.
+                ws_conn_timeout (int or float): timeout (in seconds) to wait for WebSocket connection,
+                    by default sets to 10 seconds.
+                response_timeout (int or float): timeout (in seconds) to wait for the response,
+                    by default sets to 3 seconds.
+                messages_max_length (int): maximum number of unmatched messages (pushes) kept in `ws.messages`,
+                    the oldest ones are dropped first. `None` disables the limit, by default sets to 1000.
+                messages_max_age (int or float): maximum age (in seconds) of messages kept in `ws.messages`,
+                    by default messages are not evicted by age.
+        '''
+        await self.ws.open(origin, ping_timeout, ping_interval,
+                           ws_conn_timeout, response_timeout,
+                           messages_max_length, messages_max_age)
+
+    async def close_connection(self) -> None:
+        ''' Closes WebSocket connection. '''
+        await self.ws.close()
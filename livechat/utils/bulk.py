@@ -0,0 +1,102 @@
+'''
+Concurrent execution of many client methods with shared parameters.
+'''
+
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Dict, Tuple
+
+
+class BulkResult(dict):
+    ''' Mapping of names to results of methods called concurrently, with
+        durations (in seconds) of the calls in `timings`. '''
+    def __init__(self, results: Dict[str, Any], timings: Dict[str, float]):
+        super().__init__(results)
+        self.timings = timings
+
+
+def call_concurrently(methods: Dict[str, Callable],
+                      max_concurrency: int = 6,
+                      return_exceptions: bool = False,
+                      **params) -> BulkResult:
+    ''' Calls methods of a synchronous client in a thread pool, running at most
+        `max_concurrency` calls at once.
+
+        Args:
+            methods (dict): Mapping of names to client methods.
+            max_concurrency (int): Maximum number of calls running at once.
+            return_exceptions (bool): If set, exceptions raised by calls are
+                                      returned as their results; by default
+                                      the first one is raised once all calls
+                                      are finished.
+            params: Parameters passed to methods accepting them; `None` values
+                    are skipped.
+
+        Returns:
+            BulkResult: Mapping of names to results in the order of `methods`.
+    '''
+    calls = _prepare_calls(methods, max_concurrency, params)
+    timings = {}
+
+    def call(name: str) -> Any:
+        method, kwargs = calls[name]
+        started = perf_counter()
+        try:
+            return method(**kwargs)
+        finally:
+            timings[name] = perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = {name: executor.submit(call, name) for name in calls}
+    results = {}
+    for name, future in futures.items():
+        error = future.exception()
+        if error is not None and not return_exceptions:
+            raise error
+        results[name] = future.result() if error is None else error
+    return BulkResult(results, timings)
+
+
+async def acall_concurrently(methods: Dict[str, Callable],
+                             max_concurrency: int = 6,
+                             return_exceptions: bool = False,
+                             **params) -> BulkResult:
+    ''' Calls methods of an asyncio client as concurrent tasks, running at most
+        `max_concurrency` calls at once. See `call_concurrently` for arguments. '''
+    calls = _prepare_calls(methods, max_concurrency, params)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    timings = {}
+
+    async def call(name: str) -> Any:
+        method, kwargs = calls[name]
+        async with semaphore:
+            started = perf_counter()
+            try:
+                return await method(**kwargs)
+            finally:
+                timings[name] = perf_counter() - started
+
+    results = await asyncio.gather(*(call(name) for name in calls),
+                                   return_exceptions=True)
+    if not return_exceptions:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+    return BulkResult(dict(zip(calls, results)), timings)
+
+
+def _prepare_calls(methods: Dict[str, Callable], max_concurrency: int,
+                   params: dict) -> Dict[str, Tuple[Callable, dict]]:
+    ''' Returns mapping of names to methods and parameters they accept. '''
+    if max_concurrency < 1:
+        raise ValueError('`max_concurrency` has to be a positive number.')
+    return {
+        name: (method, {
+            param: value
+            for param, value in params.items() if value is not None
+            and param in inspect.signature(method).parameters
+        })
+        for name, method in methods.items()
+    }
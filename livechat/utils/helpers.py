@@ -2,6 +2,8 @@
 Helper methods which are used within SDK.
 '''
 
+from datetime import datetime
+
 
 def prepare_payload(parameters: dict) -> dict:
     ''' Prepares payload for request based on provided parameters by removing
@@ -20,3 +22,21 @@ def prepare_payload(parameters: dict) -> dict:
         if key not in ['self', 'payload', 'headers', 'date_to', 'date_from']
         and value is not None
     }
+
+
+def parse_datetime(value: str) -> datetime:
+    ''' Parses date and time in RFC 3339 (ISO 8601) format, also with `Z`
+        as UTC offset, which `datetime.fromisoformat` accepts since Python 3.11 only.
+
+        Args:
+            value (str): Date and time, e.g. `2024-05-01T10:15:00.000000Z`.
+
+        Returns:
+            datetime: Parsed date and time (naive if `value` has no offset).
+
+        Raises:
+            ValueError: If `value` is not in ISO 8601 format.
+    '''
+    if value.endswith(('Z', 'z')):
+        value = f'{value[:-1]}+00:00'
+    return datetime.fromisoformat(value)
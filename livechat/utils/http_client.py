@@ -1,11 +1,13 @@
 ''' Base module with HTTP client class for session, sending requests and headers
     manipulation. '''
 
+import copy
 from typing import Union
 
 import httpx
 
 from livechat.utils.httpx_logger import HttpxLogger
+from livechat.utils.streaming import StreamingSession
 from livechat.utils.structures import AccessToken
 
 
@@ -55,3 +57,52 @@ class HttpClient:
                 dict: Response which presents current header values in session object.
         '''
         return dict(self.session.headers)
+
+    def streaming(self):
+        ''' Returns a view of the client whose methods return responses with
+            bodies not read yet, so that large bodies can be processed with
+            constant memory usage (e.g. with `livechat.utils.streaming.iter_json_items`).
+            The view shares session with the client. Returned responses have to be
+            iterated through or closed; only the beginning of their content is logged.
+
+            Returns:
+                Client of the same class sending requests in streaming mode.
+        '''
+        client = copy.copy(self)
+        client.session = StreamingSession(self.session)
+        return client
+
+
+class AsyncHttpClient(HttpClient):
+    ''' Asyncio HTTP client class for session, sending requests and headers manipulation.
+        Methods of API classes using it return awaitables resolving to `httpx.Response`. '''
+    # pylint: disable=super-init-not-called
+    def __init__(self,
+                 token: Union[AccessToken, str],
+                 base_url: str,
+                 http2: bool,
+                 proxies=None,
+                 verify: bool = True,
+                 disable_logging: bool = False,
+                 timeout: float = httpx.Timeout(15)):
+        logger = HttpxLogger(disable_logging=disable_logging)
+        self.base_url = base_url
+        self.session = httpx.AsyncClient(http2=http2,
+                                         headers={'Authorization': str(token)},
+                                         event_hooks={
+                                             'request': [logger.alog_request],
+                                             'response': [logger.alog_response]
+                                         },
+                                         proxy=proxies,
+                                         verify=verify,
+                                         timeout=timeout)
+
+    async def aclose(self) -> None:
+        ''' Closes session object and its connection pool. '''
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -3,13 +3,25 @@ Logger for httpx requests.
 '''
 
 import json
+from typing import AsyncIterator, Callable, Iterator, Union
 
 import httpx
 from loguru import logger
 
+from livechat.utils.streaming import STREAMING_EXTENSION
+
+DEBUG_LEVEL_NO = logger.level('DEBUG').no
+
+
+def debug_enabled() -> bool:
+    ''' Indicates if any of the logging sinks accepts DEBUG messages
+        (loguru does not expose it publicly). '''
+    return logger._core.min_level <= DEBUG_LEVEL_NO  # pylint: disable=protected-access
+
 
 class HttpxLogger:
-    ''' Logger for httpx requests. '''
+    ''' Logger for httpx requests. Bodies are read and formatted only if
+        DEBUG messages are accepted by any of the logging sinks. '''
     MAX_CONTENT_LENGTH_TO_LOG = 1000
 
     def __init__(self, disable_logging: bool = False):
@@ -18,43 +30,137 @@ class HttpxLogger:
     def log_request(self, request: httpx.Request) -> None:
         ''' Logs request details. '''
         if not self.disable_logging:
-            request.read()
-            try:
-                request_params = json.dumps(
-                    json.loads(request.content),
-                    indent=4,
-                )
-            except json.decoder.JSONDecodeError:
-                request_params = request.content.decode('utf-8')
-            except ValueError:
-                request_params = request.content  # to avoid error when request contains binary data
-            request_headers = json.dumps(
-                dict(request.headers.items()),
-                indent=4,
-            )
-            if len(request_params) > self.MAX_CONTENT_LENGTH_TO_LOG:
-                request_params = f'{request_params[:self.MAX_CONTENT_LENGTH_TO_LOG]}... (Truncated)'
-
-            request_debug = f'Request params:\n{request_params}\n' \
-                            f'Request headers:\n{request_headers}'
-
             logger.info(f'{request.method} request to: {request.url}')
-            logger.debug(request_debug)
+            if debug_enabled():
+                request.read()
+                logger.debug(self._request_debug(request))
 
     def log_response(self, response: httpx.Response) -> None:
         ''' Logs response details. '''
         if not self.disable_logging:
-            response.read()
-            try:
-                response_content = json.dumps(response.json(), indent=4)
-            except ValueError:
-                response_content = response.text  # to avoid error when response contains binary data
-            response_debug = f'Response duration: {response.elapsed.total_seconds()} second(s)\n' \
-                            f'Response content:\n{response_content}'
-            status_code = response.status_code
-            logger.info(f'Response status code: {status_code}')
-            if status_code > 499:  # log response headers only if status code is 5XX to reduce log bloat
-                response_headers = json.dumps(dict(response.headers.items()),
-                                              indent=4)
-                response_debug = f'{response_debug}\nResponse headers:\n{response_headers}'
-            logger.debug(response_debug)
+            logger.info(f'Response status code: {response.status_code}')
+            if debug_enabled():
+                if response.request.extensions.get(STREAMING_EXTENSION):
+                    self._log_streamed_content(response)
+                    return
+                response.read()
+                logger.debug(self._response_debug(response))
+
+    async def alog_request(self, request: httpx.Request) -> None:
+        ''' Logs request details of the asyncio client. '''
+        if not self.disable_logging:
+            logger.info(f'{request.method} request to: {request.url}')
+            if debug_enabled():
+                await request.aread()
+                logger.debug(self._request_debug(request))
+
+    async def alog_response(self, response: httpx.Response) -> None:
+        ''' Logs response details of the asyncio client. '''
+        if not self.disable_logging:
+            logger.info(f'Response status code: {response.status_code}')
+            if debug_enabled():
+                if response.request.extensions.get(STREAMING_EXTENSION):
+                    self._log_streamed_content(response)
+                    return
+                await response.aread()
+                logger.debug(self._response_debug(response))
+
+    def _request_debug(self, request: httpx.Request) -> str:
+        ''' Returns request params and headers formatted for logging. '''
+        request_headers = json.dumps(dict(request.headers.items()), indent=4)
+        return f'Request params:\n{self._format_content(request.content)}\n' \
+               f'Request headers:\n{request_headers}'
+
+    def _response_debug(self, response: httpx.Response) -> str:
+        ''' Returns response duration, content and, for server errors, headers
+            formatted for logging. '''
+        return f'Response duration: {response.elapsed.total_seconds()} second(s)\n' \
+               f'Response content:\n{self._format_content(response.content)}' \
+               f'{self._headers_debug(response)}'
+
+    @staticmethod
+    def _headers_debug(response: httpx.Response) -> str:
+        ''' Returns response headers formatted for logging if status code is 5XX
+            (other responses' headers are not logged to reduce log bloat). '''
+        if response.status_code > 499:
+            response_headers = json.dumps(dict(response.headers.items()),
+                                          indent=4)
+            return f'\nResponse headers:\n{response_headers}'
+        return ''
+
+    def _log_streamed_content(self, response: httpx.Response) -> None:
+        ''' Makes the beginning of streamed response content logged once it is received,
+            without buffering the whole body. '''
+        def log_content(prefix: bytes) -> None:
+            logger.debug(f'Response content:\n{self._format_content(prefix)}'
+                         f'{self._headers_debug(response)}')
+
+        response.stream = PrefixCapturingStream(
+            response.stream, self.MAX_CONTENT_LENGTH_TO_LOG + 1, log_content)
+
+    def _format_content(self, content: bytes) -> str:
+        ''' Returns content pretty-printed if it is a JSON document short enough
+            to be logged in full, otherwise its truncated beginning. Large
+            payloads are truncated before any decoding. '''
+        limit = self.MAX_CONTENT_LENGTH_TO_LOG
+        if len(content) > limit:
+            return f'{self._decode(content[:limit], truncated=True)}... (Truncated)'
+        try:
+            formatted = json.dumps(json.loads(content), indent=4)
+        except ValueError:
+            formatted = self._decode(content)
+        if len(formatted) > limit:
+            formatted = f'{formatted[:limit]}... (Truncated)'
+        return formatted
+
+    @staticmethod
+    def _decode(content: bytes, truncated: bool = False) -> str:
+        ''' Decodes content to text; binary data is logged as bytes representation. '''
+        try:
+            return content.decode('utf-8')
+        except UnicodeDecodeError as error:
+            if truncated and error.start >= len(content) - 3:  # multi-byte character cut off by truncation
+                return content[:error.start].decode('utf-8')
+            return str(content)
+
+
+class PrefixCapturingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    ''' Byte stream wrapper passing `on_prefix` the first `length` bytes of the stream
+        (or all of them if the stream is shorter) as soon as they are received. '''
+    def __init__(self, stream: Union[httpx.SyncByteStream, httpx.AsyncByteStream],
+                 length: int, on_prefix: Callable[[bytes], None]):
+        self._stream = stream
+        self._length = length
+        self._on_prefix = on_prefix
+        self._prefix = bytearray()
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._capture(chunk)
+            yield chunk
+        self._release()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._capture(chunk)
+            yield chunk
+        self._release()
+
+    def close(self) -> None:
+        self._release()
+        self._stream.close()
+
+    async def aclose(self) -> None:
+        self._release()
+        await self._stream.aclose()
+
+    def _capture(self, chunk: bytes) -> None:
+        if self._prefix is not None:
+            self._prefix += chunk[:self._length - len(self._prefix)]
+            if len(self._prefix) == self._length:
+                self._release()
+
+    def _release(self) -> None:
+        if self._prefix is not None:
+            prefix, self._prefix = bytes(self._prefix), None
+            self._on_prefix(prefix)
@@ -0,0 +1,123 @@
+'''
+Iterators over items of paginated list responses.
+'''
+
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Tuple
+
+from livechat.utils.structures import RtmResponse
+
+
+class PageIterator:
+    ''' Iterates over items of paginated list responses, fetching pages on demand.
+        While items of the current page are being consumed, the next page is
+        already being fetched, so at most two pages are kept in memory.
+
+        Use `for` loop with synchronous clients and `async for` loop
+        with asyncio clients.
+    '''
+    def __init__(self,
+                 method: Callable,
+                 items_key: str,
+                 max_items: Optional[int] = None,
+                 max_pages: Optional[int] = None,
+                 **params):
+        ''' Args:
+                method (Callable): Client method returning a page, e.g. `list_archives`.
+                items_key (str): Key of response payload under which page items are
+                                 stored, e.g. `chats`.
+                max_items (int): Maximum number of items to yield, by default unlimited.
+                max_pages (int): Maximum number of pages to fetch, by default unlimited.
+                params: Parameters passed to `method` for each page, together with
+                        `page_id` for subsequent pages.
+        '''
+        self.method = method
+        self.items_key = items_key
+        self.max_items = max_items
+        self.max_pages = max_pages
+        self.params = params
+        self.pages_fetched = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        executor = ThreadPoolExecutor(max_workers=1)
+        next_page = executor.submit(self._request, None)
+        items_left = self.max_items
+        try:
+            while next_page is not None:
+                response = next_page.result()
+                if inspect.isawaitable(response):
+                    response.close()
+                    raise TypeError(
+                        'Use `async for` loop with asyncio clients.')
+                items, next_page_id, items_left = self._page(
+                    response, items_left)
+                next_page = executor.submit(
+                    self._request, next_page_id) if self._has_next_page(
+                        next_page_id, items_left) else None
+                yield from items
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        next_page = self._schedule(None)
+        items_left = self.max_items
+        try:
+            while next_page is not None:
+                items, next_page_id, items_left = self._page(
+                    await next_page, items_left)
+                next_page = self._schedule(next_page_id) if self._has_next_page(
+                    next_page_id, items_left) else None
+                for item in items:
+                    yield item
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    def _request(self, page_id: Optional[str]) -> Any:
+        ''' Requests page with given ID, or the first page if `page_id` is `None`. '''
+        self.pages_fetched += 1
+        if page_id is None:
+            return self.method(**self.params)
+        return self.method(**self.params, page_id=page_id)
+
+    def _schedule(self, page_id: Optional[str]) -> asyncio.Future:
+        ''' Starts requesting page in the background (asyncio clients only). '''
+        response = self._request(page_id)
+        if not inspect.isawaitable(response):
+            raise TypeError('Use `for` loop with synchronous clients.')
+        return asyncio.ensure_future(response)
+
+    def _page(self, response: Any,
+              items_left: Optional[int]) -> Tuple[list, Optional[str], Optional[int]]:
+        ''' Returns page items within the budget, next page ID and number of items left. '''
+        payload = self._payload(response)
+        items = payload.get(self.items_key) or []
+        if items_left is not None:
+            items = items[:items_left]
+            items_left -= len(items)
+        return items, payload.get('next_page_id'), items_left
+
+    def _has_next_page(self, next_page_id: Optional[str],
+                       items_left: Optional[int]) -> bool:
+        return bool(next_page_id) and items_left != 0 and (
+            self.max_pages is None or self.pages_fetched < self.max_pages)
+
+    @staticmethod
+    def _payload(response: Any) -> dict:
+        ''' Returns payload of `httpx.Response` or `RtmResponse` page.
+
+            Raises:
+                httpx.HTTPStatusError: If HTTP request failed.
+                RuntimeError: If RTM request failed.
+                TimeoutError: If RTM response has not been received.
+        '''
+        if response is None:
+            raise TimeoutError('Timed out waiting for the page.')
+        if isinstance(response, RtmResponse):
+            if not response.success:
+                raise RuntimeError(
+                    f'`{response.action}` request failed: {response.payload}')
+            return response.payload
+        return response.raise_for_status().json()
@@ -0,0 +1,226 @@
+'''
+Streamed responses and incremental JSON parsing of their bodies.
+'''
+
+import json
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+import httpx
+
+STREAMING_EXTENSION = 'livechat_streaming'
+
+
+class StreamingSession:
+    ''' Session proxy sending requests without reading response bodies.
+        Returned responses have to be iterated or closed by the caller. '''
+    def __init__(self, session: httpx.Client):
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        ''' Sends a request and returns the response with body not read yet
+            (an awaitable resolving to it for `httpx.AsyncClient` sessions). '''
+        kwargs['extensions'] = {
+            **(kwargs.get('extensions') or {}), STREAMING_EXTENSION: True
+        }
+        request = self._session.build_request(method, url, **kwargs)
+        return self._session.send(request, stream=True)
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        ''' Sends a GET request with streamed response. '''
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        ''' Sends a POST request with streamed response. '''
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> httpx.Response:
+        ''' Sends a PUT request with streamed response. '''
+        return self.request('PUT', url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> httpx.Response:
+        ''' Sends a PATCH request with streamed response. '''
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> httpx.Response:
+        ''' Sends a DELETE request with streamed response. '''
+        return self.request('DELETE', url, **kwargs)
+
+
+class JsonItemsParser:
+    ''' Incremental parser yielding items of a JSON array or object, either the
+        top-level one or the one under `key` of the top-level object. Only
+        the not yet parsed part of the document is kept in memory. '''
+    WHITESPACE = ' \t\n\r'
+
+    def __init__(self, key: Optional[str] = None):
+        self.key = key
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._closed = False
+        self._state = 'document'
+        self._container_end = None
+
+    def feed(self, text: str) -> List[Any]:
+        ''' Parses next part of the document.
+
+            Args:
+                text (str): Next part of the document.
+
+            Returns:
+                list: Items completed by this part; members of an object
+                      are returned as (name, value) tuples.
+        '''
+        self._buffer += text
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        ''' Parses the rest of the document.
+
+            Returns:
+                list: Remaining items.
+
+            Raises:
+                ValueError: If the document is malformed, incomplete or `key` is missing.
+        '''
+        self._closed = True
+        items = self._parse()
+        if self._state != 'done':
+            raise ValueError('Incomplete JSON document.')
+        if self._buffer:
+            raise ValueError('Extra data after JSON document.')
+        return items
+
+    def _parse(self) -> List[Any]:
+        items = []
+        pos = self._skip_whitespace(0)
+        while pos < len(self._buffer) and self._state != 'done':
+            char = self._buffer[pos]
+            if self._state == 'document':
+                pos = self._open(pos, '[{' if self.key is None else '{')
+            elif char == ',':
+                pos += 1
+            elif self._state in ('members', 'rest') and char == '}':
+                if self._state == 'members':
+                    raise ValueError(f'Key `{self.key}` not found in the document.')
+                pos += 1
+                self._state = 'done'
+            elif self._state in ('items', 'object_items') and char == self._container_end:
+                pos += 1
+                self._state = 'done' if self.key is None else 'rest'
+            elif self._state in ('members', 'rest', 'object_items'):
+                member = self._decode_member(pos)
+                if member is None:
+                    break
+                name, value_pos = member
+                if self._state == 'members' and name == self.key:
+                    pos = self._skip_whitespace(self._open(value_pos, '[{'))
+                    continue
+                value = self._decode(value_pos)
+                if value is None:
+                    break
+                if self._state == 'object_items':
+                    items.append((name, value[0]))
+                pos = value[1]
+            else:
+                item = self._decode(pos)
+                if item is None:
+                    break
+                items.append(item[0])
+                pos = item[1]
+            pos = self._skip_whitespace(pos)
+        self._buffer = self._buffer[pos:]
+        return items
+
+    def _open(self, pos: int, expected: str) -> int:
+        ''' Enters array or object starting at `pos`, returns position following it. '''
+        char = self._buffer[pos]
+        if char not in expected:
+            raise ValueError(f'Expected one of `{expected}`, got `{char}`.')
+        if self._state == 'document' and self.key is not None:
+            self._state = 'members'
+        else:
+            self._state = 'items' if char == '[' else 'object_items'
+            self._container_end = ']' if char == '[' else '}'
+        return pos + 1
+
+    def _skip_whitespace(self, pos: int) -> int:
+        while pos < len(self._buffer) and self._buffer[pos] in self.WHITESPACE:
+            pos += 1
+        return pos
+
+    def _decode(self, pos: int) -> Optional[tuple]:
+        ''' Returns value starting at `pos` and position following it,
+            `None` if the value may be not complete yet. '''
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, pos)
+        except json.JSONDecodeError:
+            if self._closed:
+                raise
+            return None
+        if not self._closed and (end == len(self._buffer)
+                                 or self._buffer[end] in '.eE'):
+            return None  # numbers may continue in the next part
+        return value, end
+
+    def _decode_member(self, pos: int) -> Optional[tuple]:
+        ''' Returns name of object member starting at `pos` and position of its value,
+            `None` if the member is not complete yet. '''
+        name = self._decode(pos)
+        if name is None:
+            return None
+        if not isinstance(name[0], str):
+            raise ValueError('Expected object member name.')
+        pos = self._skip_whitespace(name[1])
+        if pos == len(self._buffer):
+            return None
+        if self._buffer[pos] != ':':
+            raise ValueError(f'Expected `:`, got `{self._buffer[pos]}`.')
+        pos = self._skip_whitespace(pos + 1)
+        if pos == len(self._buffer):
+            return None
+        return name[0], pos
+
+
+def iter_json_items(response: httpx.Response,
+                    key: Optional[str] = None) -> Iterator[Any]:
+    ''' Yields items of a JSON array or object from response body as it is received,
+        keeping memory usage independent of the body size. The response is
+        closed once the iteration is finished.
+
+        Args:
+            response (httpx.Response): Response returned by a client in streaming mode
+                                       (see `HttpClient.streaming`).
+            key (str): Key of the top-level object under which the array or object
+                       of items is stored (e.g. `chats` or `records`). If not
+                       provided, items of the top-level array or object are yielded.
+
+        Yields:
+            Items of an array or (name, value) tuples for members of an object.
+
+        Raises:
+            ValueError: If the body is malformed or `key` is missing.
+    '''
+    parser = JsonItemsParser(key)
+    try:
+        for text in response.iter_text():
+            yield from parser.feed(text)
+        yield from parser.close()
+    finally:
+        response.close()
+
+
+async def aiter_json_items(response: httpx.Response,
+                           key: Optional[str] = None) -> AsyncIterator[Any]:
+    ''' Asyncio variant of `iter_json_items`. '''
+    parser = JsonItemsParser(key)
+    try:
+        async for text in response.aiter_text():
+            for item in parser.feed(text):
+                yield item
+        for item in parser.close():
+            yield item
+    finally:
+        await response.aclose()
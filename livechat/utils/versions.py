@@ -0,0 +1,36 @@
+''' Registry of versioned API modules which are imported on demand. '''
+
+from importlib import import_module
+
+from livechat.config import CONFIG
+
+
+class VersionRegistry:
+    ''' Resolves classes for specific API version. The versioned module
+        (e.g. `<package>.v36`) is imported only once the version is requested,
+        so importing the SDK does not load all versions up front. '''
+    def __init__(self,
+                 package: str,
+                 class_prefix: str,
+                 versions: tuple = CONFIG.get('versions')):
+        self.package = package
+        self.class_prefix = class_prefix
+        self.versions = versions
+
+    def get(self, version: str) -> type:
+        ''' Returns class for provided API version.
+
+            Args:
+                version (str): API's version.
+
+            Returns:
+                type: class for specified version, e.g. `<class_prefix>V36`.
+
+            Raises:
+                ValueError: If the specified version does not exist.
+        '''
+        if version not in self.versions:
+            raise ValueError('Provided version does not exist.')
+        suffix = version.replace('.', '')
+        module = import_module(f'{self.package}.v{suffix}')
+        return getattr(module, f'{self.class_prefix}V{suffix}')
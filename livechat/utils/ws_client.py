@@ -7,8 +7,10 @@ import json
 import random
 import ssl
 import threading
-from time import sleep
-from typing import List, Union
+from collections import deque
+from itertools import islice
+from time import monotonic, sleep
+from typing import Deque, Dict, List, Optional, Union
 
 from loguru import logger
 from websocket import WebSocketApp, WebSocketConnectionClosedException
@@ -18,9 +20,18 @@ from livechat.utils.structures import RtmResponse
 
 
 def on_message(ws_client: WebSocketApp, message: str):
-    ''' Custom WebSocketApp handler that inserts new messages in front of `self.messages` list. '''
+    ''' Custom WebSocketApp handler that hands responses over to the `send` call awaiting them
+        (matched by `request_id`) and inserts all other messages in front of `self.messages`. '''
+    message = json.loads(message)
+    pending_request = None
     with ws_client._messages_lock:
-        ws_client.messages.insert(0, json.loads(message))
+        if message.get('type') == 'response':
+            pending_request = ws_client._pending_requests.pop(
+                message.get('request_id'), None)
+        if pending_request is None:
+            ws_client._store_message(message)
+    if pending_request is not None:
+        pending_request.set_result(message)
 
 
 def on_close(ws_client: WebSocketApp, close_status_code: int, close_msg: str):
@@ -35,12 +46,80 @@ def on_error(ws_client: WebSocketApp, error: Exception):
     logger.error(f'websocket error occurred: {str(error)}')
 
 
-class WebsocketClient(WebSocketApp):
+class RtmMessagesBuffer:
+    ''' Keeps messages (pushes) received through websocket connection which
+        were not matched with any awaiting request, the newest first. '''
+    def __init__(self):
+        self._messages: Deque[dict] = deque(maxlen=1000)
+        self.messages_max_age = None
+        self._messages_received_at: Deque[float] = deque(maxlen=1000)
+        self._messages_lock = threading.Lock()
+
+    @property
+    def messages(self) -> List[dict]:
+        ''' Copy of kept messages (pushes) as a list, the newest first. '''
+        return self.get_messages()
+
+    @messages.setter
+    def messages(self, messages: List[dict]) -> None:
+        with self._messages_lock:
+            self._messages.clear()
+            self._messages_received_at.clear()
+            received_at = monotonic()
+            for message in reversed(messages):
+                self._messages.appendleft(message)
+                self._messages_received_at.appendleft(received_at)
+
+    def set_messages_retention(
+            self,
+            max_length: Optional[int] = 1000,
+            max_age: Union[float, int, None] = None) -> None:
+        ''' Sets limits of messages (pushes) kept in `self.messages`.
+            Args:
+                max_length (int): maximum number of kept messages, the oldest ones are dropped first.
+                    `None` disables the limit, by default sets to 1000.
+                max_age (int or float): maximum age (in seconds) of kept messages,
+                    by default messages are not evicted by age. '''
+        with self._messages_lock:
+            self._messages = deque(self._messages, maxlen=max_length)
+            self._messages_received_at = deque(self._messages_received_at,
+                                               maxlen=max_length)
+            self.messages_max_age = max_age
+
+    def get_messages(self, limit: Optional[int] = None) -> List[dict]:
+        ''' Returns a list of kept messages (pushes), the newest first.
+            Args:
+                limit (int): maximum number of returned messages, by default all of them. '''
+        with self._messages_lock:
+            self._evict_expired_messages(monotonic())
+            return list(islice(self._messages, limit))
+
+    def _store_message(self, message: dict) -> None:
+        ''' Puts message in front of `self.messages` and evicts the messages
+            which exceeded `self.messages_max_age`. Must be called with
+            `self._messages_lock` acquired. '''
+        received_at = monotonic()
+        self._messages.appendleft(message)
+        self._messages_received_at.appendleft(received_at)
+        self._evict_expired_messages(received_at)
+
+    def _evict_expired_messages(self, now: float) -> None:
+        ''' Drops messages which exceeded `self.messages_max_age`. Must be
+            called with `self._messages_lock` acquired. '''
+        if self.messages_max_age is None:
+            return
+        while self._messages_received_at and now - self._messages_received_at[
+                -1] > self.messages_max_age:
+            self._messages.pop()
+            self._messages_received_at.pop()
+
+
+class WebsocketClient(WebSocketApp, RtmMessagesBuffer):
     ''' Custom extension of the WebSocketApp class for livechat python SDK. '''
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.messages: List[dict] = []
-        self._messages_lock = threading.Lock()
+        RtmMessagesBuffer.__init__(self)
+        self._pending_requests: Dict[str, concurrent.futures.Future] = {}
         self.on_message = on_message
         self.on_close = on_close
         self.on_error = on_error
@@ -52,7 +131,9 @@ class WebsocketClient(WebSocketApp):
              ping_interval: Union[float, int] = 5,
              ws_conn_timeout: Union[float, int] = 10,
              keep_alive: bool = True,
-             response_timeout: Union[float, int] = 3) -> None:
+             response_timeout: Union[float, int] = 3,
+             messages_max_length: Optional[int] = 1000,
+             messages_max_age: Union[float, int, None] = None) -> None:
         ''' Opens websocket connection and keep running forever.
             Args:
                 origin (dict): Specifies origin while creating websocket connection.
@@ -64,12 +145,17 @@ class WebsocketClient(WebSocketApp):
                     by default sets to 10 seconds.
                 keep_alive(bool): Bool which states if connection should be kept, by default sets to `True`.
                 response_timeout (int or float): timeout (in seconds) to wait for the response,
-                    by default sets to 3 seconds. '''
+                    by default sets to 3 seconds.
+                messages_max_length (int): maximum number of unmatched messages (pushes) kept in `self.messages`,
+                    the oldest ones are dropped first. `None` disables the limit, by default sets to 1000.
+                messages_max_age (int or float): maximum age (in seconds) of messages kept in `self.messages`,
+                    by default messages are not evicted by age. '''
         if self.sock and self.sock.connected:
             logger.warning(
                 'Cannot open new websocket connection, already connected.')
             return
         self.response_timeout = response_timeout
+        self.set_messages_retention(messages_max_length, messages_max_age)
         run_forever_kwargs = {
             'sslopt': {
                 'cert_reqs': ssl.CERT_NONE
@@ -104,34 +190,24 @@ class WebsocketClient(WebSocketApp):
         request_json = json.dumps(request, indent=4)
         logger.info(f'\nREQUEST:\n{request_json}')
 
-        if not self.sock or self.sock.send(request_json, opcode) == 0:
-            raise WebSocketConnectionClosedException(
-                'Connection is already closed.')
-
-        def await_message(stop_event: threading.Event) -> dict:
-            while not stop_event.is_set():
-                with self._messages_lock:
-                    messages_snapshot = self.messages.copy()
-                for item in messages_snapshot:
-                    if item.get('request_id') == request_id and item.get(
-                            'type') == 'response':
-                        return item
-                sleep(0.2)
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            stop_event = threading.Event()
-            future = executor.submit(await_message, stop_event)
-            try:
-                response = future.result(timeout=self.response_timeout)
-                logger.info(f'\nRESPONSE:\n{json.dumps(response, indent=4)}')
-            except concurrent.futures.TimeoutError:
-                stop_event.set()
-                logger.error(
-                    f'timed out waiting for message with request_id {request_id}'
-                )
-                logger.debug('all websocket messages received before timeout:')
-                logger.debug(self.messages)
-                return None
+        pending_request = concurrent.futures.Future()
+        with self._messages_lock:
+            self._pending_requests[request_id] = pending_request
+        try:
+            if not self.sock or self.sock.send(request_json, opcode) == 0:
+                raise WebSocketConnectionClosedException(
+                    'Connection is already closed.')
+            response = pending_request.result(timeout=self.response_timeout)
+            logger.info(f'\nRESPONSE:\n{json.dumps(response, indent=4)}')
+        except concurrent.futures.TimeoutError:
+            logger.error(
+                f'timed out waiting for message with request_id {request_id}')
+            logger.debug('all websocket messages received before timeout:')
+            logger.debug(self.messages)
+            return None
+        finally:
+            with self._messages_lock:
+                self._pending_requests.pop(request_id, None)
 
         return RtmResponse(response)
 
@@ -0,0 +1,211 @@
+''' ASGI application receiving webhooks. '''
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import inspect
+import json
+import time
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Union
+
+from loguru import logger
+
+from livechat.config import CONFIG
+from livechat.webhooks.parser import (AUTO_VERSION, compile_webhooks,
+                                      parse_webhook)
+
+if TYPE_CHECKING:
+    from livechat.webhooks.replay import WebhookRecorder
+
+stable_version = CONFIG.get('stable')
+
+
+class WebhookReceiver:
+    ''' ASGI application accepting webhooks POSTed by LiveChat, runnable with any
+        ASGI server (e.g. `uvicorn module:receiver`).
+
+        Requests are acknowledged as soon as the `secret_key` is verified; parsing
+        and handling take place afterwards in a background task fed from
+        a bounded queue. If the queue is full, requests are answered with 503
+        so LiveChat delivers them again later.
+
+        Example:
+            async def on_webhook(webhook):
+                ...
+
+            receiver = WebhookReceiver(secrets=['top_secret_value'], handler=on_webhook)
+    '''
+    def __init__(self,
+                 secrets: Iterable[str],
+                 handler: Union[Callable, asyncio.Queue, None] = None,
+                 version: str = stable_version,
+                 lazy: bool = False,
+                 max_pending: int = 10000,
+                 max_body_size: int = 1024 * 1024,
+                 recorder: Optional[WebhookRecorder] = None):
+        ''' Args:
+                secrets (Iterable[str]): Accepted values of webhooks' `secret_key`.
+                handler (Callable or asyncio.Queue): Function or coroutine function
+                        called with parsed webhooks (e.g. `AsyncWebhookDispatcher.dispatch`),
+                        or a queue parsed webhooks are put to.
+                version (str): API's version (or `auto`, see `parse_webhook`).
+                               Defaults to the stable version of API.
+                lazy (bool): If set, webhooks' payloads are parsed on first access
+                             (see `parse_webhook`).
+                max_pending (int): Maximum number of acknowledged webhooks waiting
+                                   for parsing and handling.
+                max_body_size (int): Maximum size (in bytes) of accepted request body.
+                recorder (WebhookRecorder): If provided, raw bodies of acknowledged
+                                            webhooks are recorded (in the background
+                                            task) with their arrival times.
+        '''
+        self.secrets = [secret.encode() for secret in secrets]
+        if not self.secrets:
+            raise ValueError('At least one secret has to be provided.')
+        self.handler = handler
+        self.version = version
+        self.lazy = lazy
+        self.max_pending = max_pending
+        self.max_body_size = max_body_size
+        self.recorder = recorder
+        self.received = 0
+        self.rejected = 0
+        self.overflowed = 0
+        self.handled = 0
+        self.errors = 0
+        self._pending: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        if version != AUTO_VERSION:
+            compile_webhooks(version)
+
+    async def __call__(self, scope: dict, receive: Callable,
+                       send: Callable) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+        if scope['method'] != 'POST':
+            await self._respond(send, 405)
+            return
+        body = await self._read_body(receive)
+        if body is None:
+            await self._respond(send, 413)
+            return
+        try:
+            wh_body = json.loads(body)
+        except ValueError:
+            wh_body = None
+        if not isinstance(wh_body, dict):
+            self.rejected += 1
+            await self._respond(send, 400)
+            return
+        if not self.verify_secret(wh_body.get('secret_key')):
+            self.rejected += 1
+            await self._respond(send, 401)
+            return
+        self.start()
+        try:
+            self._pending.put_nowait((wh_body, body, time.time()
+                                      if self.recorder else None))
+        except asyncio.QueueFull:
+            self.overflowed += 1
+            await self._respond(send, 503)
+            return
+        self.received += 1
+        await self._respond(send, 200)
+
+    def verify_secret(self, secret_key: Optional[str]) -> bool:
+        ''' Indicates if `secret_key` matches any of configured secrets, comparing it
+            with all of them in constant time. '''
+        if not isinstance(secret_key, str):
+            return False
+        secret_key = secret_key.encode()
+        matched = False
+        for secret in self.secrets:
+            matched |= hmac.compare_digest(secret, secret_key)
+        return matched
+
+    def start(self) -> None:
+        ''' Starts background task parsing and handling webhooks (in the running
+            event loop), if not started yet. '''
+        if self._worker is None or self._worker.done():
+            self._pending = self._pending or asyncio.Queue(self.max_pending)
+            self._worker = asyncio.get_running_loop().create_task(self._work())
+
+    async def stop(self) -> None:
+        ''' Waits until acknowledged webhooks are handled and stops background task. '''
+        if self._worker is not None:
+            await self._pending.join()
+            self._worker.cancel()
+            self._worker = None
+
+    def stats(self) -> dict:
+        ''' Returns numbers of acknowledged, rejected (malformed or with invalid
+            secret), overflowed (answered with 503 due to full queue), handled
+            and failed (invalid body or handler error) webhooks and number
+            of webhooks waiting for handling. '''
+        return {
+            'received': self.received,
+            'rejected': self.rejected,
+            'overflowed': self.overflowed,
+            'handled': self.handled,
+            'errors': self.errors,
+            'pending': self._pending.qsize() if self._pending else 0,
+        }
+
+    async def _work(self) -> None:
+        while True:
+            wh_body, body, received_at = await self._pending.get()
+            try:
+                if self.recorder is not None:
+                    await self.recorder.arecord(body, received_at)
+                webhook = parse_webhook(wh_body, self.version, self.lazy)
+                if isinstance(self.handler, asyncio.Queue):
+                    await self.handler.put(webhook)
+                elif self.handler is not None:
+                    result = self.handler(webhook)
+                    if inspect.isawaitable(result):
+                        await result
+                self.handled += 1
+            except Exception:  # pylint: disable=broad-except
+                self.errors += 1
+                logger.exception('Handling of webhook failed.')
+            finally:
+                self._pending.task_done()
+
+    async def _read_body(self, receive: Callable) -> Optional[bytes]:
+        ''' Returns request body, `None` if it exceeds `max_body_size`. '''
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > self.max_body_size:
+                return None
+            chunks.append(chunk)
+            more_body = message.get('more_body', False)
+        return b''.join(chunks)
+
+    @staticmethod
+    async def _respond(send: Callable, status: int) -> None:
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-length', b'0')],
+        })
+        await send({'type': 'http.response.body', 'body': b''})
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self.start()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.stop()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
@@ -0,0 +1,190 @@
+''' Webhooks deduplication module. '''
+
+import json
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+# action => function returning identity of the payload (as a dict)
+PAYLOAD_IDENTITY: Dict[str, Callable[[dict], tuple]] = {
+    'incoming_chat': lambda payload: (payload['chat'].get('id'),
+                                      (payload['chat'].get('thread') or {}).get('id')),
+    'incoming_event': lambda payload: (payload['chat_id'], payload['thread_id'],
+                                       payload['event'].get('id')),
+    'event_updated': lambda payload: (payload['chat_id'], payload['thread_id'],
+                                      payload['event'].get('id'),
+                                      json.dumps(payload['event'], sort_keys=True)),
+    'chat_deactivated': lambda payload: (payload['chat_id'], payload['thread_id']),
+}
+
+
+class MemoryDedupBackend:
+    ''' In-memory store of seen keys, bounded by the number of keys (least recently
+        seen ones are evicted first) and by their age. '''
+    def __init__(self, max_size: int = 10000):
+        ''' Args:
+                max_size (int): Maximum number of keys kept.
+        '''
+        self.max_size = max_size
+        self._expires_at: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def add(self, key: str, ttl: float) -> bool:
+        ''' Adds `key` for `ttl` seconds.
+
+            Returns:
+                bool: `True` if `key` was added, `False` if it is already present.
+        '''
+        now = monotonic()
+        with self._lock:
+            expires_at = self._expires_at.get(key)
+            if expires_at is not None and expires_at > now:
+                self._expires_at.move_to_end(key)
+                return False
+            self._expires_at[key] = now + ttl
+            self._expires_at.move_to_end(key)
+            while self._expires_at:
+                oldest_key, oldest_expires_at = next(
+                    iter(self._expires_at.items()))
+                if oldest_expires_at > now and len(
+                        self._expires_at) <= self.max_size:
+                    break
+                del self._expires_at[oldest_key]
+            return True
+
+
+class SetNxDedupBackend:
+    ''' Store of seen keys shared by many processes, kept in a Redis-compatible
+        server (e.g. `redis.Redis` client instance), with keys expiring
+        after their TTL. '''
+    def __init__(self, client: Any, prefix: str = 'livechat:webhook:'):
+        ''' Args:
+                client: Client with `set(name, value, ex=None, nx=False)` method
+                        returning truthy value only if the key was set.
+                prefix (str): Prefix of stored keys.
+        '''
+        self.client = client
+        self.prefix = prefix
+
+    def add(self, key: str, ttl: float) -> bool:
+        ''' Adds `key` for `ttl` seconds (rounded up to a whole second).
+
+            Returns:
+                bool: `True` if `key` was added, `False` if it is already present.
+        '''
+        return bool(
+            self.client.set(f'{self.prefix}{key}',
+                            1,
+                            ex=max(1, math.ceil(ttl)),
+                            nx=True))
+
+
+class WebhookDeduplicator:
+    ''' Detects repeated deliveries of webhooks (LiveChat retries webhooks which
+        were not acknowledged in time).
+
+        Webhooks are identified by `webhook_id`, `action` and identity of
+        the payload: IDs of chat, thread and event for actions listed in
+        `PAYLOAD_IDENTITY`. Webhooks of other actions are not deduplicated,
+        as their payloads do not identify them: e.g. a routing status set back
+        to its previous value within TTL would be taken for a repeated delivery.
+        A `key_function` can be provided to identify them anyway.
+    '''
+    def __init__(self,
+                 ttl: float = 600,
+                 max_size: int = 10000,
+                 backend: Union[MemoryDedupBackend, SetNxDedupBackend,
+                                None] = None,
+                 key_function: Optional[Callable[[Any], Optional[str]]] = None):
+        ''' Args:
+                ttl (float): Time (in seconds) for which repeated deliveries are
+                             detected, by default 10 minutes.
+                max_size (int): Maximum number of webhooks remembered by the
+                                default in-memory backend.
+                backend: Store of seen keys with `add(key, ttl) -> bool` method,
+                         by default `MemoryDedupBackend`.
+                key_function (Callable): Function returning key identifying
+                                         delivery of given webhook (body or parsed
+                                         webhook), `None` if it should not be
+                                         deduplicated. By default `key` is used.
+        '''
+        self.ttl = ttl
+        self.backend = backend if backend is not None else MemoryDedupBackend(
+            max_size)
+        self.key_function = key_function or self.key
+        self.hits = 0
+        self.misses = 0
+        self.unidentified = 0
+        self._counters_lock = threading.Lock()
+
+    @staticmethod
+    def key(webhook: Union[dict, Any]) -> Optional[str]:
+        ''' Returns key identifying webhook delivery, `None` if webhook's action
+            is not listed in `PAYLOAD_IDENTITY`.
+
+            Args:
+                webhook (dict or Webhook): Webhook body or parsed webhook.
+        '''
+        if isinstance(webhook, dict):
+            webhook_id = webhook.get('webhook_id')
+            action = webhook.get('action')
+        else:
+            webhook_id = webhook.webhook_id
+            action = webhook.action
+        identity_function = PAYLOAD_IDENTITY.get(action)
+        if identity_function is None:
+            return None
+        payload = webhook.get('payload') if isinstance(
+            webhook, dict) else webhook.payload
+        if is_dataclass(payload):
+            payload = {
+                field.name: getattr(payload, field.name)
+                for field in fields(payload)
+            }
+        try:
+            identity = identity_function(payload)
+        except (KeyError, TypeError, AttributeError):
+            return None
+        return json.dumps([webhook_id, action, identity], default=str)
+
+    def is_duplicate(self, webhook: Union[dict, Any]) -> bool:
+        ''' Indicates if webhook was already seen within TTL, remembering it otherwise.
+
+            Args:
+                webhook (dict or Webhook): Webhook body or parsed webhook.
+        '''
+        key = self.key_function(webhook)
+        if key is None:
+            with self._counters_lock:
+                self.unidentified += 1
+            return False
+        duplicate = not self.backend.add(key, self.ttl)
+        with self._counters_lock:
+            if duplicate:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return duplicate
+
+    def deduplicate(self, webhooks: Iterable) -> Iterator:
+        ''' Yields webhooks skipping repeated deliveries, e.g. from `parse_webhooks`. '''
+        for webhook in webhooks:
+            if not self.is_duplicate(webhook):
+                yield webhook
+
+    def stats(self) -> dict:
+        ''' Returns numbers of repeated (`hits`) and first (`misses`) deliveries,
+            of webhooks without key (`unidentified`) and hit ratio. '''
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'unidentified': self.unidentified,
+            'hit_ratio': self.hits / total if total else 0.0,
+        }
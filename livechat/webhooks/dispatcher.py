@@ -0,0 +1,378 @@
+''' Webhooks dispatcher module. '''
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import inspect
+import queue
+import threading
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Union
+
+from loguru import logger
+
+from livechat.config import CONFIG
+from livechat.webhooks.dedup import WebhookDeduplicator
+from livechat.webhooks.parser import (AUTO_VERSION, PREFERRED_VERSIONS,
+                                      compile_webhooks, parse_webhook,
+                                      webhook_signature_index)
+
+stable_version = CONFIG.get('stable')
+
+
+class ActionMetrics:
+    ''' Counters and timings of webhooks of a single action. Latency is measured
+        from dispatching a webhook until its handlers finished, duration
+        covers handlers execution only. '''
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+
+    def record(self, latency: float, duration: float, failed: bool) -> None:
+        ''' Records handling of a single webhook. '''
+        self.count += 1
+        self.errors += failed
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+
+    def as_dict(self) -> dict:
+        ''' Returns metrics with mean values computed. '''
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'mean_latency': self.total_latency / self.count if self.count else 0.0,
+            'max_latency': self.max_latency,
+            'mean_duration': self.total_duration / self.count if self.count else 0.0,
+            'max_duration': self.max_duration,
+        }
+
+
+class BaseWebhookDispatcher(abc.ABC):
+    ''' Registry of webhook handlers with an action => handlers lookup table. '''
+    def __init__(self,
+                 version: str = stable_version,
+                 max_queue_size: int = 1000,
+                 lazy: bool = False,
+                 deduplicator: Optional[WebhookDeduplicator] = None):
+        ''' Args:
+                version (str): API's version (or `auto`, see `parse_webhook`).
+                               Defaults to the stable version of API.
+                max_queue_size (int): Maximum number of webhooks waiting for handlers;
+                                      dispatching blocks while the queue is full.
+                lazy (bool): If set, webhooks' payloads are parsed on first access
+                             (see `parse_webhook`).
+                deduplicator (WebhookDeduplicator): If provided, repeated deliveries
+                                                    of webhooks are not dispatched.
+        '''
+        self.version = version
+        self.max_queue_size = max_queue_size
+        self.lazy = lazy
+        self.deduplicator = deduplicator
+        self.duplicates = 0
+        self.actions = frozenset(
+            webhook_signature_index(PREFERRED_VERSIONS) if version ==
+            AUTO_VERSION else compile_webhooks(version)[1])
+        self.handlers: Dict[str, List[Callable]] = {}
+        self.unhandled = 0
+        self.max_queue_depth = 0
+        self._metrics: Dict[str, ActionMetrics] = {}
+        self._metrics_lock = threading.Lock()
+
+    def register(self,
+                 action: str,
+                 handler: Optional[Callable] = None) -> Callable:
+        ''' Registers `handler` to be called with parsed webhooks of given action.
+            Can be used as a decorator if `handler` is not provided.
+
+            Args:
+                action (str): Webhook action, e.g. `incoming_chat`.
+                handler (Callable): Callable accepting parsed webhook.
+
+            Returns:
+                Callable: Registered handler (or decorator registering one).
+
+            Raises:
+                ValueError: If `action` does not exist in dispatcher's API version.
+        '''
+        if action not in self.actions:
+            raise ValueError(
+                f'`{action}` is invalid webhook action for version {self.version}.'
+            )
+        if handler is None:
+            return lambda handler: self.register(action, handler)
+        self.handlers.setdefault(action, []).append(handler)
+        self._metrics.setdefault(action, ActionMetrics())
+        return handler
+
+    def metrics(self) -> dict:
+        ''' Returns current queue depth, the maximum one observed, numbers of
+            webhooks without handlers and of repeated deliveries skipped and
+            per-action metrics (see `ActionMetrics`). '''
+        with self._metrics_lock:
+            return {
+                'queue_depth': self.queue_depth,
+                'max_queue_depth': self.max_queue_depth,
+                'unhandled': self.unhandled,
+                'duplicates': self.duplicates,
+                'actions': {
+                    action: metrics.as_dict()
+                    for action, metrics in self._metrics.items()
+                },
+            }
+
+    @property
+    @abc.abstractmethod
+    def queue_depth(self) -> int:
+        ''' Number of webhooks waiting for handlers. '''
+
+    def _route(self, webhook: Union[dict, object]) -> Optional[tuple]:
+        ''' Returns parsed webhook and its handlers, `None` if there are none
+            or the webhook is a repeated delivery. '''
+        parsed_wh = parse_webhook(webhook, self.version,
+                                  self.lazy) if isinstance(webhook,
+                                                           dict) else webhook
+        handlers = self.handlers.get(parsed_wh.action)
+        if handlers is None:
+            with self._metrics_lock:
+                self.unhandled += 1
+            return None
+        if self.deduplicator is not None and self.deduplicator.is_duplicate(
+                webhook):
+            with self._metrics_lock:
+                self.duplicates += 1
+            return None
+        return parsed_wh, handlers
+
+    def _record(self, action: str, dispatched_at: float, started_at: float,
+                failed: bool) -> None:
+        finished_at = perf_counter()
+        with self._metrics_lock:
+            self._metrics[action].record(finished_at - dispatched_at,
+                                         finished_at - started_at, failed)
+
+    def _track_queue_depth(self) -> None:
+        depth = self.queue_depth
+        if depth > self.max_queue_depth:
+            with self._metrics_lock:
+                self.max_queue_depth = max(self.max_queue_depth, depth)
+
+
+class WebhookDispatcher(BaseWebhookDispatcher):
+    ''' Dispatches webhooks to handlers registered per action, running them in
+        a pool of worker threads fed from a bounded queue.
+
+        Example:
+            dispatcher = WebhookDispatcher(workers=8)
+
+            @dispatcher.register('incoming_chat')
+            def on_incoming_chat(webhook):
+                ...
+
+            with dispatcher:
+                dispatcher.dispatch(wh_body)
+    '''
+    def __init__(self,
+                 version: str = stable_version,
+                 workers: int = 4,
+                 max_queue_size: int = 1000,
+                 lazy: bool = False,
+                 deduplicator: Optional[WebhookDeduplicator] = None):
+        ''' Args:
+                version (str): API's version (or `auto`, see `parse_webhook`).
+                               Defaults to the stable version of API.
+                workers (int): Number of threads running handlers.
+                max_queue_size (int): Maximum number of webhooks waiting for handlers;
+                                      dispatching blocks while the queue is full.
+                lazy (bool): If set, webhooks' payloads are parsed on first access
+                             (see `parse_webhook`).
+                deduplicator (WebhookDeduplicator): If provided, repeated deliveries
+                                                    of webhooks are not dispatched.
+        '''
+        super().__init__(version, max_queue_size, lazy, deduplicator)
+        self.workers = workers
+        self._queue = queue.Queue(max_queue_size)
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        ''' Starts worker threads. '''
+        if self._threads:
+            return
+        self._threads = [
+            threading.Thread(target=self._work,
+                             name=f'webhook-dispatcher-{number}',
+                             daemon=True) for number in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        ''' Waits until queued webhooks are handled and stops worker threads. '''
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def dispatch(self,
+                 webhook: Union[dict, object],
+                 block: bool = True,
+                 timeout: Optional[float] = None) -> bool:
+        ''' Parses webhook (if not parsed yet) and queues it for its action's handlers.
+
+            Args:
+                webhook (dict or Webhook): Webhook body or parsed webhook.
+                block (bool): Whether to wait for a free slot while the queue is full.
+                timeout (float): Maximum time (in seconds) to wait for a free slot,
+                                 by default waits as long as needed.
+
+            Returns:
+                bool: `True` if webhook was queued, `False` if there are no handlers
+                      registered for its action or it is a repeated delivery.
+
+            Raises:
+                ValueError: If webhook body is invalid.
+                queue.Full: If the queue is full and `block` is not set or
+                            `timeout` elapsed.
+                RuntimeError: If dispatcher is not started.
+        '''
+        if not self._threads:
+            raise RuntimeError('Dispatcher is not started.')
+        routed = self._route(webhook)
+        if routed is None:
+            return False
+        self._queue.put((*routed, perf_counter()), block, timeout)
+        self._track_queue_depth()
+        return True
+
+    def __enter__(self) -> WebhookDispatcher:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            webhook, handlers, dispatched_at = item
+            started_at = perf_counter()
+            failed = False
+            for handler in handlers:
+                try:
+                    handler(webhook)
+                except Exception:  # pylint: disable=broad-except
+                    failed = True
+                    logger.exception(
+                        f'Handler of `{webhook.action}` webhook failed.')
+            self._record(webhook.action, dispatched_at, started_at, failed)
+
+
+class AsyncWebhookDispatcher(BaseWebhookDispatcher):
+    ''' Dispatches webhooks to handlers registered per action, running them in
+        asyncio tasks fed from a bounded queue. Handlers may be coroutine
+        functions; regular functions are called directly in the event loop.
+    '''
+    def __init__(self,
+                 version: str = stable_version,
+                 workers: int = 4,
+                 max_queue_size: int = 1000,
+                 lazy: bool = False,
+                 deduplicator: Optional[WebhookDeduplicator] = None):
+        ''' Args:
+                version (str): API's version (or `auto`, see `parse_webhook`).
+                               Defaults to the stable version of API.
+                workers (int): Number of tasks running handlers concurrently.
+                max_queue_size (int): Maximum number of webhooks waiting for handlers;
+                                      dispatching waits while the queue is full.
+                lazy (bool): If set, webhooks' payloads are parsed on first access
+                             (see `parse_webhook`).
+                deduplicator (WebhookDeduplicator): If provided, repeated deliveries
+                                                    of webhooks are not dispatched.
+        '''
+        super().__init__(version, max_queue_size, lazy, deduplicator)
+        self.workers = workers
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        ''' Starts worker tasks in the running event loop. '''
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(self.max_queue_size)
+        self._tasks = [
+            asyncio.create_task(self._work()) for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        ''' Waits until queued webhooks are handled and stops worker tasks. '''
+        for _ in self._tasks:
+            await self._queue.put(None)
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
+
+    async def dispatch(self, webhook: Union[dict, object]) -> bool:
+        ''' Parses webhook (if not parsed yet) and queues it for its action's handlers,
+            waiting for a free slot while the queue is full.
+
+            Args:
+                webhook (dict or Webhook): Webhook body or parsed webhook.
+
+            Returns:
+                bool: `True` if webhook was queued, `False` if there are no handlers
+                      registered for its action or it is a repeated delivery.
+
+            Raises:
+                ValueError: If webhook body is invalid.
+                RuntimeError: If dispatcher is not started.
+        '''
+        if not self._tasks:
+            raise RuntimeError('Dispatcher is not started.')
+        routed = self._route(webhook)
+        if routed is None:
+            return False
+        await self._queue.put((*routed, perf_counter()))
+        self._track_queue_depth()
+        return True
+
+    async def __aenter__(self) -> AsyncWebhookDispatcher:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _work(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            webhook, handlers, dispatched_at = item
+            started_at = perf_counter()
+            failed = False
+            for handler in handlers:
+                try:
+                    result = handler(webhook)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:  # pylint: disable=broad-except
+                    failed = True
+                    logger.exception(
+                        f'Handler of `{webhook.action}` webhook failed.')
+            self._record(webhook.action, dispatched_at, started_at, failed)
@@ -1,53 +1,378 @@
 ''' Webhooks parser module. '''
 
-from typing import Union
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import MISSING, fields
+from typing import (IO, TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator,
+                    List, Optional, Tuple, Union)
 
 from livechat.config import CONFIG
-from livechat.webhooks.v34 import WebhookV34
-from livechat.webhooks.v35 import WebhookV35
-from livechat.webhooks.v36 import WebhookV36
-from livechat.webhooks.v37 import WebhookV37
+from livechat.utils.versions import VersionRegistry
+
+if TYPE_CHECKING:
+    from livechat.webhooks.v34 import WebhookV34
+    from livechat.webhooks.v35 import WebhookV35
+    from livechat.webhooks.v36 import WebhookV36
+    from livechat.webhooks.v37 import WebhookV37
 
 stable_version = CONFIG.get('stable')
+# version detected from the webhook body, see `detect_webhook_version`
+AUTO_VERSION = 'auto'
+# versions webhooks are attributed to by default, in order of preference:
+# the stable one first and the rest from the newest
+PREFERRED_VERSIONS = (stable_version, *sorted(
+    (version for version in CONFIG.get('versions') if version != stable_version),
+    key=lambda version: tuple(map(int, version.split('.'))),
+    reverse=True))
+
+webhooks = VersionRegistry('livechat.webhooks', 'Webhook')
+
+
+# version => (webhook data class, action => payload data class)
+compiled_webhooks: Dict[str, Tuple[type, Dict[str, type]]] = {}
+# version => webhook data class with payload created on first access
+lazy_webhook_classes: Dict[str, type] = {}
+# preferred versions => action => (required payload fields, all payload fields, version)
+webhook_signature_indexes: Dict[Tuple[str, ...], Dict[str, List[Tuple[
+    FrozenSet[str], FrozenSet[str], str]]]] = {}
+
+
+def compile_webhooks(version: str) -> Tuple[type, Dict[str, type]]:
+    ''' Returns (and caches) webhook data class and payload data classes
+        of all actions for given version.
+
+        Raises:
+            ValueError: If the specified version does not exist.
+    '''
+    if version not in compiled_webhooks:
+        webhook_data_class = webhooks.get(version)
+        compiled_webhooks[version] = (webhook_data_class, dict(
+            getattr(sys.modules[webhook_data_class.__module__],
+                    f'action_to_data_class_mapping_v_{version.replace(".", "")}')))
+    return compiled_webhooks[version]
+
+
+def webhook_signature_index(
+    versions: Tuple[str, ...]
+) -> Dict[str, List[Tuple[FrozenSet[str], FrozenSet[str], str]]]:
+    ''' Returns (and caches) index of payload signatures of given versions.
+
+        For each action it lists distinct (required fields, all fields) pairs of
+        payload data classes along with the first of `versions` declaring them,
+        so payloads shared by many versions resolve to the preferred one.
+    '''
+    if versions not in webhook_signature_indexes:
+        index = {}
+        for version in versions:
+            for action, payload_data_class in compile_webhooks(
+                    version)[1].items():
+                payload_fields = fields(payload_data_class)
+                required = frozenset(
+                    field.name for field in payload_fields
+                    if field.default is MISSING
+                    and field.default_factory is MISSING)
+                allowed = frozenset(field.name for field in payload_fields)
+                signatures = index.setdefault(action, [])
+                if not any(signature[:2] == (required, allowed)
+                           for signature in signatures):
+                    signatures.append((required, allowed, version))
+        webhook_signature_indexes[versions] = index
+    return webhook_signature_indexes[versions]
+
+
+def detect_webhook_version(wh_body: dict,
+                           versions: Optional[Iterable[str]] = None) -> str:
+    ''' Detects API version of webhook from its action and payload fields,
+        without trial parsing.
+
+        Webhooks of many versions often share identical structure; such webhooks
+        are attributed to the first matching version from `versions`.
+
+        Args:
+            wh_body (dict): Webhook body received from LiveChat API.
+            versions (Iterable[str]): Candidate versions in order of preference.
+                                      Defaults to the stable version followed by
+                                      the other ones from the newest.
+
+        Returns:
+            str: Detected API version. If only one of versions declares payload
+                 for webhook's action, its fields are not checked here (they are
+                 validated while parsing).
+
+        Raises:
+            ValueError: If the webhook does not match any of versions.
+    '''
+    if not versions:
+        versions = PREFERRED_VERSIONS
+    elif not isinstance(versions, tuple):
+        versions = tuple(versions)
+    index = webhook_signature_indexes.get(
+        versions) or webhook_signature_index(versions)
+    try:
+        action = wh_body['action']
+        payload_keys = wh_body['payload'].keys()
+    except (KeyError, TypeError, AttributeError) as error:
+        raise ValueError(
+            'Invalid webhook body. It should contain `action` and `payload` fields.'
+        ) from error
+    signatures = index.get(action)
+    if signatures is None:
+        raise ValueError(
+            f'`{action}` is invalid webhook action. '
+            'Check the correctness of the webhook body provided.')
+    if len(signatures) == 1:
+        # the only candidate, its fields are validated while parsing anyway
+        return signatures[0][2]
+    for required, allowed, version in signatures:
+        if payload_keys >= required and payload_keys <= allowed:
+            return version
+    raise ValueError(
+        f'Invalid webhook payload. It does not match `{action}` payload '
+        f'of any of versions {", ".join(versions)}.')
+
+
+def lazy_webhook_class(version: str) -> type:
+    ''' Returns (and caches) subclass of webhook data class for given version
+        which creates payload's data class on first access to `payload`.
+        Its `repr` shows the payload as received (without validating it),
+        while comparisons and `dataclasses.asdict` access the payload. '''
+    if version not in lazy_webhook_classes:
+        webhook_data_class, payload_data_classes = compile_webhooks(version)
+        payload_slot = webhook_data_class.__dict__['payload']
+        field_names = [data_field.name for data_field in fields(webhook_data_class)]
+
+        def get_payload(webhook):
+            payload = payload_slot.__get__(webhook)
+            if isinstance(payload, dict):
+                payload = create_payload(
+                    payload_data_classes[webhook.action], payload)
+                payload_slot.__set__(webhook, payload)
+            return payload
+
+        def raw_values(webhook) -> dict:
+            return {
+                name: payload_slot.__get__(webhook)
+                if name == 'payload' else getattr(webhook, name)
+                for name in field_names
+            }
+
+        def webhook_repr(webhook) -> str:
+            values = ', '.join(f'{name}={value!r}'
+                               for name, value in raw_values(webhook).items())
+            return f'{webhook_data_class.__qualname__}({values})'
+
+        def webhook_reduce(webhook) -> tuple:
+            return restore_lazy_webhook, (version, raw_values(webhook))
+
+        lazy_webhook_classes[version] = type(
+            f'Lazy{webhook_data_class.__name__}', (webhook_data_class, ), {
+                '__slots__': (),
+                '__doc__': 'Webhook data class creating payload\'s data class '
+                'on first access to `payload`.',
+                '__repr__': webhook_repr,
+                '__reduce__': webhook_reduce,
+                'payload': property(get_payload, payload_slot.__set__),
+            })
+    return lazy_webhook_classes[version]
+
+
+def restore_lazy_webhook(version: str, values: dict):
+    ''' Recreates lazily parsed webhook of given version from its unpickled fields. '''
+    return lazy_webhook_class(version)(**values)
+
+
+def create_payload(payload_data_class: type, payload: dict):
+    ''' Returns instance of `payload_data_class` with fields from `payload`.
+
+        Raises:
+            ValueError: If provided `payload` is invalid (contains additional,
+                        invalid or missing fields).
+    '''
+    try:
+        return payload_data_class(**payload)
+    except TypeError as error:
+        raise ValueError(
+            'Invalid webhook payload. It should contain the following fields: '
+            f'{payload_data_class.__annotations__}') from error
 
 
 def parse_webhook(
     wh_body: dict,
     version: str = stable_version,
+    lazy: bool = False,
 ) -> Union[WebhookV34, WebhookV35, WebhookV36, WebhookV37]:
     ''' Parses provided `wh_body` to a `Webhook` data class.
 
         Args:
             wh_body (dict): Webhook body received from LiveChat API.
             version (str): API's version. Defaults to the stable version of API.
+                           If set to `auto`, the version is detected from
+                           the body (see `detect_webhook_version`).
+            lazy (bool): If set, payload's data class is created on first access
+                         to `payload` (so webhooks routed on other fields only do
+                         not pay for it); its fields are validated then as well.
 
         Returns:
             Webhook: data class with fields parsed from `wh_body`.
 
         Raises:
             ValueError: If provided `wh_body` is invalid (contains additional,
-                        invalid or missing fields).
+                        invalid or missing fields) or the specified version
+                        does not exist.
     '''
-    webhook_data_class = {
-        '3.4': WebhookV34,
-        '3.5': WebhookV35,
-        '3.6': WebhookV36,
-        '3.7': WebhookV37,
-    }.get(version)
+    if version == AUTO_VERSION:
+        version = detect_webhook_version(wh_body)
+    webhook_data_class, payload_data_classes = compiled_webhooks.get(
+        version) or compile_webhooks(version)
+    if lazy:
+        webhook_data_class = lazy_webhook_classes.get(
+            version) or lazy_webhook_class(version)
     try:
         parsed_wh = webhook_data_class(**wh_body)
+        payload_data_class = payload_data_classes[parsed_wh.action]
     except TypeError as error:
         raise ValueError(
             'Invalid webhook body. It should contain the following fields: '
-            f'{webhook_data_class.__annotations__}') from error
-    try:
-        parsed_wh.payload = parsed_wh.payload_data_class()(**parsed_wh.payload)
+            f'{compiled_webhooks[version][0].__annotations__}') from error
     except KeyError as error:
         raise ValueError(
             f'`{parsed_wh.action}` is invalid webhook action. '
             'Check the correctness of the webhook body provided.') from error
-    except TypeError as error:
-        raise ValueError(
-            'Invalid webhook payload. It should contain the following fields: '
-            f'{parsed_wh.payload_data_class().__annotations__}') from error
+    if lazy:
+        if not isinstance(wh_body['payload'], dict):
+            raise ValueError(
+                'Invalid webhook payload. It should contain the following fields: '
+                f'{payload_data_class.__annotations__}')
+        return parsed_wh
+    parsed_wh.payload = create_payload(payload_data_class, parsed_wh.payload)
     return parsed_wh
+
+
+def parse_webhooks(
+    source: Union[str, os.PathLike, IO, Iterable[Union[dict, str, bytes]]],
+    version: str = stable_version,
+    processes: Optional[int] = None,
+    chunk_size: int = 1000,
+    errors: Optional[List[Tuple[int, ValueError]]] = None,
+    lazy: bool = False,
+) -> Iterator[Union[WebhookV34, WebhookV35, WebhookV36, WebhookV37]]:
+    ''' Parses webhook bodies lazily, one by one or in chunks spread across
+        a process pool, keeping memory usage bounded.
+
+        Args:
+            source: Path to a newline-delimited JSON file, file object open for
+                    reading such a file, or an iterable of webhook bodies (dicts
+                    or JSON documents). Blank lines are skipped.
+            version (str): API's version (or `auto`, see `parse_webhook`).
+                           Defaults to the stable version of API.
+            processes (int): Number of worker processes decoding JSON documents
+                             in chunks. Webhooks are validated and their data
+                             classes created once, in the current process.
+                             Receiving decoded bodies costs about as much as
+                             decoding small documents, so it pays off for large
+                             bodies (e.g. long messages) on multiple cores only.
+                             By default records are processed in the current
+                             process only.
+            chunk_size (int): Number of records sent to a worker process at once.
+            errors (list): If provided, invalid records are skipped and
+                           (index of record in `source`, error) tuples are
+                           appended to it instead of raising.
+            lazy (bool): If set, payloads' data classes are created on first access
+                         (see `parse_webhook`).
+
+        Yields:
+            Webhook: data classes with fields parsed from subsequent records,
+                     in the order of `source`.
+
+        Raises:
+            ValueError: If a record is invalid (and `errors` is not provided)
+                        or the specified version does not exist.
+    '''
+    if version != AUTO_VERSION:
+        compile_webhooks(version)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            yield from parse_webhooks(file, version, processes, chunk_size,
+                                      errors, lazy)
+        return
+    records = ((index, record) for index, record in enumerate(source)
+               if not isinstance(record, (str, bytes)) or record.strip())
+    if processes is not None:
+        decoded = (
+            item for chunk in decode_in_processes(records, processes,
+                                                  chunk_size, errors is None)
+            for item in chunk)
+    else:
+        decoded = ((index, decode_record(record)) for index, record in records)
+    for index, wh_body in decoded:
+        try:
+            if isinstance(wh_body, ValueError):
+                raise wh_body
+            parsed_wh = parse_webhook(wh_body, version, lazy)
+        except ValueError as error:
+            if errors is None:
+                raise
+            errors.append((index, error))
+            continue
+        yield parsed_wh
+
+
+def decode_record(record: Union[dict, str, bytes]) -> Union[dict, ValueError]:
+    ''' Returns webhook body decoded from `record` or error if it is invalid. '''
+    if isinstance(record, dict):
+        return record
+    if not isinstance(record, (str, bytes)):
+        return ValueError(
+            'Invalid webhook record. It should be a dict or a JSON document, '
+            f'not `{type(record).__name__}`.')
+    try:
+        return json.loads(record)
+    except ValueError as error:
+        return error
+
+
+def decode_in_processes(records: Iterator[Tuple[int, Union[dict, str, bytes]]],
+                        processes: int, chunk_size: int,
+                        stop_on_error: bool) -> Iterator[list]:
+    ''' Yields results of `decode_webhooks_chunk` for subsequent chunks of `records`
+        processed in a process pool, with at most two chunks per process in flight. '''
+    with ProcessPoolExecutor(processes) as executor:
+        pending = deque()
+        try:
+            while True:
+                chunk = list(itertools.islice(records, chunk_size))
+                if chunk:
+                    pending.append(
+                        executor.submit(decode_webhooks_chunk, chunk,
+                                        stop_on_error))
+                if pending and (not chunk or len(pending) >= 2 * processes):
+                    yield pending.popleft().result()
+                elif not chunk:
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def decode_webhooks_chunk(records: List[Tuple[int, Union[dict, str, bytes]]],
+                          stop_on_error: bool) -> list:
+    ''' Decodes chunk of (index, record) pairs.
+
+        Returns:
+            list: (index, webhook body or error) pairs (see `decode_record`).
+                  If `stop_on_error` is set, decoding stops at the first
+                  invalid record.
+    '''
+    decoded = []
+    for index, record in records:
+        wh_body = decode_record(record)
+        decoded.append((index, wh_body))
+        if stop_on_error and isinstance(wh_body, ValueError):
+            break
+    return decoded
@@ -0,0 +1,227 @@
+''' Webhooks recording and replaying module. '''
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import inspect
+import json
+import os
+import threading
+import time
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+
+class WebhookRecorder:
+    ''' Appends raw webhook bodies with their arrival times to a gzip-compressed
+        newline-delimited JSON file, one `{"t": <unix time>, "body": {...}}`
+        record per line. Recording to an existing file appends a new gzip
+        member to it, so recordings can be resumed.
+
+        Example:
+            with WebhookRecorder('webhooks.ndjson.gz') as recorder:
+                receiver = WebhookReceiver(secrets, handler, recorder=recorder)
+                ...
+    '''
+    def __init__(self, path: Union[str, os.PathLike], compresslevel: int = 6):
+        ''' Args:
+                path (str): Path of the recording file.
+                compresslevel (int): gzip compression level (1-9).
+        '''
+        self.path = path
+        self.recorded = 0
+        self._file = gzip.open(path, 'ab', compresslevel=compresslevel)
+        self._lock = threading.Lock()
+
+    def record(self,
+               wh_body: Union[dict, str, bytes],
+               received_at: Optional[float] = None) -> None:
+        ''' Appends webhook body to the recording.
+
+            Args:
+                wh_body (dict, str or bytes): Webhook body or its JSON document.
+                received_at (float): Unix time of arrival, by default the current time.
+        '''
+        if isinstance(wh_body, dict):
+            wh_body = json.dumps(wh_body, separators=(',', ':')).encode()
+        elif isinstance(wh_body, str):
+            wh_body = wh_body.encode()
+        # line breaks may only occur between tokens of a valid JSON document
+        wh_body = wh_body.replace(b'\n', b' ').replace(b'\r', b' ')
+        line = b'{"t":%.6f,"body":%s}\n' % (received_at or time.time(), wh_body)
+        with self._lock:
+            self._file.write(line)
+            self.recorded += 1
+
+    async def arecord(self,
+                      wh_body: Union[dict, str, bytes],
+                      received_at: Optional[float] = None) -> None:
+        ''' Appends webhook body to the recording in a worker thread, so that
+            compression and file writes do not block the event loop
+            (see `record`). '''
+        await asyncio.to_thread(self.record, wh_body, received_at or time.time())
+
+    def parse_webhook(self, wh_body: dict, *args, **kwargs):
+        ''' Records webhook body and parses it with `parse_webhook`. '''
+        from livechat.webhooks.parser import \
+            parse_webhook  # pylint: disable=import-outside-toplevel
+        self.record(wh_body)
+        return parse_webhook(wh_body, *args, **kwargs)
+
+    def close(self) -> None:
+        ''' Flushes and closes the recording file. '''
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> WebhookRecorder:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_recording(
+        path: Union[str, os.PathLike]) -> Iterator[Tuple[float, dict]]:
+    ''' Yields (unix time of arrival, webhook body) tuples from a recording
+        written by `WebhookRecorder`, in the order of recording. '''
+    with gzip.open(path, 'rb') as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                yield record['t'], record['body']
+
+
+class ReplayReport:
+    ''' Summary of a replay: numbers of calls and failures, throughput and
+        latency percentiles (in seconds). '''
+    def __init__(self, latencies: List[float], errors: int, elapsed: float):
+        latencies = sorted(latencies)
+        self.count = len(latencies)
+        self.errors = errors
+        self.elapsed = elapsed
+        self.throughput = self.count / elapsed if elapsed else 0.0
+        self.percentiles = {
+            name: percentile(latencies, value)
+            for name, value in (('p50', 50), ('p90', 90), ('p99', 99),
+                                ('max', 100))
+        }
+
+    def as_dict(self) -> dict:
+        ''' Returns report as a dict. '''
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+            **self.percentiles,
+        }
+
+    def __str__(self) -> str:
+        latencies = ', '.join(f'{name}: {value * 1000:.3f} ms'
+                              for name, value in self.percentiles.items())
+        return (f'{self.count} webhooks ({self.errors} failed) in '
+                f'{self.elapsed:.3f} s, {self.throughput:,.0f}/s, {latencies}')
+
+
+def percentile(sorted_values: List[float], value: float) -> float:
+    ''' Returns nearest-rank percentile of sorted values, 0.0 if there are none. '''
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * value // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class WebhookReplayer:
+    ''' Replays recorded webhooks to an HTTP endpoint or a callable at their
+        original timing, a scaled rate or the maximum speed.
+
+        Example:
+            replayer = WebhookReplayer('webhooks.ndjson.gz', speed=10)
+            print(replayer.replay('http://127.0.0.1:8000/'))
+            fast = WebhookReplayer('webhooks.ndjson.gz', speed=None)
+            print(fast.replay(functools.partial(parse_webhook, version='3.7')))
+    '''
+    def __init__(self,
+                 path: Union[str, os.PathLike],
+                 speed: Optional[float] = 1.0,
+                 concurrency: int = 32):
+        ''' Args:
+                path (str): Path of the recording written by `WebhookRecorder`.
+                speed (float): Replay rate relative to the original timing
+                               (e.g. 2.0 replays twice as fast); `None` replays
+                               as fast as possible.
+                concurrency (int): Maximum number of webhooks being delivered
+                                   at the same time.
+        '''
+        self.path = path
+        self.speed = speed
+        self.concurrency = concurrency
+
+    def replay(self, target: Union[str, Callable]) -> ReplayReport:
+        ''' Replays the recording, see `areplay`. Must not be called from
+            a running event loop. '''
+        return asyncio.run(self.areplay(target))
+
+    async def areplay(self, target: Union[str, Callable]) -> ReplayReport:
+        ''' Replays the recording.
+
+            Args:
+                target (str or Callable): URL webhooks are POSTed to (non-2xx
+                        responses count as failures), or a function or coroutine
+                        function called with webhook bodies, e.g. `parse_webhook`
+                        or `AsyncWebhookDispatcher.dispatch` (exceptions count
+                        as failures).
+
+            Returns:
+                ReplayReport: Throughput and latencies of deliveries.
+        '''
+        client = None
+        send = target
+        if isinstance(target, str):
+            import httpx  # pylint: disable=import-outside-toplevel
+            client = httpx.AsyncClient(limits=httpx.Limits(
+                max_connections=self.concurrency))
+
+            async def post_webhook(wh_body):
+                response = await client.post(target, json=wh_body)
+                response.raise_for_status()
+
+            send = post_webhook
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        latencies: List[float] = []
+        errors = 0
+        pending = set()
+
+        async def deliver(wh_body):
+            nonlocal errors
+            started = time.perf_counter()
+            try:
+                result = send(wh_body)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:  # pylint: disable=broad-except
+                errors += 1
+            finally:
+                latencies.append(time.perf_counter() - started)
+                semaphore.release()
+
+        started = time.perf_counter()
+        first_at = None
+        try:
+            for received_at, wh_body in read_recording(self.path):
+                if self.speed:
+                    first_at = received_at if first_at is None else first_at
+                    delay = started + (received_at -
+                                       first_at) / self.speed - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                await semaphore.acquire()
+                task = asyncio.ensure_future(deliver(wh_body))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            await asyncio.gather(*pending)
+        finally:
+            if client is not None:
+                await client.aclose()
+        return ReplayReport(latencies, errors, time.perf_counter() - started)
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 # pylint: disable=missing-class-docstring
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookV35:
     webhook_id: str
     secret_key: str
@@ -22,13 +22,13 @@ class WebhookV35:
 # Chats
 
 
-@dataclass
+@dataclass(slots=True)
 class IncomingChat:
     chat: dict
     transferred_from: dict = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatDeactivated:
     chat_id: str
     thread_id: str
@@ -38,13 +38,13 @@ class ChatDeactivated:
 # Chat access
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatAccessUpdated:
     id: str
     access: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatTransferred:
     chat_id: str
     reason: str
@@ -57,7 +57,7 @@ class ChatTransferred:
 # Chat users
 
 
-@dataclass
+@dataclass(slots=True)
 class UserAddedToChat:
     chat_id: str
     reason: str
@@ -67,7 +67,7 @@ class UserAddedToChat:
     user: dict = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserRemovedFromChat:
     chat_id: str
     user_id: str
@@ -80,21 +80,21 @@ class UserRemovedFromChat:
 # Events
 
 
-@dataclass
+@dataclass(slots=True)
 class IncomingEvent:
     chat_id: str
     thread_id: str
     event: dict = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EventUpdated:
     chat_id: str
     thread_id: str
     event: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class IncomingRichMessagePostback:
     user_id: str
     chat_id: str
@@ -106,33 +106,33 @@ class IncomingRichMessagePostback:
 # Properties
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatPropertiesUpdated:
     chat_id: str
     properties: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatPropertiesDeleted:
     chat_id: str
     properties: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreadPropertiesUpdated:
     chat_id: str
     thread_id: str
     properties: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreadPropertiesDeleted:
     chat_id: str
     thread_id: str
     properties: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class EventPropertiesUpdated:
     chat_id: str
     thread_id: str
@@ -140,7 +140,7 @@ class EventPropertiesUpdated:
     properties: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class EventPropertiesDeleted:
     chat_id: str
     thread_id: str
@@ -151,14 +151,14 @@ class EventPropertiesDeleted:
 # Thread tags
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreadTagged:
     chat_id: str
     thread_id: str
     tag: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreadUntagged:
     chat_id: str
     thread_id: str
@@ -168,7 +168,7 @@ class ThreadUntagged:
 # Status
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingStatusSet:
     agent_id: str
     status: str
@@ -177,12 +177,12 @@ class RoutingStatusSet:
 # Customers
 
 
-@dataclass
+@dataclass(slots=True)
 class IncomingCustomer:
     customer: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerSessionFieldsUpdated:
     id: str
     session_fields: list
@@ -192,7 +192,7 @@ class CustomerSessionFieldsUpdated:
 # Configuration
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCreated:
     id: str
     name: str
@@ -208,12 +208,12 @@ class AgentCreated:
     work_scheduler: dict = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentApproved:
     id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentUpdated:
     id: str
     name: str = None
@@ -228,22 +228,22 @@ class AgentUpdated:
     work_scheduler: dict = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSuspended:
     id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentUnsuspended:
     id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentDeleted:
     id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoAccessAdded:
     id: str
     description: str
@@ -252,7 +252,7 @@ class AutoAccessAdded:
     next_id: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoAccessUpdated:
     id: str
     description: str = None
@@ -261,12 +261,12 @@ class AutoAccessUpdated:
     next_id: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoAccessDeleted:
     id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BotCreated:
     id: str
     name: str
@@ -280,7 +280,7 @@ class BotCreated:
     job_title: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BotUpdated:
     id: str
     name: str = None
@@ -293,12 +293,12 @@ class BotUpdated:
     job_title: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BotDeleted:
     id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupCreated:
     id: int
     name: str
@@ -306,12 +306,12 @@ class GroupCreated:
     agent_priorities: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupDeleted:
     id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupUpdated:
     id: int
     name: str = None
@@ -319,7 +319,7 @@ class GroupUpdated:
     agent_priorities: dict = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TagCreated:
     name: str
     author_id: str
@@ -327,12 +327,12 @@ class TagCreated:
     group_ids: list
 
 
-@dataclass
+@dataclass(slots=True)
 class TagDeleted:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TagUpdated:
     name: str
     group_ids: list
@@ -343,7 +343,7 @@ class TagUpdated:
 # Other
 
 
-@dataclass
+@dataclass(slots=True)
 class EventsMarkedAsSeen:
     user_id: str
     chat_id: str